@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sonuç tablosu parse benchmark'ı
+Sentetik bir sonuç sayfası üzerinde "soup" (tüm sayfa) ve "stream" (satır satır)
+parse modlarının süre ve tepe bellek (RSS) kullanımını karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_parse_results.py --rows 50000
+"""
+
+import os
+import sys
+import time
+import argparse
+import resource
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROW_TEMPLATE = (
+    '<tr><td>28/4</td><td>2/{n}</td><td>10/08/2026</td>'
+    '<td><a href="/Yasama/KanunTeklifi/{n}">Metni</a> Rize  Milletvekili Harun MERTOĞLU ve 120 Milletvekili'
+    ' Örnek Kanun Teklifi {n} Son Durumu : KOMİSYONDA</td></tr>'
+)
+HEADER = '<tr><th>Dönem</th><th>Esas No</th><th>Tarih</th><th>Özet</th></tr>'
+
+
+def iter_row_batches(rows: int, batch_size: int):
+    """Tarayıcıdan batch'ler halinde gelen satır HTML'ini taklit eder"""
+    yield '<table>' + HEADER
+    for start in range(0, rows, batch_size):
+        yield ''.join(ROW_TEMPLATE.format(n=n) for n in range(start, min(start + batch_size, rows)))
+    yield '</table>'
+
+
+def build_page(rows: int) -> str:
+    """driver.page_source'un döndüreceği tam sayfayı oluşturur"""
+    body = ''.join(iter_row_batches(rows, rows))
+    return f'<html><body><div id="sonuclar">{body}</div></body></html>'
+
+
+def run_mode(mode: str, rows: int, batch_size: int):
+    """Tek bir modu çalıştırır ve (kayıt, süre, tepe RSS) yazdırır"""
+    import kanun_teklifleri_scraper as kts
+    from bs4 import BeautifulSoup
+
+    start = time.perf_counter()
+    if mode == 'soup':
+        soup = BeautifulSoup(build_page(rows), 'lxml')
+        table = soup.select_one('#sonuclar table')
+        count = sum(1 for _ in kts.iter_parsed_rows(kts.soup_row_cells(r) for r in kts.soup_table_rows(table)))
+    else:
+        count = sum(1 for _ in kts.iter_parsed_rows(kts.iter_table_rows(iter_row_batches(rows, batch_size))))
+    elapsed = time.perf_counter() - start
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{mode}\t{count}\t{elapsed:.2f}\t{peak_kb / 1024:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--mode', choices=['soup', 'stream'])
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.rows, args.batch_size)
+        return
+
+    # Her mod ayrı bir süreçte çalışır, böylece tepe RSS değerleri karışmaz
+    print(f"📊 {args.rows} satırlık sentetik sayfa")
+    print("mod\tkayıt\tsüre(s)\ttepe RSS(MB)")
+    for mode in ('soup', 'stream'):
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--mode', mode,
+             '--rows', str(args.rows), '--batch-size', str(args.batch_size)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
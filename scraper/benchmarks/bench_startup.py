@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Başlangıç süresi benchmark'ı
+cli.py alt komutlarının ve scraper modüllerinin soğuk başlangıç süresini
+(yeni bir Python süreci açılıp komut bitene kadar) ve import maliyetini
+ölçer. Referans olarak selenium ve bs4'ün tek başına import süresi de
+gösterilir; hızlı komutların bunları hiç yüklememesi beklenir.
+
+Kullanım:
+    python benchmarks/bench_startup.py --runs 10
+    python benchmarks/bench_startup.py --importtime "import kanun_teklifleri_scraper"
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+SCRAPER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRAPER_DIR)
+
+from bench_parse_results import build_page  # noqa: E402
+
+# Hızlı komutlarda yüklenmemesi gereken modüller
+HEAVY_MODULES = ('selenium', 'bs4', 'lxml', 'requests')
+TOP_N = 10
+
+
+def commands(page_file: str, rows: int):
+    """(ad, argv) listesi; argv python yorumlayıcısından sonraki argümanlardır"""
+    cli = os.path.join(SCRAPER_DIR, 'cli.py')
+    return [
+        ('python (boş)', ['-c', 'pass']),
+        ('cli.py --help', [cli, '--help']),
+        ('cli.py export --help', [cli, 'export', '--help']),
+        (f'cli.py reparse ({rows} satır)', [cli, 'reparse', page_file]),
+        ('import kanun_teklifleri_scraper', ['-c', 'import kanun_teklifleri_scraper']),
+        ('import tbmm_scraper', ['-c', 'import tbmm_scraper']),
+        ('import selenium.webdriver', ['-c', 'import selenium.webdriver']),
+        ('import bs4', ['-c', 'import bs4']),
+    ]
+
+
+def time_command(argv, runs: int) -> float:
+    """Komutu runs kez yeni süreçte çalıştırır, medyan süreyi (saniye) döndürür"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, cwd=SCRAPER_DIR, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def import_times(argv):
+    """Komutu python -X importtime ile çalıştırır: [(kümülatif µs, modül)]"""
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + argv, cwd=SCRAPER_DIR,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), name.strip()))
+    return rows
+
+
+def heavy_imports(argv) -> str:
+    """Komut çalışırken yüklenen ağır modüller"""
+    loaded = {name for _, name in import_times(argv)}
+    return ','.join(m for m in HEAVY_MODULES if m in loaded)
+
+
+def print_importtime(code: str, top_n: int = TOP_N):
+    """Kümülatif süreye göre en pahalı importları yazdırır"""
+    print(f"⏱️ {code}: en pahalı {top_n} import (kümülatif ms)")
+    for cumulative_us, name in sorted(import_times(['-c', code]), reverse=True)[:top_n]:
+        print(f"{cumulative_us / 1000:.1f}\t{name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--rows', type=int, default=200, help='reparse için sentetik sayfa satır sayısı')
+    parser.add_argument('--importtime', metavar='KOD', help='Sadece bu kodun import dökümünü göster')
+    args = parser.parse_args()
+
+    if args.importtime:
+        print_importtime(args.importtime)
+        return
+
+    with tempfile.NamedTemporaryFile('w', suffix='.html', encoding='utf-8', delete=False) as f:
+        f.write(build_page(args.rows))
+    try:
+        print(f"📊 Soğuk başlangıç, {args.runs} çalıştırmanın medyanı")
+        print("komut\tsüre(ms)\tağır modüller")
+        for name, argv in commands(f.name, args.rows):
+            elapsed = time_command(argv, args.runs)
+            print(f"{name}\t{elapsed * 1000:.0f}\t{heavy_imports(argv) or '-'}")
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Metin Deposu
+Teklif metinleri gibi büyük metin alanlarını içerik hash'i ile anahtarlanmış,
+sıkıştırılmış olarak tek bir SQLite dosyasında tutar (küçük metinlerde blob
+başına ayrı dosya disk bloklarını boşa harcar). Aynı metin bir kez saklanır;
+kayıtlarda sadece referans (hash) tutulur ve metin erişildiğinde açılır.
+
+zstandard (requirements.txt) kuruluysa TBMM metinleri üzerinde eğitilmiş bir
+sözlükle zstd, değilse aynı metinlerden hazırlanmış ön sözlükle zlib
+kullanılır. Her blob hangi codec ve sözlükle yazıldığını kaydında taşır;
+sözlük yeniden eğitilse de eski blob'lar okunabilir. zstd ile yazılmış bir
+blob zstandard olmayan bir makinede açılmak istenirse CodecUnavailable
+hatası verilir.
+
+Kullanım:
+    python blob_store.py train --file data/proposals.json
+    python blob_store.py stats
+"""
+
+import os
+import zlib
+import sqlite3
+import hashlib
+import logging
+import argparse
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # Kurulu değilse yeni blob'lar zlib ile yazılır
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Sabitler
+DATA_DIR = "data"
+# Depo, hangi dizinden çalıştırılırsa çalıştırılsın scraper/data altındadır; kayıtlardaki
+# referanslar her zaman aynı depoyu gösterir
+BLOB_DB = os.getenv('BLOB_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), DATA_DIR, 'blobs.db'))
+# zlib penceresi 32 KB olduğu için ön sözlük de en fazla bu kadar olabilir
+DICT_SIZE = 32 * 1024
+COMPRESSION_LEVEL = 9
+NO_DICT = ''
+
+CODEC_ZLIB, CODEC_ZSTD = 'zlib', 'zstd'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    ref TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    dict_id TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dictionaries (
+    dict_id TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    created REAL NOT NULL DEFAULT (julianday('now'))
+);
+"""
+
+
+class CodecUnavailable(RuntimeError):
+    """Blob'un yazıldığı codec bu makinede yok"""
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def train_dictionary(samples: Iterable[str], size: int = DICT_SIZE) -> bytes:
+    """
+    Örnek metinlerden sıkıştırma sözlüğü hazırlar
+
+    zstandard varsa onun eğitimi kullanılır; yoksa birden fazla metinde geçen
+    satırlar (başlıklar, kalıp ifadeler) sıklığa göre seçilir, en sık olanlar
+    zlib'in en yakın referans aldığı sona yazılır.
+    """
+    samples = [s.encode('utf-8') for s in samples if s]
+    if not samples:
+        return b''
+    if zstandard is not None and len(samples) >= 8:
+        try:
+            return zstandard.train_dictionary(size, samples).as_bytes()
+        except zstandard.ZstdError as e:
+            logger.warning(f"⚠️ zstd sözlüğü eğitilemedi, satır sözlüğü kullanılıyor: {e}")
+
+    counts = Counter()
+    for sample in samples:
+        counts.update(set(line.strip() for line in sample.split(b'\n') if len(line.strip()) > 8))
+    chosen, total = [], 0
+    for line, count in counts.most_common():
+        if count < 2 or total + len(line) + 1 > size:
+            break
+        chosen.append(line)
+        total += len(line) + 1
+    return b'\n'.join(reversed(chosen))
+
+
+class BlobStore:
+    """İçerik hash'i ile anahtarlanmış, sıkıştırılmış metin deposu"""
+
+    def __init__(self, path: str = BLOB_DB):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript(SCHEMA)
+        self._dicts: Dict[str, bytes] = {NO_DICT: b''}
+        self.stats = {'put': 0, 'dedup': 0, 'get': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+        # En son eğitilen sözlük yeni blob'lar için kullanılır
+        row = self.conn.execute('SELECT dict_id FROM dictionaries ORDER BY created DESC LIMIT 1').fetchone()
+        self.dict_id = row[0] if row else NO_DICT
+
+    def _dictionary(self, dict_id: str) -> bytes:
+        if dict_id not in self._dicts:
+            row = self.conn.execute('SELECT data FROM dictionaries WHERE dict_id = ?', (dict_id,)).fetchone()
+            if row is None:
+                raise KeyError(f'Sözlük bulunamadı: {dict_id}')
+            self._dicts[dict_id] = row[0]
+        return self._dicts[dict_id]
+
+    def set_dictionary(self, dictionary: bytes):
+        """Yeni blob'lar için sözlüğü kaydeder ve varsayılan yapar"""
+        if not dictionary:
+            return
+        dict_id = hashlib.sha1(dictionary).hexdigest()[:12]
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO dictionaries (dict_id, data) VALUES (?, ?)',
+                              (dict_id, dictionary))
+        self._dicts[dict_id] = dictionary
+        self.dict_id = dict_id
+
+    def _compress(self, data: bytes) -> Tuple[str, bytes]:
+        dictionary = self._dictionary(self.dict_id)
+        if zstandard is not None:
+            params = {'dict_data': zstandard.ZstdCompressionDict(dictionary)} if dictionary else {}
+            return CODEC_ZSTD, zstandard.ZstdCompressor(level=COMPRESSION_LEVEL, **params).compress(data)
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=dictionary) if dictionary \
+            else zlib.compressobj(COMPRESSION_LEVEL)
+        return CODEC_ZLIB, compressor.compress(data) + compressor.flush()
+
+    def _decompress(self, codec: str, dict_id: str, payload: bytes) -> bytes:
+        if codec not in (CODEC_ZLIB, CODEC_ZSTD):
+            raise CodecUnavailable(f'Bilinmeyen codec: {codec}')
+        if codec == CODEC_ZSTD and zstandard is None:
+            raise CodecUnavailable('Blob zstd ile yazılmış; okumak için zstandard paketini kurun '
+                                   '(pip install -r requirements.txt)')
+        dictionary = self._dictionary(dict_id)
+        if codec == CODEC_ZSTD:
+            params = {'dict_data': zstandard.ZstdCompressionDict(dictionary)} if dictionary else {}
+            return zstandard.ZstdDecompressor(**params).decompress(payload)
+        decompressor = zlib.decompressobj(zdict=dictionary) if dictionary else zlib.decompressobj()
+        return decompressor.decompress(payload) + decompressor.flush()
+
+    def put(self, text: str) -> str:
+        """Metni saklar (zaten varsa tekrar yazmaz) ve referansını döndürür"""
+        ref = content_hash(text)
+        self.stats['put'] += 1
+        if ref in self:
+            self.stats['dedup'] += 1
+            return ref
+
+        data = text.encode('utf-8')
+        codec, payload = self._compress(data)
+        with self.conn:
+            self.conn.execute('INSERT OR IGNORE INTO blobs (ref, codec, dict_id, size, data) VALUES (?, ?, ?, ?, ?)',
+                              (ref, codec, self.dict_id, len(data), payload))
+        self.stats['raw_bytes'] += len(data)
+        self.stats['stored_bytes'] += len(payload)
+        return ref
+
+    def get(self, ref: str) -> str:
+        """Referanstaki metni açar"""
+        self.stats['get'] += 1
+        row = self.conn.execute('SELECT codec, dict_id, data FROM blobs WHERE ref = ?', (ref,)).fetchone()
+        if row is None:
+            raise KeyError(f'Metin bulunamadı: {ref}')
+        return self._decompress(*row).decode('utf-8')
+
+    def __contains__(self, ref: str) -> bool:
+        return self.conn.execute('SELECT 1 FROM blobs WHERE ref = ?', (ref,)).fetchone() is not None
+
+    def totals(self) -> Dict[str, int]:
+        """Toplam blob sayısı, açılmış ve sıkıştırılmış boyut"""
+        count, raw, stored = self.conn.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM blobs'
+        ).fetchone()
+        return {'blobs': count, 'raw_bytes': raw, 'stored_bytes': stored}
+
+    def log_stats(self):
+        """Depo istatistiklerini çalıştırma raporuna yazar"""
+        if not self.stats['put']:
+            return
+        ratio = self.stats['raw_bytes'] / self.stats['stored_bytes'] if self.stats['stored_bytes'] else 0
+        logger.info(f"  • Metin deposu: {self.stats['put']} metin, {self.stats['dedup']} tekrar, "
+                    f"yeni yazılanlar {ratio:.1f}x sıkıştırıldı")
+
+
+_store: Optional[BlobStore] = None
+
+
+def default_store() -> BlobStore:
+    """BLOB_DB'deki depoyu ilk kullanımda açar"""
+    global _store
+    if _store is None:
+        _store = BlobStore()
+    return _store
+
+
+def _iter_texts(filename: str, fields: List[str]) -> Iterable[str]:
+    from records import iter_records
+    for record in iter_records(filename, None):
+        for field in fields:
+            if record.get(field):
+                yield record[field]
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=['train', 'stats'])
+    parser.add_argument('--file', action='append', help='train: örnek kayıtlar (proposals.json, sorgu json)')
+    parser.add_argument('--field', action='append', help='train: metin alanları (varsayılan: metin, durum)')
+    parser.add_argument('--db', default=BLOB_DB)
+    args = parser.parse_args()
+
+    store = BlobStore(args.db)
+    if args.command == 'train':
+        fields = args.field or ['metin', 'durum']
+        samples = [text for filename in args.file or [f"{DATA_DIR}/proposals.json"]
+                   for text in _iter_texts(filename, fields)]
+        dictionary = train_dictionary(samples)
+        store.set_dictionary(dictionary)
+        logger.info(f"📚 Sözlük hazır: {len(samples)} örnek, {len(dictionary)} byte "
+                    f"({'zstd' if zstandard else 'zlib'}, id {store.dict_id})")
+    else:
+        totals = store.totals()
+        ratio = totals['raw_bytes'] / totals['stored_bytes'] if totals['stored_bytes'] else 0
+        logger.info(f"📦 {args.db}: {totals['blobs']} blob, {totals['raw_bytes']} -> {totals['stored_bytes']} byte "
+                    f"({ratio:.1f}x), sözlük {store.dict_id or 'yok'}")
+
+
+if __name__ == "__main__":
+    main()
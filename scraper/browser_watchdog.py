@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Tarayıcı Sağlık Kontrolü
+Uzun çalıştırmalarda tek global WebDriver'ı izler: kaç sayfa sunduğunu,
+Chrome süreçlerinin toplam RSS'ini ve küçük bir ping script'ine ne kadar
+sürede yanıt verdiğini takip eder. Eşikler aşıldığında veya oturum
+düştüğünde driver'ı close_driver/init_driver ile yeniler ve son alınan
+cookie'leri geri yükler.
+
+Kontroller sayfa başına WebDriver round-trip'i eklememek için seyrek yapılır:
+cookie'ler RSS ölçümüyle birlikte ve sayfa sınırındaki yenilemeden hemen önce
+alınır, ping sadece bir hatadan sonra veya PING_INTERVAL aralıkla atılır.
+"""
+
+import os
+import time
+import logging
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Sabitler
+PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', '90'))  # driver.get için üst sınır (saniye)
+SCRIPT_TIMEOUT = int(os.getenv('SCRIPT_TIMEOUT', '30'))
+MAX_PAGES_PER_DRIVER = int(os.getenv('MAX_PAGES_PER_DRIVER', '200'))
+MAX_BROWSER_RSS_MB = int(os.getenv('MAX_BROWSER_RSS_MB', '1500'))
+MAX_PING_SECONDS = float(os.getenv('MAX_PING_SECONDS', '5'))
+MAX_CONSECUTIVE_FAILURES = 2
+# RSS ölçümü /proc taradığı için her sayfada değil bu aralıkla yapılır
+RSS_CHECK_EVERY = 10
+# Hata yoksa ping en fazla bu aralıkla (saniye) atılır
+PING_INTERVAL = float(os.getenv('PING_INTERVAL_SECONDS', '60'))
+
+PING_JS = "return document.readyState;"
+# Bu hatalar oturumun kullanılamaz olduğunu gösterir; tekrar denemek yerine driver yenilenir
+DEAD_SESSION_MESSAGES = ('invalid session id', 'session deleted', 'disconnected', 'no such window',
+                         'chrome not reachable', 'connection refused', 'max retries exceeded')
+
+
+def _children_map() -> Dict[int, List[int]]:
+    """/proc üzerinden ppid -> çocuk pid'ler"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                # comm parantez içinde boşluk içerebilir; ppid son ')' sonrasındaki 2. alandır
+                ppid = int(f.read().rsplit(b')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def process_tree_rss_mb(pid: int) -> Optional[float]:
+    """
+    Sürecin ve tüm alt süreçlerinin toplam RSS'i (MB)
+
+    Chrome süreçleri belleğin bir kısmını paylaştığı için değer üst sınırdır.
+    /proc olmayan platformlarda None döner.
+    """
+    if not os.path.isdir('/proc'):
+        return None
+    children = _children_map()
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f'/proc/{current}/statm', 'rb') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+        stack.extend(children.get(current, ()))
+    return total / (1024 * 1024)
+
+
+def configure_timeouts(driver):
+    """Sayfa yükleme ve script'ler için kesin üst sınırları ayarlar"""
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    driver.set_script_timeout(SCRIPT_TIMEOUT)
+
+
+class BrowserWatchdog:
+    """Global driver'ı izler, gerektiğinde yeniler"""
+
+    def __init__(self, init_driver: Callable, close_driver: Callable, base_url: str):
+        self._init_driver = init_driver
+        self._close_driver = close_driver
+        self.base_url = base_url
+        self.pages = 0
+        self._last_rss_check = 0
+        self._last_ping = time.monotonic()
+        self.failures = 0
+        self.unhealthy: Optional[str] = None
+        self.cookies: List[Dict] = []
+        self.recycles: Counter = Counter()
+        self.max_rss_mb = 0.0
+
+    def ensure(self):
+        """Sağlıklı bir driver döndürür; eşikler aşıldıysa önce yeniler"""
+        driver = self._init_driver()
+        reason = self.unhealthy or self._check(driver)
+        if reason:
+            driver = self.recycle(reason)
+        return driver
+
+    def _check(self, driver) -> Optional[str]:
+        if self.pages >= MAX_PAGES_PER_DRIVER:
+            # Oturum sağlam; yeni oturuma en güncel cookie'ler taşınır
+            self._save_cookies(driver)
+            return f'sayfa sınırı ({self.pages})'
+
+        # Sayfalı sorgular ensure() çağrıları arasında birden çok sayfa sayar; bu yüzden
+        # tam katlara değil son ölçümden bu yana geçen sayfa sayısına bakılır
+        if self.pages - self._last_rss_check >= RSS_CHECK_EVERY:
+            self._last_rss_check = self.pages
+            self._save_cookies(driver)
+            rss = self.browser_rss_mb(driver)
+            if rss is not None:
+                self.max_rss_mb = max(self.max_rss_mb, rss)
+                if rss > MAX_BROWSER_RSS_MB:
+                    return f'bellek {rss:.0f} MB'
+
+        if not self.failures and time.monotonic() - self._last_ping < PING_INTERVAL:
+            return None
+        start = time.perf_counter()
+        try:
+            driver.execute_script(PING_JS)
+        except Exception as e:
+            return f'ping yanıtsız ({type(e).__name__})'
+        self._last_ping = time.monotonic()
+        elapsed = time.perf_counter() - start
+        if elapsed > MAX_PING_SECONDS:
+            return f'ping {elapsed:.1f}s'
+        return None
+
+    def _save_cookies(self, driver):
+        """Yenilemede geri yüklenecek cookie'leri alır"""
+        try:
+            self.cookies = driver.get_cookies()
+        except Exception:
+            pass
+
+    @staticmethod
+    def browser_rss_mb(driver) -> Optional[float]:
+        """chromedriver ve altındaki Chrome süreçlerinin toplam RSS'i"""
+        try:
+            return process_tree_rss_mb(driver.service.process.pid)
+        except AttributeError:
+            return None
+
+    def recycle(self, reason: str):
+        """Driver'ı kapatıp yeniden başlatır ve cookie'leri geri yükler"""
+        logger.warning(f"♻️ Tarayıcı yenileniyor: {reason} ({self.pages} sayfa sonra)")
+        self.recycles[reason.split(' (')[0]] += 1
+        self._close_driver()
+        driver = self._init_driver()
+        self.pages = 0
+        self._last_rss_check = 0
+        self._last_ping = time.monotonic()
+        self.failures = 0
+        self.unhealthy = None
+
+        if self.cookies:
+            # Cookie eklemek için önce aynı domain'de olmak gerekir
+            try:
+                driver.get(self.base_url)
+                for cookie in self.cookies:
+                    try:
+                        driver.add_cookie(cookie)
+                    except Exception:
+                        pass
+                logger.info(f"🍪 {len(self.cookies)} cookie geri yüklendi")
+            except Exception as e:
+                logger.warning(f"⚠️ Cookie'ler geri yüklenemedi: {e}")
+        return driver
+
+    def page_served(self):
+        """Başarılı bir sayfadan sonra çağrılır: sayaç güncellenir, hata sayacı sıfırlanır"""
+        self.pages += 1
+        self.failures = 0
+
+    def failure(self, error: Exception):
+        """Başarısız bir sayfadan sonra çağrılır: oturum düştüyse sonraki ensure() driver'ı yeniler"""
+        self.failures += 1
+        message = str(error).lower()
+        if any(m in message for m in DEAD_SESSION_MESSAGES):
+            self.unhealthy = 'oturum düştü'
+        elif self.failures >= MAX_CONSECUTIVE_FAILURES:
+            self.unhealthy = f'ardışık hata ({self.failures})'
+
+    def log_stats(self):
+        """Watchdog istatistiklerini çalıştırma raporuna yazar"""
+        total = sum(self.recycles.values())
+        if not total and not self.max_rss_mb:
+            return
+        reasons = ', '.join(f"{reason}: {count}" for reason, count in self.recycles.items())
+        logger.info(f"  • Tarayıcı: {total} yenileme{f' ({reasons})' if reasons else ''}, "
+                    f"en yüksek RSS {self.max_rss_mb:.0f} MB")
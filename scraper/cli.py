@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Scraper Komut Satırı
+Scraper'lar için tek giriş noktası. Her alt komut sadece ihtiyaç duyduğu
+modülleri import eder; selenium, bs4 ve lxml tarayıcı veya HTML parse
+gerektiren adımlara kadar yüklenmez, --help ve export gibi işler Chrome
+kurulu olmayan ortamlarda da hızlı başlar.
+
+--no-browser (veya NO_BROWSER=true) ile sayfalar tarayıcı yerine düz HTTP
+ile çekilir: detay sayfaları ve PDF'ler requests ile, sorgu sonuçları
+CAPTURE_NETWORK ile kaydedilmiş endpoint'ten alınır. Bot koruması aktifse
+HTTP ile çekilemeyen sayfalar atlanır.
+
+Kullanım:
+    python cli.py list --max 5
+    python cli.py sorgu --durum KANUNLAŞTI --max 50
+    python cli.py sorgu --no-browser
+    python cli.py detail --no-browser https://www.tbmm.gov.tr/Yasama/KanunTeklifi/...
+    python cli.py export --append --mv-file data/mvlist.28.json
+    python cli.py reparse debug_page.html --output data/reparse.json
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+import profiler
+
+logger = logging.getLogger(__name__)
+
+# Sabitler
+DATA_DIR = "data"
+
+
+def _use_browser(args) -> bool:
+    """
+    --no-browser bayrağını NO_BROWSER ortam değişkenine yazar
+
+    Scraper modülleri NO_BROWSER'ı import sırasında okuduğu için bu, onları import etmeden önce çağrılır.
+    """
+    if args.no_browser:
+        os.environ['NO_BROWSER'] = 'true'
+    return os.getenv('NO_BROWSER', 'false').lower() != 'true'
+
+
+def _print_json(data):
+    json.dump(data, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write('\n')
+
+
+def cmd_list(args):
+    """Liste sayfasını ve ilk --max teklifin detayını çeker (tbmm_scraper)"""
+    _use_browser(args)
+    import tbmm_scraper as ts
+    ts.main(max_proposals=args.max)
+
+
+def cmd_sorgu(args):
+    """Sorgu formunu çalıştırır; tarayıcısız modda kayıtlı endpoint'i tekrar oynatır"""
+    use_browser = _use_browser(args)
+    import kanun_teklifleri_scraper as kts
+
+    kts.create_data_directory()
+    if not use_browser:
+        # Endpoint sadece aynı filtrelerle yakalandıysa ve sonuçları filtrelere uyuyorsa kullanılır
+        results = kts.replay_saved_endpoint(max_results=args.max,
+                                            filters=kts.query_filters(args.kelime, args.donem, args.durum))
+        if results is None:
+            logger.error("❌ Bu filtreler için kayıtlı endpoint yok veya doğrulanamadı; önce CAPTURE_NETWORK=true "
+                         "ile aynı filtrelerle tarayıcılı bir sorgu çalıştırın")
+            return 1
+    else:
+        try:
+            results = kts.run_query(arama_kelime=args.kelime, donem=args.donem, durum=args.durum,
+                                    max_results=args.max)
+        finally:
+            kts.close_driver()
+
+    kts.save_to_json(results, args.output)
+    logger.info(f"✅ Sorgu tamamlandı! Toplam: {len(results)} kayıt")
+    return 0
+
+
+def cmd_detail(args):
+    """Verilen teklif linklerinin detayını (veya PDF'ini) çeker ve JSON olarak yazdırır"""
+    _use_browser(args)
+    from work_queue import handle_unit
+
+    results, failed = [], 0
+    try:
+        for url in args.urls:
+            try:
+                if url.lower().endswith('.pdf'):
+                    # PDF'ler CDN'den doğrudan indirilir, tarayıcı gerekmez
+                    units, _ = handle_unit('pdf', {'url': url})
+                else:
+                    units, _ = handle_unit('detay', {'baslik': url, 'link': url})
+                results.extend(data for _, _, data in units)
+            except Exception as e:
+                logger.error(f"❌ {url}: {e}")
+                failed += 1
+    finally:
+        if 'tbmm_scraper' in sys.modules:
+            sys.modules['tbmm_scraper'].close_driver()
+
+    _print_json(results)
+    return 1 if failed else 0
+
+
+def cmd_export(args, rest):
+    """graph_export.py'yi verilen seçeneklerle çalıştırır"""
+    import graph_export
+    graph_export.main(rest)
+    return 0
+
+
+def cmd_reparse(args):
+    """Kaydedilmiş HTML sayfalarını tarayıcı açmadan tekrar parse eder"""
+    from records import Proposal, dump_records
+
+    records = []
+    for filename in args.files:
+        with open(filename, 'r', encoding='utf-8') as f:
+            html = f.read()
+
+        if args.page == 'sorgu':
+            import kanun_teklifleri_scraper as kts
+            parsed = kts.parse_results_html(html)
+            if parsed is None:
+                logger.warning(f"⚠️ {filename}: sonuç tablosu bulunamadı")
+                continue
+        else:
+            import tbmm_scraper as ts
+            if args.page == 'liste':
+                parsed = ts.parse_proposal_list(html)
+            else:
+                parsed = [ts.parse_proposal_detail(Proposal(link=args.link or ''), html)]
+        logger.info(f"📄 {filename}: {len(parsed)} kayıt")
+        records.extend(parsed)
+
+    if args.output:
+        count = dump_records(records, args.output)
+        logger.info(f"💾 Veriler kaydedildi: {args.output} ({count} kayıt)")
+    else:
+        _print_json([r.to_dict() for r in records])
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profile', action='store_true',
+                        help=f'Örnekleyici profiler ile çalıştır, çıktılar {profiler.PROFILE_DIR}/ altına yazılır')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    # Sayfa çeken komutların ortak seçeneği
+    fetching = argparse.ArgumentParser(add_help=False)
+    fetching.add_argument('--no-browser', action='store_true',
+                          help='Selenium yerine düz HTTP kullan (NO_BROWSER=true ile aynı)')
+
+    cmd = commands.add_parser('list', parents=[fetching], help='Teklif listesini ve detaylarını çek')
+    cmd.add_argument('--max', type=int, help='Detayı çekilecek teklif sayısı (varsayılan: MAX_PROPOSALS veya 20)')
+
+    cmd = commands.add_parser('sorgu', parents=[fetching], help='Kanun teklifleri sorgusunu çalıştır')
+    cmd.add_argument('--kelime', default='')
+    cmd.add_argument('--donem', default='Son Dönem')
+    cmd.add_argument('--durum', default='')
+    cmd.add_argument('--max', type=int, default=20)
+    cmd.add_argument('--output', default=f"{DATA_DIR}/kanun_teklifleri_sorgu.json")
+
+    cmd = commands.add_parser('detail', parents=[fetching], help='Teklif detay sayfalarını veya PDF\'leri çek')
+    cmd.add_argument('urls', nargs='+')
+
+    commands.add_parser('export', help='Graph Commons CSV export (seçenekler graph_export.py ile aynı)',
+                        add_help=False)
+
+    cmd = commands.add_parser('reparse', help='Kaydedilmiş HTML sayfalarını tekrar parse et')
+    cmd.add_argument('files', nargs='+')
+    cmd.add_argument('--page', choices=['sorgu', 'liste', 'detay'], default='sorgu', help='Sayfa türü')
+    cmd.add_argument('--link', help='detay: sayfanın linki')
+    cmd.add_argument('--output', help='JSON çıktı dosyası (varsayılan: stdout)')
+    return parser
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S', stream=sys.stderr)
+    args, rest = build_parser().parse_known_args(argv)
+    if rest and args.command != 'export':
+        build_parser().error(f"tanınmayan argümanlar: {' '.join(rest)}")
+
+    with profiler.profile(f'cli_{args.command}', enabled=args.profile):
+        if args.command == 'export':
+            return cmd_export(args, rest)
+        return {
+            'list': cmd_list,
+            'sorgu': cmd_sorgu,
+            'detail': cmd_detail,
+            'reparse': cmd_reparse,
+        }[args.command](args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
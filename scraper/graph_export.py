@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Graph Commons Export
+Scraper çıktısını (kanun_teklifleri_sorgu.json) Graph Commons'a import
+edilecek node ve ilişki CSV'lerine çevirir. Kolonlar kt-detay/kt-nodes.js,
+kt-detay/kt-rels.js ve meclis/meclis-nodes.js çıktılarıyla aynıdır.
+
+Kayıtlar JSON dosyasından tek tek okunur ve tek geçişte üç CSV'ye yazılır;
+aynı node bir kez yazılır. --append ile daha önce export edilmemiş esas
+no'lar mevcut CSV'lerin sonuna eklenir; daha önce export edilmiş bir
+teklifin satırı (ör. son durumu) değiştiyse kt-nodes.csv'deki satırı
+yerinde güncellenir. İmzacılar ve ilişkiler teklif ilk export edildiğinde
+yazılır, sonradan değişmez. --mv-file verilirse teklif
+sahipleri milletvekili listesinden sicil no'ya eşlenir ve node adları
+meclis-nodes.js ile aynı olur (ad + sicil no).
+
+Oluşturduğu ilişkiler:
+    (Kanun Teklifi)-[SUNULDUGU DONEM]->(Donem)
+    (MV)-[IMZALADI]->(Kanun Teklifi)
+    (MV)-[<donem>. DONEM TEMSIL ETTI]->(Sehir)
+
+Kullanım:
+    python graph_export.py --file data/kanun_teklifleri_sorgu.json --dest data/graph
+    python graph_export.py --append
+    python graph_export.py --mv-file data/mvlist.28.json
+"""
+
+import os
+import re
+import csv
+import json
+import hashlib
+import logging
+import argparse
+from typing import Dict, List, Tuple, Set, Optional
+
+from normalize import parse_proposers, PROPOSER_PATTERN, OTHER_SIGNERS_PATTERN
+from records import SorguRecord, iter_records
+from mp_index import MPIndex
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Sabitler
+DATA_DIR = "data"
+INPUT_FILE = f"{DATA_DIR}/kanun_teklifleri_sorgu.json"
+DEST_DIR = f"{DATA_DIR}/graph"
+STATE_FILE = "export_state.json"
+
+KT_NODE_HEADER = [
+    'Type', 'Name', 'Description', 'Image', 'Reference', 'tam metin adresi',
+    'donem ve yasama yili', 'esas no', 'baskanliga gelis tarihi', 'baslik',
+    'ozet', 'son durum', 'sira no',
+]
+MECLIS_NODE_HEADER = ['Type', 'Name', 'Description', 'Image', 'Reference', 'baslangic', 'bitis']
+REL_HEADER = [
+    'NODE TYPE', 'NODE NAME', 'EDGE TYPE', 'NODE TYPE', 'NODE NAME', 'Weight',
+    'tipi', 'islem', 'giris tarihi', 'cikis tarihi', 'karar tarihi', 'ilk imzaci',
+]
+
+NEWLINE_PATTERN = re.compile(r'\r\n|\r|\n')
+# Teklif başlığı "... Kanun Teklifi" ile biter, özet "Son Durumu" öncesinde biter
+TITLE_PATTERN = re.compile(r'(.*?Teklifi)(.*?)(?:Son\s+Durumu|$)', re.DOTALL)
+# kt-nodes.js'deki kt.id: eski sistemde kanunlar_sira_no parametresi, yenisinde /KanunTeklifi/<id>
+SIRA_NO_PATTERN = re.compile(r'kanunlar_sira_no=(\d+)|/KanunTeklifi/(\d+)', re.IGNORECASE)
+
+
+def split_durum(text: str) -> Tuple[str, str]:
+    """
+    Sorgu satırının metnini teklif başlığı ve özete ayırır
+
+    Örn: "Rize  Milletvekili Harun MERTOĞLU ve 120 MilletvekiliYabancı ... Kanun
+    TeklifiTeklif ile; ... amaçlanmaktadır.Son Durumu : KOMİSYONDA" ->
+    ("Yabancı ... Kanun Teklifi", "Teklif ile; ... amaçlanmaktadır.")
+    """
+    start = 0
+    for match in PROPOSER_PATTERN.finditer(text):
+        start = match.end()
+    others = OTHER_SIGNERS_PATTERN.search(text, start)
+    if others:
+        start = others.end()
+
+    match = TITLE_PATTERN.match(text, start)
+    if not match:
+        return '', ''
+    return match.group(1).strip(), match.group(2).strip()
+
+
+def teklif_name(esas_no: str, donem: str) -> str:
+    """kt-nodes.js ile aynı node adı"""
+    return f'Kanun Teklifi - {esas_no} - {donem}'
+
+
+def sira_no(link: str) -> str:
+    """Teklif linkindeki sıra no (kt-nodes.js'deki kt.id); CDN PDF linklerinde bulunmaz"""
+    match = SIRA_NO_PATTERN.search(link)
+    return (match.group(1) or match.group(2)) if match else ''
+
+
+def row_hash(row: List[str]) -> str:
+    """--append'de değişen teklif satırlarını bulmak için satır özeti"""
+    return hashlib.sha1('\x1f'.join(map(str, row)).encode('utf-8')).hexdigest()
+
+
+def mv_name(proposer: Dict[str, str]) -> str:
+    """meclis-nodes.js ile aynı node adı (ad + sicil no); sicil yoksa sadece ad"""
+    sicil = proposer.get('sicil')
+    return f"{proposer['ad']} {sicil}" if sicil else proposer['ad']
+
+
+class GraphExporter:
+    """Kayıtları tek geçişte node ve ilişki CSV'lerine yazar"""
+
+    def __init__(self, dest: str = DEST_DIR, append: bool = False, mp_index: Optional[MPIndex] = None):
+        self.dest = dest
+        self.mp_index = mp_index
+        self.state_file = os.path.join(dest, STATE_FILE)
+        # esas no -> kt-nodes satırının özeti (eski durum dosyalarında None)
+        self.seen_esas: Dict[str, Optional[str]] = {}
+        # --append'de içeriği değişen teklifler: node adı -> yeni kt-nodes satırı
+        self.updated: Dict[str, List[str]] = {}
+        self.seen_nodes: Set[Tuple[str, str]] = set()
+        # Dönem başına tek yazılan MV -> Sehir ilişkileri
+        self.seen_temsil: Set[Tuple[str, str]] = set()
+
+        os.makedirs(dest, exist_ok=True)
+        paths = {name: os.path.join(dest, f'{name}.csv') for name in ('kt-nodes', 'meclis-nodes', 'kt-rels')}
+        self.kt_nodes_path = paths['kt-nodes']
+        append = append and os.path.exists(self.state_file) and all(map(os.path.exists, paths.values()))
+        if append:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            esas = state['esas_no']
+            self.seen_esas = esas if isinstance(esas, dict) else dict.fromkeys(esas)
+            self.seen_nodes = {tuple(node) for node in state['nodes']}
+            self.seen_temsil = {tuple(rel) for rel in state['temsil']}
+
+        mode = 'a' if append else 'w'
+        self._files = {name: open(path, mode, encoding='utf-8', newline='') for name, path in paths.items()}
+        # csv-stringify ile aynı: sadece gerektiğinde tırnak, satır sonu \n
+        self.kt_nodes, self.meclis_nodes, self.rels = (
+            csv.writer(self._files[name], lineterminator='\n')
+            for name in ('kt-nodes', 'meclis-nodes', 'kt-rels')
+        )
+        if not append:
+            self.kt_nodes.writerow(KT_NODE_HEADER)
+            self.meclis_nodes.writerow(MECLIS_NODE_HEADER)
+            self.rels.writerow(REL_HEADER)
+
+        self.stats = {'teklif': 0, 'guncellenen': 0, 'atlanan': 0, 'node': 0, 'iliski': 0}
+
+    def _node(self, node_type: str, name: str):
+        """Milletvekili/Sehir/Donem node'unu daha önce yazılmadıysa yazar"""
+        key = (node_type, name)
+        if key in self.seen_nodes:
+            return
+        self.seen_nodes.add(key)
+        self.meclis_nodes.writerow([node_type, name, '', '', '', '', ''])
+        self.stats['node'] += 1
+
+    def _rel(self, from_type: str, from_name: str, edge: str, to_type: str, to_name: str,
+             ilk_imzaci: str = ''):
+        self.rels.writerow([from_type, from_name, edge, to_type, to_name, 1, '', '', '', '', '', ilk_imzaci])
+        self.stats['iliski'] += 1
+
+    def add(self, record: SorguRecord):
+        """
+        Bir sorgu kaydının node ve ilişkilerini yazar
+
+        Daha önce export edilmiş bir esas no'nun satırı değiştiyse sadece kt-nodes satırı güncellenir.
+        """
+        if not record.esas_no:
+            self.stats['atlanan'] += 1
+            return
+
+        # sira "28/4" -> dönem 28, yasama yılı 4
+        donem = record.sira.split('/')[0]
+        name = teklif_name(record.esas_no, donem)
+        baslik, ozet = split_durum(record.durum)
+        row = [
+            'Kanun Teklifi', name, ozet, '', record.link, record.link, record.sira,
+            record.esas_no, record.tarih, baslik, NEWLINE_PATTERN.sub('<br />', ozet),
+            record.son_durum, sira_no(record.link),
+        ]
+        digest = row_hash(row)
+
+        if record.esas_no in self.seen_esas:
+            if self.seen_esas[record.esas_no] == digest:
+                self.stats['atlanan'] += 1
+            else:
+                self.seen_esas[record.esas_no] = digest
+                self.updated[name] = row
+            return
+        self.seen_esas[record.esas_no] = digest
+
+        self.kt_nodes.writerow(row)
+        self.seen_nodes.add(('Kanun Teklifi', name))
+        self.stats['teklif'] += 1
+
+        donem_name = f'{donem}. Donem'
+        self._node('Donem', donem_name)
+        self._rel('Kanun Teklifi', name, 'SUNULDUGU DONEM', 'Donem', donem_name)
+
+        proposers = (self.mp_index.resolve_proposers(record.durum) if self.mp_index
+                     else parse_proposers(record.durum))
+        for proposer in proposers:
+            mv = mv_name(proposer)
+            self._node('Milletvekili', mv)
+            self._node('Sehir', proposer['il'])
+            # Metinde adı geçen imzacılar ilk imzacılardır; diğerleri sadece sayı olarak verilir
+            self._rel('Milletvekili', mv, 'IMZALADI', 'Kanun Teklifi', name, 'true')
+            if (mv, donem) not in self.seen_temsil:
+                self.seen_temsil.add((mv, donem))
+                self._rel('Milletvekili', mv, f'{donem}. DONEM TEMSIL ETTI', 'Sehir', proposer['il'])
+
+    def _rewrite_updated(self):
+        """Değişen teklif satırlarını kt-nodes.csv'de yerinde günceller"""
+        tmp_path = self.kt_nodes_path + '.tmp'
+        with open(self.kt_nodes_path, 'r', encoding='utf-8', newline='') as src, \
+                open(tmp_path, 'w', encoding='utf-8', newline='') as dst:
+            writer = csv.writer(dst, lineterminator='\n')
+            for row in csv.reader(src):
+                new_row = self.updated.get(row[1]) if len(row) > 1 and row[0] == 'Kanun Teklifi' else None
+                if new_row:
+                    self.stats['guncellenen'] += 1
+                writer.writerow(new_row or row)
+        os.replace(tmp_path, self.kt_nodes_path)
+
+    def close(self):
+        """CSV'leri kapatır, değişen satırları günceller ve --append için export durumunu kaydeder"""
+        for f in self._files.values():
+            f.close()
+        if self.updated:
+            self._rewrite_updated()
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump({'esas_no': dict(sorted(self.seen_esas.items())), 'nodes': sorted(self.seen_nodes),
+                       'temsil': sorted(self.seen_temsil)},
+                      f, ensure_ascii=False)
+
+
+def export(filename: str = INPUT_FILE, dest: str = DEST_DIR, append: bool = False,
+           mp_index: Optional[MPIndex] = None) -> Dict[str, int]:
+    """JSON dosyasını tek geçişte CSV'lere çevirir"""
+    exporter = GraphExporter(dest, append, mp_index)
+    try:
+        for record in iter_records(filename):
+            exporter.add(record)
+    finally:
+        exporter.close()
+    return exporter.stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--file', default=INPUT_FILE)
+    parser.add_argument('--dest', default=DEST_DIR, help='CSV dizini')
+    parser.add_argument('--append', action='store_true', help='Yeni esas no\'ları mevcut CSV\'lere ekle, değişen teklif satırlarını güncelle')
+    parser.add_argument('--mv-file', action='append', help='meclis/donem-parser.js çıktısı (tekrarlanabilir)')
+    args = parser.parse_args(argv)
+
+    mp_index = MPIndex.from_meclis_json(args.mv_file) if args.mv_file else None
+    stats = export(args.file, args.dest, args.append, mp_index)
+    logger.info(f"💾 Graph Commons CSV'leri yazıldı: {args.dest} "
+                f"({stats['teklif']} teklif, {stats['guncellenen']} güncellenen, {stats['node']} node, {stats['iliski']} ilişki, "
+                f"{stats['atlanan']} atlanan)")
+    if mp_index:
+        mp_index.log_stats()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,16 +12,19 @@ import json
 import time
 import re
 import logging
-from typing import List, Dict, Optional
+import argparse
+from typing import Callable, List, Dict, Optional, Tuple, Iterable, Iterator
 from datetime import datetime
+from itertools import islice
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+# selenium, bs4 ve lxml sadece kullanan fonksiyonlarda import edilir;
+# böylece tarayıcı gerektirmeyen işler (cli.py) hızlı başlar
+import network_capture
+import selector_cache
+import profiler
+from browser_watchdog import BrowserWatchdog, configure_timeouts
+from normalize import canonical_url, intern_value, tr_lower, tr_upper, log_cache_stats
+from records import SorguRecord, dump_records, dump_index, index_path
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -36,9 +39,19 @@ BASE_URL = "https://www.tbmm.gov.tr"
 SORGU_URL = f"{BASE_URL}/yasama/kanun-teklifleri"
 DATA_DIR = "data"
 OUTPUT_FILE = f"{DATA_DIR}/kanun_teklifleri_sorgu.json"
+# Durum metinleri yerine metin deposu referanslarını tutan, hızlı yüklenen kopya
+INDEX_FILE = index_path(OUTPUT_FILE)
 REQUEST_DELAY = 2  # Saniye cinsinden bekleme süresi
 TIMEOUT = 30
 
+# Sonuç tablosu parse modu: "soup" (tüm sayfa), "stream" (satır satır)
+# veya "js" (satırlar tarayıcıda tek çağrıyla çıkarılır)
+PARSE_MODE = os.getenv('PARSE_MODE', 'soup').lower()
+STREAM_BATCH_ROWS = int(os.getenv('STREAM_BATCH_ROWS', '500'))
+
+# Sorgunun arka plan endpoint'ini yakala ve sayfaları HTTP ile çek
+CAPTURE_NETWORK = os.getenv('CAPTURE_NETWORK', 'false').lower() == 'true'
+
 # Global WebDriver instance
 driver = None
 
@@ -49,6 +62,7 @@ def create_data_directory():
     logger.info(f"✅ Veri dizini hazır: {DATA_DIR}")
 
 
+@profiler.stage('driver')
 def init_driver():
     """Selenium WebDriver'ı başlatır"""
     global driver
@@ -56,6 +70,9 @@ def init_driver():
     if driver is not None:
         return driver
     
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     logger.info("🚀 Selenium WebDriver başlatılıyor...")
     
     chrome_options = Options()
@@ -92,11 +109,17 @@ def init_driver():
     }
     chrome_options.add_experimental_option("prefs", prefs)
     
+    # Arka plan isteklerini yakalamak için network log'larını aç
+    if CAPTURE_NETWORK:
+        network_capture.enable_performance_logging(chrome_options)
+    
     try:
         driver = webdriver.Chrome(options=chrome_options)
         
         # WebDriver özelliğini gizle
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # Takılan sayfalar sonsuza kadar beklemesin
+        configure_timeouts(driver)
         
         logger.info("✅ WebDriver başarıyla başlatıldı")
         return driver
@@ -111,14 +134,23 @@ def close_driver():
     if driver is not None:
         try:
             driver.quit()
-            driver = None
             logger.info("✅ WebDriver kapatıldı")
         except:
             pass
+        finally:
+            # Çökmüş bir oturum quit'te hata verse de bir sonraki init_driver yeni driver açmalı
+            driver = None
+
+
+# Uzun çalıştırmalarda (daemon, iş kuyruğu) driver'ı sorgular arasında izler ve gerektiğinde yeniler
+watchdog = BrowserWatchdog(init_driver, close_driver, BASE_URL)
 
 
 def wait_for_page_load(timeout=TIMEOUT):
     """Sayfanın tamamen yüklenmesini bekler"""
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+
     try:
         WebDriverWait(driver, timeout).until(
             lambda d: d.execute_script('return document.readyState') == 'complete'
@@ -130,6 +162,7 @@ def wait_for_page_load(timeout=TIMEOUT):
         return False
 
 
+@profiler.stage('form')
 def fill_search_form(arama_kelime="", donem="Son Dönem", durum=""):
     """
     Arama formunu doldurur ve sorguyu gönderir
@@ -139,32 +172,22 @@ def fill_search_form(arama_kelime="", donem="Son Dönem", durum=""):
         donem: Dönem seçimi (örn: "Son Dönem", "28.DÖNEM 3.Yasama Yılı")
         durum: Kanun durumu (örn: "", "KANUNLAŞTI", "İŞLEMDE", "KOMİSYONDA")
     """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import Select
+
     try:
         logger.info(f"📝 Form dolduruluyor: kelime='{arama_kelime}', dönem='{donem}', durum='{durum}'")
         
         # Arama kelimesi input'u
         if arama_kelime:
             try:
-                # Muhtemel input field isimleri
-                kelime_input = None
+                # Muhtemel input field isimleri, ID ile bulamazsak name ile dene
                 possible_ids = ['txtArama', 'txtKelime', 'txtSearch', 'searchWord']
-                
-                for field_id in possible_ids:
-                    try:
-                        kelime_input = driver.find_element(By.ID, field_id)
-                        break
-                    except NoSuchElementException:
-                        continue
-                
-                # ID ile bulamazsak name ile dene
-                if not kelime_input:
-                    possible_names = ['arama', 'kelime', 'search', 'q']
-                    for field_name in possible_names:
-                        try:
-                            kelime_input = driver.find_element(By.NAME, field_name)
-                            break
-                        except NoSuchElementException:
-                            continue
+                possible_names = ['arama', 'kelime', 'search', 'q']
+                kelime_input = selector_cache.resolve_element(
+                    driver, 'sorgu_form', 'kelime_input',
+                    [(By.ID, x) for x in possible_ids] + [(By.NAME, x) for x in possible_names]
+                )
                 
                 if kelime_input:
                     kelime_input.clear()
@@ -178,15 +201,11 @@ def fill_search_form(arama_kelime="", donem="Son Dönem", durum=""):
         # Dönem dropdown
         if donem:
             try:
-                donem_select = None
                 possible_ids = ['ddlDonem', 'ddlYasama', 'donem']
-                
-                for field_id in possible_ids:
-                    try:
-                        donem_select = Select(driver.find_element(By.ID, field_id))
-                        break
-                    except NoSuchElementException:
-                        continue
+                element = selector_cache.resolve_element(
+                    driver, 'sorgu_form', 'donem_select', [(By.ID, x) for x in possible_ids]
+                )
+                donem_select = Select(element) if element else None
                 
                 if donem_select:
                     # Önce visible text ile dene
@@ -208,15 +227,11 @@ def fill_search_form(arama_kelime="", donem="Son Dönem", durum=""):
         # Durum dropdown
         if durum:
             try:
-                durum_select = None
                 possible_ids = ['ddlDurum', 'ddlSonDurum', 'durum']
-                
-                for field_id in possible_ids:
-                    try:
-                        durum_select = Select(driver.find_element(By.ID, field_id))
-                        break
-                    except NoSuchElementException:
-                        continue
+                element = selector_cache.resolve_element(
+                    driver, 'sorgu_form', 'durum_select', [(By.ID, x) for x in possible_ids]
+                )
+                durum_select = Select(element) if element else None
                 
                 if durum_select:
                     try:
@@ -237,37 +252,17 @@ def fill_search_form(arama_kelime="", donem="Son Dönem", durum=""):
         # Sorgula butonunu bul ve tıkla
         time.sleep(1)  # Form elemanlarının hazır olması için
         
-        submit_button = None
         possible_button_ids = ['btnSorgula', 'btnAra', 'btnSearch', 'btnSubmit']
         possible_button_texts = ['SORGULA', 'ARA', 'Search', 'Submit']
         
-        # ID ile dene
-        for btn_id in possible_button_ids:
-            try:
-                submit_button = driver.find_element(By.ID, btn_id)
-                break
-            except NoSuchElementException:
-                continue
-        
-        # Button text ile dene
-        if not submit_button:
-            for btn_text in possible_button_texts:
-                try:
-                    submit_button = driver.find_element(By.XPATH, f"//button[contains(text(), '{btn_text}')]")
-                    break
-                except NoSuchElementException:
-                    try:
-                        submit_button = driver.find_element(By.XPATH, f"//input[@type='submit' and contains(@value, '{btn_text}')]")
-                        break
-                    except NoSuchElementException:
-                        continue
+        # Önce ID, sonra button text, en son type submit input dene
+        candidates = [(By.ID, x) for x in possible_button_ids]
+        for btn_text in possible_button_texts:
+            candidates.append((By.XPATH, f"//button[contains(text(), '{btn_text}')]"))
+            candidates.append((By.XPATH, f"//input[@type='submit' and contains(@value, '{btn_text}')]"))
+        candidates.append((By.XPATH, "//input[@type='submit']"))
         
-        # Type submit input dene
-        if not submit_button:
-            try:
-                submit_button = driver.find_element(By.XPATH, "//input[@type='submit']")
-            except NoSuchElementException:
-                pass
+        submit_button = selector_cache.resolve_element(driver, 'sorgu_form', 'submit_button', candidates)
         
         if submit_button:
             logger.info("🔍 Sorgu gönderiliyor...")
@@ -290,39 +285,327 @@ def fill_search_form(arama_kelime="", donem="Son Dönem", durum=""):
         return False
 
 
-def parse_results_table() -> List[Dict[str, str]]:
+# Sonuç tablosu için denenecek selector'lar (öncelik sırasına göre)
+TABLE_SELECTORS = [
+    'table.sonucTablo',
+    'table.listeTablo',
+    'table.table',
+    '#sonuclar table',
+    '.sonuclar table',
+    'table.gridview',
+    'table[id*="Grid"]',
+    'table'  # Son çare
+]
+
+DURUM_DEGERLERI = ['KANUNLAŞTI', 'İŞLEMDE', 'KOMİSYONDA', 'GERİ ALINDI']
+
+# Muhtemel pagination selector'ları
+NEXT_BUTTON_XPATHS = [
+    "//a[contains(text(), 'Sonraki')]",
+    "//a[contains(text(), 'İleri')]",
+    "//a[contains(text(), '>')]",
+    "//a[contains(@class, 'next')]",
+    "//button[contains(text(), 'Sonraki')]",
+    "//button[contains(@class, 'next')]",
+    "//a[contains(@aria-label, 'Next')]",
+]
+
+# Ortak JS yardımcıları: tablo bulma ve sayfa parmak izi
+_PAGE_JS_HELPERS = """
+function findTable(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var tables = document.querySelectorAll(selectors[i]);
+        if (!tables.length) continue;
+        var best = tables[0];
+        for (var j = 1; j < tables.length; j++) {
+            if (tables[j].rows.length > best.rows.length) best = tables[j];
+        }
+        return [best, selectors[i]];
+    }
+    return null;
+}
+function fingerprint(table) {
+    if (!table) return '';
+    var rows = table.rows, text = rows.length + '|';
+    if (rows.length) text += rows[Math.min(1, rows.length - 1)].textContent + '|' + rows[rows.length - 1].textContent;
+    var h = 0;
+    for (var i = 0; i < text.length; i++) h = (h * 31 + text.charCodeAt(i)) | 0;
+    return rows.length + ':' + h;
+}
+"""
+
+# Sayfanın parmak izini döndürür (sayfa değişimini beklemek için)
+PAGE_FINGERPRINT_JS = _PAGE_JS_HELPERS + """
+var found = findTable(arguments[0]);
+return fingerprint(found && found[0]);
+"""
+
+# Satırları [etiket, metin, link, link metni] hücreleri olarak, sonraki sayfa
+# butonunu ve sayfa parmak izini tek seferde döndürür
+EXTRACT_PAGE_JS = _PAGE_JS_HELPERS + """
+function text(node) {
+    // BeautifulSoup get_text gibi script/style içeriği metne katılmaz
+    var walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT), parts = [], n;
+    while ((n = walker.nextNode())) {
+        if (!/^(SCRIPT|STYLE)$/.test(n.parentNode.nodeName)) parts.push(n.nodeValue.trim());
+    }
+    return parts.join('');
+}
+var found = findTable(arguments[0]);
+if (!found) return null;
+var table = found[0], rows = [];
+for (var i = 0; i < table.rows.length; i++) {
+    var cells = table.rows[i].cells, row = [];
+    for (var j = 0; j < cells.length; j++) {
+        var link = cells[j].querySelector('a'), href = link ? link.getAttribute('href') : null;
+        row.push([cells[j].tagName.toLowerCase(), text(cells[j]), href || null, href ? text(link) : '']);
+    }
+    rows.push(row);
+}
+var next = null, xpaths = arguments[1];
+for (var k = 0; k < xpaths.length && !next; k++) {
+    var el = document.evaluate(xpaths[k], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (el && (el.getAttribute('class') || '').toLowerCase().indexOf('disabled') === -1) next = el;
+}
+return {rows: rows, next: next, fingerprint: fingerprint(table), selector: found[1]};
+"""
+
+
+# Tarayıcıda en büyük sonuç tablosunu bulur: [tablo, satır sayısı, selector]
+LOCATE_TABLE_JS = _PAGE_JS_HELPERS + """
+var found = findTable(arguments[0]);
+return found && [found[0], found[0].rows.length, found[1]];
+"""
+
+# Tablonun [baslangic, bitis) aralığındaki satırlarının HTML'ini döndürür
+TABLE_ROWS_HTML_JS = """
+var rows = arguments[0].rows;
+var end = Math.min(arguments[2], rows.length);
+var out = [];
+for (var i = arguments[1]; i < end; i++) out.push(rows[i].outerHTML);
+return out.join('');
+"""
+
+
+def build_row_data(cells: List[Tuple[str, str, Optional[str], str]]) -> Dict[str, str]:
+    """
+    Bir tablo satırının hücrelerinden kayıt sözlüğü oluşturur
+
+    Args:
+        cells: (etiket, metin, link, link metni) demetleri listesi
+    """
+    row_data = {}
+
+    for idx, (_, text, href, link_text) in enumerate(cells):
+        # Link varsa al
+        if href:
+            row_data['baslik'] = intern_value(link_text)
+            # Relative link'i absolute'a çevir
+            row_data['link'] = canonical_url(href)
+
+        # Hücre içeriğini al
+        if text:
+            # Dönem, tarih, durum gibi kısa değerler çok tekrar eder
+            text = intern_value(text)
+            # Kolon indexine göre isimlendir
+            if idx == 0:
+                row_data['sira'] = text
+            elif idx == 1:
+                # İkinci sütun: Esas No (format: 2/3356)
+                if re.match(r'^\d+/\d+$', text):
+                    row_data['esas_no'] = text
+                elif 'baslik' not in row_data:
+                    row_data['baslik'] = text
+            elif idx == 2:
+                # Üçüncü sütun: Tarih (format: 06/11/2025)
+                if re.match(r'^\d{2}/\d{2}/\d{4}$', text):
+                    row_data['tarih'] = text
+                elif 'baslik' not in row_data:
+                    row_data['baslik'] = text
+            elif 'dönem' in tr_lower(text) or 'yasama' in tr_lower(text):
+                row_data['donem'] = text
+            elif any(durum in tr_upper(text) for durum in DURUM_DEGERLERI):
+                row_data['durum'] = text
+            elif 'baslik' not in row_data:
+                row_data['baslik'] = text
+            else:
+                # Genel field
+                row_data[f'field_{idx}'] = text
+
+    return row_data
+
+
+def iter_parsed_rows(rows: Iterable[List[Tuple[str, str, Optional[str], str]]]) -> Iterator[SorguRecord]:
+    """Hücre listelerinden header'ı atlayarak kayıtları üretir"""
+    header_found = False
+    for cells in rows:
+        # Header satırını tespit et
+        if not header_found and cells and cells[0][0] == 'th':
+            header_found = True
+            continue
+
+        # Veri satırlarını işle
+        if len(cells) < 2:
+            continue
+
+        row_data = build_row_data(cells)
+
+        # En azından başlık varsa ekle
+        if row_data.get('baslik'):
+            row_data['cekme_tarihi'] = datetime.now().isoformat()
+            logger.debug(f"  ✓ Satır eklendi: {row_data.get('baslik', '')[:50]}")
+            yield SorguRecord.from_dict(row_data)
+
+
+# Metni hücre metnine katılmayan elemanlar (BeautifulSoup get_text ile aynı)
+TEXTLESS_TAGS = ('script', 'style', 'template')
+
+
+def soup_table_rows(table) -> List:
+    """Tablonun kendi satırları; hücre içindeki iç içe tabloların satırları hariç"""
+    return [row for row in table.find_all('tr') if row.find_parent('table') is table]
+
+
+def soup_row_cells(row) -> List[Tuple[str, str, Optional[str], str]]:
+    """BeautifulSoup satırını hücre demetlerine çevirir (iç tablolar hücre metnine dahildir)"""
+    cells = []
+    for cell in row.find_all(['th', 'td'], recursive=False):
+        link = cell.find('a')
+        href = link.get('href') if link else None
+        link_text = link.get_text(strip=True) if href else ''
+        cells.append((cell.name, cell.get_text(strip=True), href, link_text))
+    return cells
+
+
+def _element_text(element) -> str:
+    """
+    lxml elementinin metnini BeautifulSoup get_text(strip=True) gibi birleştirir
+
+    BeautifulSoup gibi script, style ve template içeriği atlanır (yorumları itertext zaten atlar).
+    """
+    if next(element.iter(*TEXTLESS_TAGS), None) is None:
+        return ''.join(part.strip() for part in element.itertext())
+
+    parts = [(element.text or '').strip()]
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in TEXTLESS_TAGS:
+            parts.append(_element_text(child))
+        parts.append((child.tail or '').strip())
+    return ''.join(parts)
+
+
+def iter_table_rows(chunks: Iterable[str]) -> Iterator[List[Tuple[str, str, Optional[str], str]]]:
+    """
+    Parça parça gelen tablo HTML'ini lxml ile artımlı parse eder
+
+    Dış tablonun her <tr>'si kapandığında hücreleri üretilir ve element ağaçtan
+    silinir, böylece bellek kullanımı sayfa boyutuna değil satır boyutuna bağlı
+    kalır. Hücre içindeki iç içe tabloların satırları ayrı kayıt olmaz ve dış
+    satır işlenene kadar silinmez (soup modu ile aynı sonuç).
+    """
+    from lxml import etree
+
+    parser = etree.HTMLPullParser(events=('start', 'end'), tag=('table', 'tr'))
+    depth = 0
+
+    def drain():
+        nonlocal depth
+        for event, row in parser.read_events():
+            if row.tag == 'table':
+                depth += 1 if event == 'start' else -1
+                continue
+            if event != 'end' or depth != 1:
+                continue
+
+            cells = []
+            for cell in row:
+                if cell.tag not in ('th', 'td'):
+                    continue
+                link = next(cell.iter('a'), None)
+                href = link.get('href') if link is not None else None
+                link_text = _element_text(link) if href else ''
+                cells.append((cell.tag, _element_text(cell), href, link_text))
+            yield cells
+
+            # İşlenen satırı ve öncekileri bırak
+            row.clear()
+            parent = row.getparent()
+            if parent is not None:
+                while row.getprevious() is not None:
+                    del parent[0]
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def iter_table_html_batches(table, row_count: int, batch_size: int = STREAM_BATCH_ROWS) -> Iterator[str]:
+    """Tablo satırlarını tarayıcıdan batch'ler halinde HTML olarak çeker"""
+    yield '<table>'
+    for start in range(0, row_count, batch_size):
+        yield driver.execute_script(TABLE_ROWS_HTML_JS, table, start, start + batch_size)
+    yield '</table>'
+
+
+def iter_results_table_streaming() -> Iterator[SorguRecord]:
+    """Sonuç tablosunu tüm sayfa kaynağını almadan, satır satır parse eder"""
+    logger.info("📊 Sonuçlar stream modunda parse ediliyor...")
+
+    located = driver.execute_script(LOCATE_TABLE_JS, selector_cache.ordered('sorgu_sonuc', 'table', TABLE_SELECTORS))
+    if not located:
+        logger.warning("⚠️ Sonuç tablosu bulunamadı")
+        return
+
+    table, row_count, selector = located
+    logger.info(f"  ✓ Tablo bulundu: {selector} ({row_count} satır)")
+    selector_cache.remember('sorgu_sonuc', 'table', selector)
+
+    count = 0
+    for row_data in iter_parsed_rows(iter_table_rows(iter_table_html_batches(table, row_count))):
+        count += 1
+        yield row_data
+
+    logger.info(f"✅ {count} sonuç parse edildi")
+
+
+def parse_results_html(html: str) -> Optional[List[SorguRecord]]:
+    """HTML içindeki sonuç tablosunu parse eder, tablo yoksa None döndürür"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'lxml')
+    
+    # Tabloyu bul - farklı selector'ları öncelik sırasıyla dene. Tarayıcı round-trip'i olmadığı
+    # için selector cache kullanılmaz
+    table_rows = None
+    for selector in TABLE_SELECTORS:
+        tables = soup.select(selector)
+        if tables:
+            # En büyük tabloyu al (muhtemelen sonuç tablosu); satırları bir kez hesaplanır
+            table_rows = max((soup_table_rows(t) for t in tables), key=len)
+            logger.info(f"  ✓ Tablo bulundu: {selector} ({len(table_rows)} satır)")
+            break
+    
+    if table_rows is None:
+        return None
+    
+    # Tablo satırlarını parse et
+    rows = (soup_row_cells(row) for row in table_rows)
+    return list(iter_parsed_rows(rows))
+
+
+@profiler.stage('parse')
+def parse_results_table() -> List[SorguRecord]:
     """Sonuç tablosunu parse eder"""
     try:
         logger.info("📊 Sonuçlar parse ediliyor...")
         
         # Sayfanın HTML'ini al
         html = driver.page_source
-        soup = BeautifulSoup(html, 'lxml')
-        
-        results = []
-        
-        # Tabloyu bul - farklı selector'ları dene
-        table = None
-        table_selectors = [
-            'table.sonucTablo',
-            'table.listeTablo',
-            'table.table',
-            '#sonuclar table',
-            '.sonuclar table',
-            'table.gridview',
-            'table[id*="Grid"]',
-            'table'  # Son çare
-        ]
-        
-        for selector in table_selectors:
-            tables = soup.select(selector)
-            if tables:
-                # En büyük tabloyu al (muhtemelen sonuç tablosu)
-                table = max(tables, key=lambda t: len(t.find_all('tr')))
-                logger.info(f"  ✓ Tablo bulundu: {selector} ({len(table.find_all('tr'))} satır)")
-                break
+        results = parse_results_html(html)
         
-        if not table:
+        if results is None:
             logger.warning("⚠️ Sonuç tablosu bulunamadı")
             # Debug için sayfanın bir kısmını kaydet
             with open('debug_page.html', 'w', encoding='utf-8') as f:
@@ -330,72 +613,6 @@ def parse_results_table() -> List[Dict[str, str]]:
             logger.info("Debug için sayfa debug_page.html olarak kaydedildi")
             return []
         
-        # Tablo satırlarını parse et
-        rows = table.find_all('tr')
-        
-        # Header satırını atla
-        header_found = False
-        for row in rows:
-            cells = row.find_all(['th', 'td'])
-            
-            # Header satırını tespit et
-            if not header_found and cells and cells[0].name == 'th':
-                header_found = True
-                continue
-            
-            # Veri satırlarını işle
-            if len(cells) < 2:
-                continue
-            
-            # Her hücredeki veriyi çek
-            row_data = {}
-            
-            for idx, cell in enumerate(cells):
-                # Link varsa al
-                link = cell.find('a')
-                if link and link.get('href'):
-                    href = link.get('href')
-                    # Relative link'i absolute'a çevir
-                    if not href.startswith('http'):
-                        href = BASE_URL + (href if href.startswith('/') else '/' + href)
-                    
-                    row_data['baslik'] = link.get_text(strip=True)
-                    row_data['link'] = href
-                
-                # Hücre içeriğini al
-                text = cell.get_text(strip=True)
-                if text:
-                    # Kolon indexine göre isimlendir
-                    if idx == 0:
-                        row_data['sira'] = text
-                    elif idx == 1:
-                        # İkinci sütun: Esas No (format: 2/3356)
-                        if re.match(r'^\d+/\d+$', text):
-                            row_data['esas_no'] = text
-                        elif 'baslik' not in row_data:
-                            row_data['baslik'] = text
-                    elif idx == 2:
-                        # Üçüncü sütun: Tarih (format: 06/11/2025)
-                        if re.match(r'^\d{2}/\d{2}/\d{4}$', text):
-                            row_data['tarih'] = text
-                        elif 'baslik' not in row_data:
-                            row_data['baslik'] = text
-                    elif 'dönem' in text.lower() or 'yasama' in text.lower():
-                        row_data['donem'] = text
-                    elif any(durum in text.upper() for durum in ['KANUNLAŞTI', 'İŞLEMDE', 'KOMİSYONDA', 'GERİ ALINDI']):
-                        row_data['durum'] = text
-                    elif 'baslik' not in row_data:
-                        row_data['baslik'] = text
-                    else:
-                        # Genel field
-                        row_data[f'field_{idx}'] = text
-            
-            # En azından başlık varsa ekle
-            if row_data.get('baslik'):
-                row_data['cekme_tarihi'] = datetime.now().isoformat()
-                results.append(row_data)
-                logger.debug(f"  ✓ Satır eklendi: {row_data.get('baslik', '')[:50]}")
-        
         logger.info(f"✅ {len(results)} sonuç parse edildi")
         return results
         
@@ -406,12 +623,89 @@ def parse_results_table() -> List[Dict[str, str]]:
         return []
 
 
-def handle_pagination(max_results: int = 20) -> List[Dict[str, str]]:
+def iter_results() -> Iterator[SorguRecord]:
+    """Mevcut sayfadaki sonuçları PARSE_MODE'a göre üretir"""
+    if PARSE_MODE == 'stream':
+        try:
+            yield from iter_results_table_streaming()
+        except Exception as e:
+            logger.error(f"❌ Stream parse hatası: {e}")
+        return
+
+    if PARSE_MODE == 'js':
+        page = extract_page_js()
+        if page:
+            yield from iter_parsed_rows(page['rows'])
+        return
+
+    yield from parse_results_table()
+
+
+def find_next_button():
+    """Sonraki sayfa butonunu bulur, yoksa veya disabled ise None döndürür"""
+    from selenium.webdriver.common.by import By
+
+    return selector_cache.resolve_element(
+        driver, 'sorgu_sonuc', 'next_button', [(By.XPATH, x) for x in NEXT_BUTTON_XPATHS],
+        skip_disabled=True
+    )
+
+
+@profiler.stage('parse')
+def extract_page_js() -> Optional[Dict]:
+    """
+    Sonuç satırlarını, sonraki sayfa butonunu ve sayfa parmak izini
+    tek bir execute_script çağrısıyla tarayıcıdan alır
+    """
+    from selenium.webdriver.common.by import By
+
+    page = driver.execute_script(
+        EXTRACT_PAGE_JS,
+        selector_cache.ordered('sorgu_sonuc', 'table', TABLE_SELECTORS),
+        [x for _, x in selector_cache.ordered('sorgu_sonuc', 'next_button', [(By.XPATH, x) for x in NEXT_BUTTON_XPATHS])],
+    )
+    if not page:
+        logger.warning("⚠️ Sonuç tablosu bulunamadı")
+        return None
+
+    logger.info(f"  ✓ Tablo bulundu: {page['selector']} ({len(page['rows'])} satır)")
+    selector_cache.remember('sorgu_sonuc', 'table', page['selector'])
+    return page
+
+
+@profiler.stage('sayfa_gecis')
+def wait_for_page_change(fingerprint: str, timeout=TIMEOUT) -> bool:
+    """
+    Sayfa parmak izi değişene kadar (yeni sonuçlar gelene kadar) bekler
+
+    Postback sırasında tablo kısa süre DOM'dan kalkabilir; boş parmak izi
+    değişim sayılmaz, yeni tablo gelene kadar beklenir.
+    """
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+
+    def changed(d) -> bool:
+        current = d.execute_script(
+            PAGE_FINGERPRINT_JS, selector_cache.ordered('sorgu_sonuc', 'table', TABLE_SELECTORS)
+        )
+        return bool(current) and current != fingerprint
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(changed)
+        return True
+    except TimeoutException:
+        logger.warning("⚠️ Sayfa değişmedi (zaman aşımı)")
+        return False
+
+
+@profiler.stage('sayfalama')
+def handle_pagination(max_results: int = 20, before_page: Optional[Callable[[], None]] = None) -> List[SorguRecord]:
     """
     Sayfalama varsa tüm sayfaları dolaşır ve sonuçları toplar
     
     Args:
         max_results: Maksimum çekilecek kayıt sayısı (varsayılan: 20)
+        before_page: Sonraki sayfaya geçmeden önce çağrılır (örn: istek bütçesi için)
     """
     all_results = []
     page_num = 1
@@ -420,47 +714,47 @@ def handle_pagination(max_results: int = 20) -> List[Dict[str, str]]:
         logger.info(f"📄 Sayfa {page_num} işleniyor...")
         
         # Mevcut sayfadaki sonuçları parse et
-        results = parse_results_table()
-        all_results.extend(results)
+        page = None
+        if PARSE_MODE == 'js':
+            page = extract_page_js()
+            rows = iter_parsed_rows(page['rows']) if page else iter(())
+        else:
+            rows = iter_results()
         
-        # Maksimum kayıt sayısına ulaşıldı mı kontrol et
-        if len(all_results) >= max_results:
-            logger.info(f"✅ Maksimum kayıt sayısına ulaşıldı: {len(all_results)} kayıt")
-            # Sadece istenen sayıda kayıt döndür
-            return all_results[:max_results]
+        page_count = 0
+        # Stream/soup modunda satırlar bu döngüde parse edilir
+        with profiler.stage('parse'):
+            for row_data in rows:
+                all_results.append(row_data)
+                page_count += 1
+                
+                # Maksimum kayıt sayısına ulaşıldı mı kontrol et
+                if len(all_results) >= max_results:
+                    logger.info(f"✅ Maksimum kayıt sayısına ulaşıldı: {len(all_results)} kayıt")
+                    return all_results
         
-        if not results:
+        if not page_count:
             logger.warning(f"⚠️ Sayfa {page_num}'de sonuç bulunamadı")
             break
+        watchdog.page_served()
         
         # Sonraki sayfa butonunu ara
         try:
-            # Muhtemel pagination selectors
-            next_button = None
-            next_selectors = [
-                "//a[contains(text(), 'Sonraki')]",
-                "//a[contains(text(), 'İleri')]",
-                "//a[contains(text(), '>')]",
-                "//a[contains(@class, 'next')]",
-                "//button[contains(text(), 'Sonraki')]",
-                "//button[contains(@class, 'next')]",
-                "//a[contains(@aria-label, 'Next')]",
-            ]
-            
-            for selector in next_selectors:
-                try:
-                    next_button = driver.find_element(By.XPATH, selector)
-                    # Disabled değilse
-                    if 'disabled' not in next_button.get_attribute('class').lower():
-                        break
-                    else:
-                        next_button = None
-                except NoSuchElementException:
-                    continue
+            next_button = page['next'] if page else find_next_button()
             
             if next_button:
+                if before_page:
+                    before_page()
                 logger.info(f"  ➡️  Sonraki sayfaya geçiliyor...")
                 
+                if page:
+                    # JS modunda scroll gerekmez; yeni sonuçlar gelene kadar bekle
+                    driver.execute_script("arguments[0].click();", next_button)
+                    if not wait_for_page_change(page['fingerprint']):
+                        break
+                    page_num += 1
+                    continue
+                
                 # Butonu görünür hale getirmek için scroll et
                 try:
                     driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", next_button)
@@ -489,12 +783,244 @@ def handle_pagination(max_results: int = 20) -> List[Dict[str, str]]:
     return all_results
 
 
-def save_to_json(data: List[Dict[str, str]], filename: str = OUTPUT_FILE):
-    """Verileri JSON dosyasına kaydeder"""
+def run_query(arama_kelime: str = "", donem: str = "Son Dönem", durum: str = "",
+              max_results: int = 20, before_page: Optional[Callable[[], None]] = None) -> List[SorguRecord]:
+    """
+    Sorgu sayfasını açar, formu gönderir ve sonuçları toplar
+
+    Daemon ve iş kuyruğu gibi aynı tarayıcıyla çok sayıda sorgu yapan
+    çalıştırmalar için; driver her sorgudan önce watchdog ile kontrol edilir.
+    """
+    driver = watchdog.ensure()
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        logger.info(f"💾 Veriler kaydedildi: {filename} ({len(data)} kayıt)")
+        driver.get(SORGU_URL)
+        wait_for_page_load()
+        fill_search_form(arama_kelime=arama_kelime, donem=donem, durum=durum)
+        return handle_pagination(max_results=max_results, before_page=before_page)
+    except Exception as e:
+        watchdog.failure(e)
+        raise
+
+
+def _find_record_list(payload) -> List[Dict]:
+    """JSON cevabı içindeki en büyük kayıt (dict) listesini bulur"""
+    best = []
+    stack = [payload]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            records = [x for x in item if isinstance(x, dict)]
+            if len(records) > len(best):
+                best = records
+            stack.extend(item)
+    return best
+
+
+def parse_endpoint_response(text: str, content_type: str) -> List[SorguRecord]:
+    """Endpoint cevabını (JSON veya HTML) sonuç kayıtlarına çevirir"""
+    stripped = text.lstrip()
+    if 'json' not in content_type and not stripped.startswith(('{', '[')):
+        return parse_results_html(text) or []
+    
+    payload = json.loads(stripped)
+    # ASP.NET servisleri cevabı {"d": ...} içine sarar
+    if isinstance(payload, dict) and isinstance(payload.get('d'), str):
+        return parse_endpoint_response(payload['d'], '')
+    
+    results = []
+    for item in _find_record_list(payload):
+        cells = []
+        link = None
+        for value in item.values():
+            if value is None or isinstance(value, (dict, list)):
+                continue
+            text_value = str(value).strip()
+            if link is None and re.match(r'^(https?://|/)\S+$', text_value):
+                link = text_value
+                continue
+            cells.append(('td', text_value, None, ''))
+        
+        row_data = build_row_data(cells)
+        if link:
+            row_data['link'] = canonical_url(link)
+        if row_data.get('baslik') or row_data.get('esas_no'):
+            row_data['cekme_tarihi'] = datetime.now().isoformat()
+            results.append(SorguRecord.from_dict(row_data))
+    return results
+
+
+def _row_keys(rows: List[SorguRecord]) -> List[str]:
+    """Sayfaları karşılaştırmak için kayıt anahtarları"""
+    return [r.esas_no or r.baslik for r in rows]
+
+
+def iter_endpoint_pages(session, endpoint: Dict, start_page: int = 1) -> Iterator[List[SorguRecord]]:
+    """Endpoint'ten sayfaları HTTP ile çeker, sonuç bitene kadar sayfa sayfa üretir"""
+    state = None
+    previous_keys = None
+    page_num = start_page
+    
+    while True:
+        logger.info(f"🛰️  Sayfa {page_num} endpoint'ten çekiliyor...")
+        text, content_type = network_capture.fetch_endpoint_page(session, endpoint, page_num, state)
+        rows = parse_endpoint_response(text, content_type)
+        
+        # Boş veya tekrar eden sayfa = son sayfa
+        keys = _row_keys(rows)
+        if not rows or keys == previous_keys:
+            logger.info(f"✅ Endpoint'teki tüm sayfalar tarandı (Toplam {page_num - 1} sayfa)")
+            return
+        
+        yield rows
+        
+        state = network_capture.extract_hidden_fields(text)
+        previous_keys = keys
+        page_num += 1
+        time.sleep(REQUEST_DELAY)
+
+
+def query_filters(arama_kelime: str = "", donem: str = "Son Dönem", durum: str = "") -> Dict[str, str]:
+    """Endpoint ile birlikte kaydedilen sorgu filtreleri"""
+    return {'arama_kelime': arama_kelime, 'donem': donem, 'durum': durum}
+
+
+def rows_match_filters(rows: List[SorguRecord], filters: Dict[str, str]) -> bool:
+    """
+    Satırlar istenen filtrelere uyuyor mu
+
+    Cevapta filtrelerin yankısı olmadığı için satırların kendisine bakılır: her
+    satırın esas no'su olmalı, durum seçildiyse son durumu bunu içermelidir.
+    Oturumu düşmüş bir endpoint'in döndürdüğü varsayılan (filtresiz) liste veya
+    hata sayfası böylece yakalanır. Arama kelimesi satırda görünmeyen metinde de
+    eşleşebildiği için kontrol edilmez; kelimeli sorgularda endpoint'in
+    filtrelerle birlikte kaydedilmiş olması (ve varsa UI karşılaştırması) esastır.
+    """
+    durum = tr_upper(filters.get('durum', ''))
+    for row in rows:
+        if not row.esas_no:
+            return False
+        if durum and durum not in tr_upper(row.son_durum or row.durum):
+            return False
+    return True
+
+
+def replay_saved_endpoint(max_results: int = 20, filters: Optional[Dict[str, str]] = None) -> Optional[List[SorguRecord]]:
+    """
+    Önceki çalıştırmada bulunan endpoint'i formu kullanmadan tekrar oynatır
+
+    Endpoint sadece aynı filtrelerle yakalandıysa kullanılır ve ilk sayfası
+    doğrulanmadan sonuçlara güvenilmez: driver açıksa form gönderilip UI'daki
+    ilk sayfayla karşılaştırılır, değilse (tarayıcısız çalıştırma, istekler
+    cookie'siz yapılır) satırların filtrelere uyduğu kontrol edilir.
+
+    Returns:
+        Sonuçlar; endpoint yoksa, çalışmadıysa veya doğrulanamadıysa None
+    """
+    endpoint = network_capture.load_endpoint()
+    if not endpoint:
+        return None
+    filters = filters or query_filters()
+    if endpoint.get('filters') != filters:
+        logger.warning(f"⚠️ Kayıtlı endpoint farklı filtrelerle yakalanmış ({endpoint.get('filters')}), kullanılmıyor")
+        return None
+    
+    logger.info(f"🛰️  Kayıtlı endpoint deneniyor: {endpoint['url']}")
+    results = []
+    try:
+        session = network_capture.build_session(driver, endpoint)
+        pages = iter_endpoint_pages(session, endpoint)
+        first_page = next(pages, [])
+        if not first_page:
+            logger.warning("⚠️ Kayıtlı endpoint sonuç döndürmedi, UI'a dönülüyor")
+            return None
+        if not rows_match_filters(first_page, filters):
+            logger.warning("⚠️ Kayıtlı endpoint'in sonuçları filtrelere uymuyor (oturum düşmüş olabilir), UI'a dönülüyor")
+            return None
+        if driver is not None:
+            # İlk sayfa UI'da da var; aynı sonuçları veriyorsa endpoint güvenilir
+            fill_search_form(**filters)
+            if _row_keys(first_page) != _row_keys(list(iter_results())):
+                logger.warning("⚠️ Kayıtlı endpoint'in ilk sayfası UI ile eşleşmedi, UI'a dönülüyor")
+                return None
+        
+        results.extend(first_page)
+        for rows in pages:
+            if len(results) >= max_results:
+                break
+            results.extend(rows)
+    except Exception as e:
+        logger.warning(f"⚠️ Kayıtlı endpoint çalışmadı, UI'a dönülüyor: {e}")
+        return None
+    
+    return results[:max_results]
+
+
+@profiler.stage('endpoint')
+def handle_pagination_via_endpoint(max_results: int = 20, filters: Optional[Dict[str, str]] = None) -> List[SorguRecord]:
+    """
+    İlk sayfayı UI'dan alır, 2. sayfaya geçerken yakalanan isteği endpoint
+    olarak kullanır ve kalan sayfaları HTTP ile çeker. Endpoint doğrulanamazsa
+    UI sayfalamasına devam eder.
+    
+    Args:
+        max_results: Maksimum çekilecek kayıt sayısı (varsayılan: 20)
+        filters: Formda kullanılan filtreler; endpoint bunlarla birlikte kaydedilir
+    """
+    submit_requests = network_capture.drain_requests(driver)
+    
+    logger.info("📄 Sayfa 1 işleniyor...")
+    results = list(islice(iter_results(), max_results))
+    if not results or len(results) >= max_results:
+        return results
+    
+    next_button = find_next_button()
+    if not next_button:
+        logger.info("✅ Tüm sayfalar tarandı (Toplam 1 sayfa)")
+        return results
+    
+    driver.execute_script("arguments[0].click();", next_button)
+    time.sleep(REQUEST_DELAY)
+    wait_for_page_load()
+    
+    endpoint = network_capture.discover_endpoint(submit_requests, network_capture.drain_requests(driver))
+    if endpoint:
+        try:
+            session = network_capture.build_session(driver, endpoint)
+            pages = iter_endpoint_pages(session, endpoint, start_page=2)
+            
+            # 2. sayfa hem UI'da hem endpoint'te var; aynı sonuçları veriyorsa endpoint güvenilir
+            first_page = next(pages, [])
+            if first_page and _row_keys(first_page) == _row_keys(list(iter_results())):
+                network_capture.save_endpoint({**endpoint, 'filters': filters or query_filters()})
+                results.extend(first_page)
+                for rows in pages:
+                    if len(results) >= max_results:
+                        break
+                    results.extend(rows)
+                return results[:max_results]
+            
+            logger.warning("⚠️ Endpoint sonuçları UI ile eşleşmedi")
+        except Exception as e:
+            logger.warning(f"⚠️ Endpoint tekrar oynatılamadı: {e}")
+    
+    logger.info("↩️  UI sayfalamasına dönülüyor...")
+    results.extend(handle_pagination(max_results - len(results)))
+    return results
+
+
+@profiler.stage('kaydet')
+def save_to_json(data: List[SorguRecord], filename: str = OUTPUT_FILE):
+    """
+    Verileri JSON dosyasına, durum metinlerinin depo referanslarını yanındaki indeks dosyasına kaydeder
+
+    Ana dosya API için tam metinleri içerir; metinler ondan sonra depoya alınır ve tekrar açılmaz.
+    """
+    try:
+        count = dump_records(data, filename)
+        logger.info(f"💾 Veriler kaydedildi: {filename} ({count} kayıt)")
+        dump_index(data, index_path(filename))
     except Exception as e:
         logger.error(f"❌ JSON kaydetme hatası: {e}")
         raise
@@ -509,7 +1035,7 @@ def main():
         create_data_directory()
         
         # 2. WebDriver'ı başlat
-        driver = init_driver()
+        driver = watchdog.ensure()
         
         # 3. Sorgu sayfasına git
         logger.info(f"🌐 Sorgu sayfası açılıyor: {SORGU_URL}")
@@ -519,21 +1045,34 @@ def main():
         # Bot koruması varsa bekle
         time.sleep(5)
         
-        # 4. Arama formunu doldur ve gönder
         # Burada parametreleri değiştirebilirsin
-        success = fill_search_form(
+        filters = query_filters(
             arama_kelime="",  # Boş = tüm sonuçlar
             donem="Son Dönem",  # veya "28.DÖNEM 3.Yasama Yılı" gibi
             durum=""  # Boş = tüm durumlar, veya "KANUNLAŞTI", "İŞLEMDE", vs.
         )
         
-        if not success:
-            logger.error("❌ Form gönderilemedi!")
-            # Form bulunamadıysa, belki direkt sonuçlar sayfasındayız?
-            logger.info("⚠️ Mevcut sayfadan sonuç çekmeye çalışılıyor...")
+        results = None
+        if CAPTURE_NETWORK:
+            # Önceki çalıştırmadan kalan endpoint varsa sayfalamada UI'ı hiç kullanma
+            results = replay_saved_endpoint(filters=filters)
+            # Sayfa yüklenirken oluşan istekleri at
+            network_capture.drain_requests(driver)
         
-        # 5. Sonuçları çek (pagination dahil)
-        results = handle_pagination()
+        if not results:
+            # 4. Arama formunu doldur ve gönder
+            success = fill_search_form(**filters)
+            
+            if not success:
+                logger.error("❌ Form gönderilemedi!")
+                # Form bulunamadıysa, belki direkt sonuçlar sayfasındayız?
+                logger.info("⚠️ Mevcut sayfadan sonuç çekmeye çalışılıyor...")
+            
+            # 5. Sonuçları çek (pagination dahil)
+            if CAPTURE_NETWORK:
+                results = handle_pagination_via_endpoint(filters=filters)
+            else:
+                results = handle_pagination()
         
         if not results:
             logger.warning("⚠️ Hiç sonuç bulunamadı!")
@@ -553,13 +1092,17 @@ def main():
             # Durum dağılımı
             durum_counts = {}
             for r in results:
-                durum = r.get('durum', 'Bilinmiyor')
+                durum = r.son_durum or r.durum or 'Bilinmiyor'
                 durum_counts[durum] = durum_counts.get(durum, 0) + 1
             
             if durum_counts:
                 logger.info("  • Durum dağılımı:")
                 for durum, count in sorted(durum_counts.items(), key=lambda x: x[1], reverse=True):
                     logger.info(f"    - {durum}: {count}")
+            
+            log_cache_stats()
+            selector_cache.log_stats()
+            watchdog.log_stats()
         
     except KeyboardInterrupt:
         logger.warning("\n⚠️ İşlem kullanıcı tarafından durduruldu")
@@ -574,5 +1117,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--profile', action='store_true',
+                        help=f'Örnekleyici profiler ile çalıştır, çıktılar {profiler.PROFILE_DIR}/ altına yazılır')
+    args = parser.parse_args()
+    with profiler.profile('kanun_teklifleri_scraper', enabled=args.profile):
+        main()
 
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Milletvekili Eşleştirme İndeksi
+Sorgu kayıtlarındaki teklif sahibi adlarını meclis pipeline'ının ürettiği
+milletvekili listesine (meclis/donem-parser.js çıktısı) eşler ve sicil
+no'yu bulur.
+
+Önce normalize ad (+ il) ile hash araması yapılır, bulunamazsa Türkçe
+karakterlerden arındırılmış ad ile, o da olmazsa 3-gram ters indeksi ile
+yazım farkları tolere edilir. 3-gram araması sadece en az bir 3-gram'ı
+paylaşan adayları puanlar, tüm listeyi taramaz.
+
+Kullanım:
+    python mp_index.py --mv-file data/mvlist.28.json "Rize  Milletvekili Harun MERTOĞLU"
+"""
+
+import json
+import logging
+import argparse
+from collections import defaultdict
+from typing import List, Dict, Optional, Iterable, Tuple
+
+from normalize import normalize_name, fold_name, parse_proposers
+
+logger = logging.getLogger(__name__)
+
+# Sabitler
+NGRAM_SIZE = 3
+# Bu benzerliğin (Dice katsayısı) altındaki 3-gram eşleşmeleri kabul edilmez
+MIN_SIMILARITY = 0.75
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> frozenset:
+    """Adın kelime sınırlarıyla birlikte n-gram kümesi"""
+    padded = f' {text} '
+    return frozenset(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+class MPIndex:
+    """Milletvekili adı -> kayıt (name, city, party, id) indeksi"""
+
+    def __init__(self, mvs: Iterable[Dict[str, str]] = ()):
+        self.mvs: List[Dict[str, str]] = []
+        self._exact: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        self._folded: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        self._grams: List[frozenset] = []
+        self._inverted: Dict[str, List[int]] = defaultdict(list)
+        self.stats = {'exact': 0, 'folded': 0, 'ngram': 0, 'unresolved': 0}
+        for mv in mvs:
+            self.add(mv)
+
+    @classmethod
+    def from_meclis_json(cls, filenames: Iterable[str]) -> 'MPIndex':
+        """meclis/donem-parser.js (veya mv-parse-all.js) çıktılarından indeks oluşturur"""
+        index = cls()
+        for filename in filenames:
+            with open(filename, 'r', encoding='utf-8') as f:
+                for mv in json.load(f)['mvs']:
+                    index.add(mv)
+        logger.info(f"📇 Milletvekili indeksi hazır: {len(index.mvs)} kayıt")
+        return index
+
+    def add(self, mv: Dict[str, str]):
+        """Bir milletvekilini ada ve ad + ile göre indeksler"""
+        i = len(self.mvs)
+        self.mvs.append(mv)
+        name, city = normalize_name(mv['name']), normalize_name(mv.get('city') or '')
+        folded = fold_name(mv['name'])
+        for key in ((name, city), (name, '')):
+            self._exact[key].append(i)
+        # resolve() bu tabloda ili de Türkçe karakterlerden arındırarak arar
+        for key in ((folded, fold_name(mv.get('city') or '')), (folded, '')):
+            self._folded[key].append(i)
+
+        grams = ngrams(folded)
+        self._grams.append(grams)
+        for gram in grams:
+            self._inverted[gram].append(i)
+
+    def _unique(self, candidates: List[int]) -> Optional[int]:
+        # Aynı kişi (ad + il) birden fazla dönem dosyasında olabilir; en son yüklenen kayıt
+        # kullanılır. Farklı kişiler belirsizdir.
+        people = {(normalize_name(self.mvs[i]['name']), normalize_name(self.mvs[i].get('city') or ''))
+                  for i in candidates}
+        return candidates[-1] if len(people) == 1 else None
+
+    def _lookup(self, table: Dict[Tuple[str, str], List[int]], name: str, city: str) -> Optional[int]:
+        if city:
+            found = self._unique(table.get((name, city), []))
+            if found is not None:
+                return found
+        return self._unique(table.get((name, ''), []))
+
+    def _ngram_lookup(self, folded: str, city: str) -> Optional[int]:
+        """Ortak 3-gram sayısına göre en benzer adayı bulur"""
+        query = ngrams(folded)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in query:
+            for i in self._inverted.get(gram, ()):
+                shared[i] += 1
+
+        best, best_score, tied = None, MIN_SIMILARITY, False
+        for i, count in shared.items():
+            score = 2 * count / (len(query) + len(self._grams[i]))
+            # Aynı ildeki aday eşit puanda öne geçer
+            if city and normalize_name(self.mvs[i].get('city') or '') == city:
+                score += 0.01
+            if score > best_score:
+                best, best_score, tied = i, score, False
+            elif score == best_score and best is not None:
+                if self._unique([best, i]) is None:
+                    tied = True
+                best = max(best, i)
+        return None if tied else best
+
+    def resolve(self, ad: str, il: str = '') -> Optional[Dict[str, str]]:
+        """
+        Teklif sahibi adını milletvekili kaydına eşler
+
+        Returns:
+            Milletvekili kaydı (name, city, party, id) veya None
+        """
+        city = normalize_name(il) if il else ''
+        name, folded = normalize_name(ad), fold_name(ad)
+        found = self._lookup(self._exact, name, city)
+        if found is not None:
+            self.stats['exact'] += 1
+            return self.mvs[found]
+
+        found = self._lookup(self._folded, folded, city and fold_name(il))
+        if found is not None:
+            self.stats['folded'] += 1
+            return self.mvs[found]
+
+        # Ad birebir bulunduysa ama birden fazla kişiye aitse tahmin yapılmaz
+        if (folded, '') not in self._folded:
+            found = self._ngram_lookup(folded, city)
+            if found is not None:
+                self.stats['ngram'] += 1
+                return self.mvs[found]
+
+        self.stats['unresolved'] += 1
+        return None
+
+    def resolve_proposers(self, text: str) -> List[Dict[str, str]]:
+        """
+        parse_proposers sonucunu eşleşen milletvekilinin adı ve sicil no'su ile zenginleştirir
+
+        Eşleşen kişilerin 'ad' alanı listedeki yazımla değiştirilir ve 'sicil' eklenir;
+        böylece Graph Commons node adı meclis-nodes.js ile aynı olur.
+        """
+        proposers = parse_proposers(text)
+        for proposer in proposers:
+            mv = self.resolve(proposer['ad'], proposer['il'])
+            if mv is not None:
+                proposer['ad'] = mv['name']
+                proposer['sicil'] = mv['id']
+        return proposers
+
+    def log_stats(self):
+        """Eşleştirme istatistiklerini çalıştırma raporuna yazar"""
+        total = sum(self.stats.values())
+        if not total:
+            return
+        logger.info(f"  • Milletvekili eşleştirme: {total - self.stats['unresolved']}/{total} "
+                    f"(tam {self.stats['exact']}, karakter farkı {self.stats['folded']}, "
+                    f"3-gram {self.stats['ngram']}, bulunamayan {self.stats['unresolved']})")
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S')
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mv-file', action='append', required=True, help='meclis/donem-parser.js çıktısı')
+    parser.add_argument('text', help='Teklif sahipleri metni')
+    args = parser.parse_args()
+
+    index = MPIndex.from_meclis_json(args.mv_file)
+    for proposer in index.resolve_proposers(args.text):
+        logger.info(f"  • {proposer['ad']} ({proposer['il']}): {proposer.get('sicil', 'bulunamadı')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Sorgu Endpoint Yakalama
+Chrome DevTools performance log'ları üzerinden sorgu formunun ve sayfalamanın
+arka planda yaptığı istekleri yakalar, sayfa parametresini tespit eder ve
+endpoint'i tarayıcı olmadan (requests + tarayıcı cookie'leri) tekrar oynatır.
+"""
+
+import os
+import re
+import json
+import logging
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+if TYPE_CHECKING:  # requests sadece oturum kurulurken import edilir
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Sabitler
+DATA_DIR = "data"
+ENDPOINT_FILE = f"{DATA_DIR}/sorgu_endpoint.json"
+ALLOWED_HOST_SUFFIX = "tbmm.gov.tr"
+TIMEOUT = 30
+
+# Sayfa parametresi olabilecek alan isimleri (diff yapılamadığında)
+PAGE_PARAM_NAMES = ['page', 'pageindex', 'pagenumber', 'sayfa', 'start', 'offset', 'skip', '__eventargument']
+
+# Tekrar oynatmada kopyalanmayacak header'lar
+SKIPPED_HEADERS = {'content-length', 'cookie', 'host', 'accept-encoding', 'connection'}
+
+HIDDEN_INPUT_PATTERN = re.compile(r'<input[^>]*type=["\']hidden["\'][^>]*>', re.IGNORECASE)
+ATTR_PATTERN = re.compile(r'(name|value)=["\']([^"\']*)["\']', re.IGNORECASE)
+# ASP.NET UpdatePanel cevaplarındaki gizli alanlar: |hiddenField|__VIEWSTATE|deger|
+DELTA_HIDDEN_PATTERN = re.compile(r'\|hiddenField\|([^|]+)\|([^|]*)\|')
+
+
+def enable_performance_logging(chrome_options):
+    """Chrome'un network olaylarını performance log'una yazmasını sağlar"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def drain_requests(driver) -> List[Dict]:
+    """
+    Performance log'unu boşaltır ve aday istekleri döndürür
+
+    Aday istekler: tbmm.gov.tr'ye giden XHR/Fetch istekleri ile POST edilen
+    dokümanlar (ASP.NET postback). Her çağrı sadece son çağrıdan sonraki
+    istekleri döndürür.
+    """
+    captured = {}
+    for entry in driver.get_log('performance'):
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+
+        method = message.get('method')
+        params = message.get('params', {})
+        request_id = params.get('requestId')
+
+        if method == 'Network.requestWillBeSent':
+            request = params.get('request', {})
+            request_type = params.get('type')
+            if request_type not in ('XHR', 'Fetch', 'Document'):
+                continue
+            if request_type == 'Document' and request.get('method') != 'POST':
+                continue
+            if not (urlsplit(request.get('url', '')).hostname or '').endswith(ALLOWED_HOST_SUFFIX):
+                continue
+            captured[request_id] = {
+                'id': request_id,
+                'url': request['url'],
+                'method': request.get('method', 'GET'),
+                'headers': request.get('headers', {}),
+                'post_data': request.get('postData'),
+                'has_post_data': request.get('hasPostData', False),
+                'type': request_type,
+            }
+        elif method == 'Network.responseReceived' and request_id in captured:
+            response = params.get('response', {})
+            captured[request_id]['status'] = response.get('status')
+            captured[request_id]['mime_type'] = response.get('mimeType', '')
+
+    results = []
+    for request in captured.values():
+        if request.get('status') != 200:
+            continue
+        # Büyük gövdeler log'a yazılmaz, CDP üzerinden ayrıca istenir
+        if request['has_post_data'] and request['post_data'] is None:
+            try:
+                request['post_data'] = driver.execute_cdp_cmd(
+                    'Network.getRequestPostData', {'requestId': request['id']}
+                )['postData']
+            except Exception as e:
+                logger.debug(f"  POST gövdesi alınamadı: {e}")
+                continue
+        results.append(request)
+
+    logger.info(f"🛰️  {len(results)} aday istek yakalandı")
+    return results
+
+
+def _split_request(request: Dict) -> Tuple[str, str, Dict]:
+    """İsteği (temel URL, gövde tipi, parametreler) olarak ayırır"""
+    parts = urlsplit(request['url'])
+    base_url = urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+
+    if request['method'] == 'GET':
+        return base_url, 'query', dict(parse_qsl(parts.query, keep_blank_values=True))
+
+    content_type = {k.lower(): v for k, v in request['headers'].items()}.get('content-type', '')
+    body = request.get('post_data') or ''
+    if 'json' in content_type:
+        try:
+            payload = json.loads(body)
+            if isinstance(payload, dict):
+                return request['url'], 'json', payload
+        except ValueError:
+            pass
+    return request['url'], 'form', dict(parse_qsl(body, keep_blank_values=True))
+
+
+def _page_template(old, new) -> Optional[Tuple[str, int, int]]:
+    """
+    İki değer arasında tek bir sayı değişiyorsa (şablon, eski sayı, yeni sayı) döndürür
+
+    Örn: "Page$1" -> "Page$2" için ("Page${page}", 1, 2)
+    """
+    old_text, new_text = str(old), str(new)
+    if re.sub(r'\d+', '{}', old_text) != re.sub(r'\d+', '{}', new_text):
+        return None
+
+    old_numbers = re.findall(r'\d+', old_text)
+    new_numbers = re.findall(r'\d+', new_text)
+    changed = [i for i, (a, b) in enumerate(zip(old_numbers, new_numbers)) if a != b]
+    if len(changed) != 1:
+        return None
+
+    # Değişen sayıyı {page} olarak bırak, diğerlerini sabitle
+    index = changed[0]
+    pieces = re.split(r'\d+', new_text)
+    template = pieces[0] + ''.join(
+        ('{page}' if i == index else number) + pieces[i + 1] for i, number in enumerate(new_numbers)
+    )
+    return template, int(old_numbers[index]), int(new_numbers[index])
+
+
+def _find_page_param(first: Dict, second: Dict) -> Optional[Dict]:
+    """İki sayfa isteğinin parametrelerini karşılaştırarak sayfa parametresini bulur"""
+    for key, value in second.items():
+        old = first.get(key)
+        if old is None or old == value:
+            continue
+        found = _page_template(old, value)
+        if found:
+            template, old_number, new_number = found
+            return {'key': key, 'template': template, 'value': new_number,
+                    'step': new_number - old_number, 'is_int': isinstance(value, int)}
+
+    # Diff çalışmadıysa bilinen isimlerden tek sayı içeren alanı kullan
+    for key, value in second.items():
+        if key.lower() not in PAGE_PARAM_NAMES:
+            continue
+        numbers = re.findall(r'\d+', str(value))
+        if len(numbers) == 1:
+            return {'key': key, 'template': re.sub(r'\d+', '{page}', str(value)), 'value': int(numbers[0]),
+                    'step': 1, 'is_int': isinstance(value, int)}
+    return None
+
+
+def discover_endpoint(submit_requests: List[Dict], next_requests: List[Dict]) -> Optional[Dict]:
+    """
+    Sorgu gönderimi ve 2. sayfaya geçiş sırasında yakalanan isteklerden
+    tekrar oynatılabilir endpoint tanımını çıkarır
+    """
+    if not next_requests:
+        logger.info("🛰️  Sayfalama isteği yakalanamadı")
+        return None
+
+    # JSON dönen istekleri tercih et, yoksa son isteği kullan
+    candidates = sorted(next_requests, key=lambda r: 'json' in r.get('mime_type', ''))
+    next_request = candidates[-1]
+    url, kind, params = _split_request(next_request)
+
+    first_params = {}
+    for request in reversed(submit_requests):
+        submit_url, submit_kind, submit_params = _split_request(request)
+        if submit_url == url and submit_kind == kind:
+            first_params = submit_params
+            break
+
+    page_param = _find_page_param(first_params, params)
+    if not page_param:
+        logger.info(f"🛰️  Sayfa parametresi tespit edilemedi: {url}")
+        return None
+
+    headers = {k: v for k, v in next_request['headers'].items()
+               if not k.startswith(':') and k.lower() not in SKIPPED_HEADERS}
+
+    endpoint = {
+        'url': url,
+        'method': next_request['method'],
+        'kind': kind,
+        'headers': headers,
+        'params': params,
+        'page_param': page_param,
+        'mime_type': next_request.get('mime_type', ''),
+    }
+    logger.info(f"🛰️  Endpoint bulundu: {next_request['method']} {url} (sayfa: {page_param['key']})")
+    return endpoint
+
+
+def save_endpoint(endpoint: Dict, filename: str = ENDPOINT_FILE):
+    """Endpoint tanımını sonraki çalıştırmalar için kaydeder"""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(endpoint, f, ensure_ascii=False, indent=2)
+    logger.info(f"💾 Endpoint kaydedildi: {filename}")
+
+
+def load_endpoint(filename: str = ENDPOINT_FILE) -> Optional[Dict]:
+    """Kaydedilmiş endpoint tanımını yükler"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def build_session(driver, endpoint: Dict) -> 'requests.Session':
+    """
+    Tarayıcının cookie'leri ve user-agent'ı ile bir HTTP oturumu oluşturur
+
+    driver None ise (tarayıcısız çalıştırma) sadece kaydedilen header'lar kullanılır.
+    """
+    import requests
+
+    session = requests.Session()
+    session.headers.update(endpoint['headers'])
+    if driver is None:
+        return session
+    session.headers.setdefault('User-Agent', driver.execute_script('return navigator.userAgent'))
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+    return session
+
+
+def extract_hidden_fields(text: str) -> Dict[str, str]:
+    """Cevaptaki gizli form alanlarını (örn: __VIEWSTATE) çıkarır"""
+    fields = {}
+    for tag in HIDDEN_INPUT_PATTERN.findall(text):
+        attrs = {name.lower(): value for name, value in ATTR_PATTERN.findall(tag)}
+        if 'name' in attrs:
+            fields[attrs['name']] = attrs.get('value', '')
+    fields.update(DELTA_HIDDEN_PATTERN.findall(text))
+    return fields
+
+
+def fetch_endpoint_page(session: 'requests.Session', endpoint: Dict, page_num: int,
+                        state: Optional[Dict[str, str]] = None) -> Tuple[str, str]:
+    """
+    Endpoint'ten belirtilen sayfayı çeker
+
+    Args:
+        page_num: Sayfa numarası (1'den başlar)
+        state: Önceki cevaptan gelen gizli form alanları (postback endpoint'leri için)
+
+    Returns:
+        (cevap metni, content-type)
+    """
+    page_param = endpoint['page_param']
+    # Kaydedilen değer 2. sayfaya ait
+    number = page_param['value'] + (page_num - 2) * page_param['step']
+    value = page_param['template'].replace('{page}', str(number))
+
+    params = dict(endpoint['params'])
+    params[page_param['key']] = int(value) if page_param['is_int'] else value
+    if state and endpoint['kind'] == 'form':
+        params.update({k: v for k, v in state.items() if k in params})
+
+    if endpoint['method'] == 'GET':
+        response = session.get(endpoint['url'], params=params, timeout=TIMEOUT)
+    elif endpoint['kind'] == 'json':
+        response = session.post(endpoint['url'], json=params, timeout=TIMEOUT)
+    else:
+        response = session.post(endpoint['url'], data=urlencode(params), timeout=TIMEOUT)
+
+    response.raise_for_status()
+    return response.text, response.headers.get('Content-Type', '')
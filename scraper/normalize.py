@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Normalizasyon Yardımcıları
+Bir çalıştırma boyunca tekrar tekrar işlenen değerler (linkler, dönem/durum
+etiketleri, teklif sahibi önekleri) için sınırlı boyutlu LRU cache'li
+normalizasyon fonksiyonları. Kısa değerler intern edilerek aynı string'in
+tek kopyası paylaşılır.
+"""
+
+import re
+import sys
+import logging
+from functools import lru_cache
+from typing import List, Dict, Optional
+from urllib.parse import urljoin
+
+logger = logging.getLogger(__name__)
+
+# Sabitler
+BASE_URL = "https://www.tbmm.gov.tr"
+CACHE_SIZE = 4096
+# Bu uzunluktan uzun metinler (özetler, teklif metinleri) cache'lenmez
+MAX_CACHED_LENGTH = 256
+
+_TR_UPPER = str.maketrans({'i': 'İ', 'ı': 'I'})
+_TR_LOWER = str.maketrans({'İ': 'i', 'I': 'ı'})
+_TR_FOLD = str.maketrans('ÇĞİÖŞÜÂÎÛ', 'CGIOSUAIU')
+
+# Teklif sahibi: [unvan] İl  Milletvekili Ad SOYAD
+PROPOSER_PATTERN = re.compile(
+    r'(?:^|,)\s*(?P<unvan>[^,]*?)\s*'
+    r'(?P<il>[A-ZÇĞİÖŞÜ][a-zçğıöşü]+)\s+Milletvekili\s+'
+    r'(?P<ad>(?:[A-ZÇĞİÖŞÜ][a-zçğıöşü]+\s+)+'
+    r'[A-ZÇĞİÖŞÜ]{2,}(?:\s+[A-ZÇĞİÖŞÜ]{2,})*)'
+    r'(?=[A-ZÇĞİÖŞÜ][a-zçğıöşü]|[\s,\d]|$)'
+)
+OTHER_SIGNERS_PATTERN = re.compile(r'\bve\s+(\d+)\s+Milletvekili')
+NAME_SEPARATOR_PATTERN = re.compile(r'\W+')
+ROLE_PATTERN = re.compile(
+    r'^(?P<parti>.*?)\s*(?P<gorev>(?:Eş\s+)?Genel\s+Başkan(?:ı|vekili)|Grup\s+Başkan(?:ı|vekili))$'
+)
+
+_cached_functions = {}
+
+
+def _register(func):
+    """Fonksiyonu cache istatistiklerine dahil eder"""
+    _cached_functions[func.__name__.lstrip('_')] = func
+    return func
+
+
+@_register
+@lru_cache(maxsize=CACHE_SIZE)
+def _intern(text: str) -> str:
+    return sys.intern(text)
+
+
+def intern_value(text: Optional[str]) -> Optional[str]:
+    """Kısa değerleri intern eder, böylece tekrar eden değerler tek kopya tutulur"""
+    if not text or len(text) > MAX_CACHED_LENGTH:
+        return text
+    return _intern(text)
+
+
+@_register
+@lru_cache(maxsize=CACHE_SIZE)
+def canonical_url(href: str, base: str = BASE_URL) -> str:
+    """Relative/absolute link'i tek bir mutlak forma çevirir"""
+    return sys.intern(urljoin(base, href.strip()))
+
+
+@_register
+@lru_cache(maxsize=CACHE_SIZE)
+def _tr_upper(text: str) -> str:
+    return text.translate(_TR_UPPER).upper()
+
+
+@_register
+@lru_cache(maxsize=CACHE_SIZE)
+def _tr_lower(text: str) -> str:
+    return text.translate(_TR_LOWER).lower()
+
+
+def tr_upper(text: str) -> str:
+    """Türkçe kurallarıyla büyük harfe çevirir (i -> İ, ı -> I)"""
+    if len(text) > MAX_CACHED_LENGTH:
+        return text.translate(_TR_UPPER).upper()
+    return _tr_upper(text)
+
+
+def tr_lower(text: str) -> str:
+    """Türkçe kurallarıyla küçük harfe çevirir (İ -> i, I -> ı)"""
+    if len(text) > MAX_CACHED_LENGTH:
+        return text.translate(_TR_LOWER).lower()
+    return _tr_lower(text)
+
+
+@_register
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_unvan(unvan: str) -> Dict[str, str]:
+    """
+    Teklif sahibi unvanını parti ve göreve ayırır
+
+    Örn: "İYİ Parti Grup Başkanvekili" -> {'parti': 'İYİ Parti', 'gorev': 'Grup Başkanvekili'}
+    """
+    match = ROLE_PATTERN.match(unvan)
+    if match:
+        return {'parti': intern_value(match.group('parti')), 'gorev': intern_value(match.group('gorev'))}
+    return {'parti': '', 'gorev': intern_value(unvan)}
+
+
+def parse_proposers(text: str) -> List[Dict[str, str]]:
+    """
+    Teklif sahipleri metnini (örn: "Rize  Milletvekili Harun MERTOĞLU, Giresun
+    Milletvekili Nazım ELMAS ve 120 Milletvekili...") kişilere ayırır
+    """
+    proposers = []
+    for match in PROPOSER_PATTERN.finditer(text):
+        proposer = {
+            'ad': intern_value(re.sub(r'\s+', ' ', match.group('ad'))),
+            'il': intern_value(match.group('il')),
+        }
+        proposer.update(parse_unvan(match.group('unvan')))
+        proposers.append(proposer)
+    return proposers
+
+
+@_register
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_name(name: str) -> str:
+    """
+    Kişi adını karşılaştırma için tek forma çevirir
+
+    Örn: "Harun  Mertoğlu" ve "HARUN MERTOĞLU" -> "HARUN MERTOĞLU"
+    """
+    return sys.intern(' '.join(NAME_SEPARATOR_PATTERN.sub(' ', tr_upper(name)).split()))
+
+
+@_register
+@lru_cache(maxsize=CACHE_SIZE)
+def fold_name(name: str) -> str:
+    """Normalize adı Türkçe karakterlerden arındırır (ŞAHİN -> SAHIN); yazım farklarına karşı"""
+    return normalize_name(name).translate(_TR_FOLD)
+
+
+def count_other_signers(text: str) -> int:
+    """"ve 120 Milletvekili" gibi ek imza sayısını döndürür"""
+    match = OTHER_SIGNERS_PATTERN.search(text)
+    return int(match.group(1)) if match else 0
+
+
+def cache_stats() -> Dict[str, Dict[str, float]]:
+    """Her cache için isabet, ıska, boyut ve isabet oranını döndürür"""
+    stats = {}
+    for name, func in _cached_functions.items():
+        info = func.cache_info()
+        total = info.hits + info.misses
+        stats[name] = {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'hit_rate': info.hits / total if total else 0.0,
+        }
+    return stats
+
+
+def log_cache_stats():
+    """Cache istatistiklerini çalıştırma raporuna yazar"""
+    stats = {name: s for name, s in cache_stats().items() if s['hits'] or s['misses']}
+    if not stats:
+        return
+    logger.info("  • Normalizasyon cache'leri:")
+    for name, s in stats.items():
+        logger.info(f"    - {name}: %{s['hit_rate'] * 100:.1f} isabet "
+                    f"({s['hits']} isabet, {s['misses']} ıska, {s['size']} kayıt)")
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Scraper Profiler
+Scraper'lar --profile ile çalıştırıldığında ana thread'i ayrı bir thread'den
+belirli aralıklarla örnekleyen düşük maliyetli bir profiler. Her örnek o anki
+pipeline aşamasıyla (driver, form, sayfalama, parse, kaydet...) etiketlenir.
+
+Her örnekte ana thread'in CPU süresi duvar saatiyle karşılaştırılır; CPU
+harcamayan örnekler, yığında selenium varsa "tarayıcı bekleme", requests/urllib3
+varsa "http bekleme" (--no-browser, endpoint, PDF), yoksa "bekleme" (sleep)
+olarak ayrılır. Selenium da chromedriver ile urllib3 üzerinden konuştuğu için
+önce selenium kontrol edilir. Çıktılar:
+
+- <ad>.collapsed: flamegraph.pl / speedscope ile açılabilen collapsed stack
+- <ad>.speedscope.json: aşama başına bir profil (https://www.speedscope.app)
+- <ad>.summary.json: aşama başına süreler ve en çok zaman alan fonksiyonlar
+
+Profiler kapalıyken aşama etiketleri sadece bir bayrak kontrolüdür.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sabitler
+DATA_DIR = "data"
+PROFILE_DIR = os.getenv('PROFILE_DIR', f"{DATA_DIR}/profile")
+PROFILE_INTERVAL = float(os.getenv('PROFILE_INTERVAL', '0.01'))  # Saniye
+TOP_N = 10
+# Örnek aralığındaki CPU süresi bu oranın altındaysa thread bloklanmış sayılır
+BLOCKED_CPU_RATIO = 0.5
+BROWSER_MODULES = (f'{os.sep}selenium{os.sep}',)
+HTTP_MODULES = (f'{os.sep}requests{os.sep}', f'{os.sep}urllib3{os.sep}')
+
+BROWSER_WAIT = '[tarayıcı bekleme]'
+HTTP_WAIT = '[http bekleme]'
+OTHER_WAIT = '[bekleme]'
+WAITS = (BROWSER_WAIT, HTTP_WAIT, OTHER_WAIT)
+
+_profiler: Optional['SamplingProfiler'] = None
+_stages: List[str] = ['main']
+
+
+class SamplingProfiler:
+    """Ana thread'i arka plandaki bir thread'den örnekleyen profiler"""
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        self.interval = interval
+        self.thread_id = threading.main_thread().ident
+        # (aşama, kod nesneleri kökten yaprağa, bekleme türü) -> (örnek sayısı, toplam süre)
+        self.samples: Counter = Counter()
+        self.weights: Dict[Tuple, float] = defaultdict(float)
+        # Aşama başına duvar saati ve CPU süresi (en içteki aşamaya yazılır)
+        self.stage_wall: Dict[str, float] = defaultdict(float)
+        self.stage_cpu: Dict[str, float] = defaultdict(float)
+        self._mark = (time.perf_counter(), time.thread_time())
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+        try:
+            self._cpu_clock = time.pthread_getcpuclockid(self.thread_id)
+        except (AttributeError, OSError):  # Linux dışı platformlar
+            self._cpu_clock = None
+
+    def start(self):
+        self._mark = (time.perf_counter(), time.thread_time())
+        self._thread.start()
+
+    def stop(self):
+        self.account(_stages[-1])
+        self._stop.set()
+        self._thread.join()
+
+    def account(self, stage: str):
+        """Son aşama değişikliğinden bu yana geçen süreyi aşamaya yazar (ana thread'den çağrılır)"""
+        wall, cpu = time.perf_counter(), time.thread_time()
+        self.stage_wall[stage] += wall - self._mark[0]
+        self.stage_cpu[stage] += cpu - self._mark[1]
+        self._mark = (wall, cpu)
+
+    def _run(self):
+        last_wall = time.perf_counter()
+        last_cpu = self._thread_cpu()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            wall, cpu = time.perf_counter(), self._thread_cpu()
+            elapsed = wall - last_wall
+            if frame is None:
+                break
+
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            codes.reverse()
+
+            wait = ''
+            if cpu is not None and cpu - last_cpu < elapsed * BLOCKED_CPU_RATIO:
+                wait = self._wait_kind(codes)
+
+            key = (_stages[-1], tuple(codes), wait)
+            self.samples[key] += 1
+            self.weights[key] += elapsed
+            last_wall, last_cpu = wall, cpu
+
+    @staticmethod
+    def _wait_kind(codes) -> str:
+        """Bloklanan örneğin yığınına göre bekleme türü"""
+        files = [code.co_filename for code in codes]
+        if any(m in f for f in files for m in BROWSER_MODULES):
+            return BROWSER_WAIT
+        if any(m in f for f in files for m in HTTP_MODULES):
+            return HTTP_WAIT
+        return OTHER_WAIT
+
+    def _thread_cpu(self) -> Optional[float]:
+        if self._cpu_clock is None:
+            return None
+        return time.clock_gettime(self._cpu_clock)
+
+    # --- Çıktılar ---
+
+    @staticmethod
+    def _frame_name(code) -> str:
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _stacks(self):
+        """(aşama, çerçeve adları, örnek sayısı, süre) üretir; bekleme türü yaprak çerçeve olur"""
+        for key, count in self.samples.items():
+            stage, codes, wait = key
+            names = [self._frame_name(code) for code in codes]
+            if wait:
+                names.append(wait)
+            yield stage, names, count, self.weights[key]
+
+    def write_collapsed(self, path: str):
+        lines = Counter()
+        for stage, names, count, _ in self._stacks():
+            lines[';'.join([stage] + names)] += count
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in lines.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def write_speedscope(self, path: str, name: str):
+        frames, index = [], {}
+        profiles = {}
+        for stage, names, _, seconds in self._stacks():
+            stack = []
+            for frame_name in names:
+                if frame_name not in index:
+                    index[frame_name] = len(frames)
+                    frames.append({'name': frame_name})
+                stack.append(index[frame_name])
+            profile = profiles.setdefault(stage, {
+                'type': 'sampled', 'name': stage, 'unit': 'milliseconds',
+                'startValue': 0, 'endValue': 0, 'samples': [], 'weights': [],
+            })
+            profile['samples'].append(stack)
+            profile['weights'].append(round(seconds * 1000, 3))
+            profile['endValue'] = round(profile['endValue'] + seconds * 1000, 3)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                '$schema': 'https://www.speedscope.app/file-format-schema.json',
+                'name': name,
+                'exporter': 'tbmm-scraper-profiler',
+                'shared': {'frames': frames},
+                'profiles': list(profiles.values()),
+            }, f, ensure_ascii=False)
+
+    def summary(self, top_n: int = TOP_N) -> Dict[str, Dict]:
+        """Aşama başına duvar/CPU/bekleme süreleri ve en çok zaman alan fonksiyonlar"""
+        waits = defaultdict(lambda: defaultdict(float))
+        self_time = defaultdict(Counter)
+        for stage, names, _, seconds in self._stacks():
+            leaf = names[-1]
+            if leaf in WAITS:
+                waits[stage][leaf] += seconds
+                # Bloklanan süreyi bekleyen Python fonksiyonuna da yaz
+                leaf = f"{leaf} {names[-2]}" if len(names) > 1 else leaf
+            self_time[stage][leaf] += seconds
+
+        stats = {}
+        for stage in sorted(set(self.stage_wall) | set(self_time), key=lambda s: -self.stage_wall.get(s, 0)):
+            stats[stage] = {
+                'wall': round(self.stage_wall.get(stage, 0.0), 3),
+                'cpu': round(self.stage_cpu.get(stage, 0.0), 3),
+                'tarayici_bekleme': round(waits[stage][BROWSER_WAIT], 3),
+                'http_bekleme': round(waits[stage][HTTP_WAIT], 3),
+                'diger_bekleme': round(waits[stage][OTHER_WAIT], 3),
+                'top': [(name, round(seconds, 3)) for name, seconds in self_time[stage].most_common(top_n)],
+            }
+        return stats
+
+    def report(self, name: str, directory: str = PROFILE_DIR, top_n: int = TOP_N) -> Dict[str, Dict]:
+        """Çıktı dosyalarını yazar ve özeti loglar"""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, name)
+        self.write_collapsed(f"{base}.collapsed")
+        self.write_speedscope(f"{base}.speedscope.json", name)
+        stats = self.summary(top_n)
+        with open(f"{base}.summary.json", 'w', encoding='utf-8') as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2)
+
+        logger.info("\n⏱️ Profil özeti (aşama: duvar / CPU / tarayıcı / http / diğer bekleme):")
+        for stage, s in stats.items():
+            logger.info(f"  • {stage}: {s['wall']:.2f}s / {s['cpu']:.2f}s / "
+                        f"{s['tarayici_bekleme']:.2f}s / {s['http_bekleme']:.2f}s / {s['diger_bekleme']:.2f}s")
+            for func, seconds in s['top']:
+                logger.info(f"    - {seconds:.2f}s {func}")
+        logger.info(f"💾 Profil kaydedildi: {base}.collapsed, {base}.speedscope.json, {base}.summary.json")
+        return stats
+
+
+class stage:
+    """
+    Kod bloğunu veya fonksiyonu pipeline aşamasıyla etiketler
+
+    Örn: ``with stage('parse'): ...`` veya ``@stage('kaydet')``
+    """
+
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        if _profiler is not None:
+            _profiler.account(_stages[-1])
+            _stages.append(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        if _profiler is not None and len(_stages) > 1:
+            _profiler.account(_stages[-1])
+            _stages.pop()
+        return False
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
+
+
+@contextmanager
+def profile(name: str, enabled: bool = True, interval: float = PROFILE_INTERVAL):
+    """Bloğu profiller ve çıkışta raporu yazar; enabled=False ise hiçbir şey yapmaz"""
+    global _profiler
+    if not enabled:
+        yield None
+        return
+
+    _profiler = SamplingProfiler(interval)
+    _profiler.start()
+    logger.info(f"⏱️ Profiler açık (her {interval * 1000:.0f} ms'de bir örnek)")
+    try:
+        yield _profiler
+    finally:
+        profiler, _profiler = _profiler, None
+        profiler.stop()
+        del _stages[1:]
+        profiler.report(name)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Kayıt Modelleri
+Scraper'ların ürettiği kayıtlar için sabit şemalı, __slots__ kullanan hafif
+sınıflar ve JSON okuma/yazma yardımcıları. Büyük metin alanları (teklif
+metni, sorgu satırının durum metni) sıkıştırılmış metin deposuna (blob_store)
+alınıp sadece erişildiğinde açılabilir; JSON yazımı orjson kuruluysa onu
+kullanır.
+"""
+
+import os
+import re
+import json
+import logging
+from typing import List, Dict, Optional, Iterable, Iterator, Union
+
+import blob_store
+from normalize import intern_value
+
+try:
+    import orjson
+except ImportError:  # orjson opsiyonel, yoksa standart json kullanılır
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# "Son Durumu : KOMİSYONDAMetni..." -> KOMİSYONDA (değer bitişik yazılan kelimeden önce biter)
+SON_DURUM_PATTERN = re.compile(
+    r'Son\s+Durumu\s*:\s*((?:[A-ZÇĞİÖŞÜ]+ )*[A-ZÇĞİÖŞÜ]+?)(?=[A-ZÇĞİÖŞÜ][a-zçğıöşü]|[^A-Za-zÇĞİÖŞÜçğıöşü]|$)'
+)
+
+
+class SorguRecord:
+    """Sorgu sonuç tablosundaki bir satır; durum metni istenirse metin deposuna alınır"""
+
+    __slots__ = ('sira', 'esas_no', 'tarih', 'baslik', 'link', 'donem', '_durum', 'durum_ref',
+                 'cekme_tarihi', 'extra')
+
+    # JSON çıktısındaki alan sırası
+    FIELDS = ('sira', 'esas_no', 'tarih', 'baslik', 'link', 'donem', 'durum')
+
+    def __init__(self, sira: str = '', esas_no: str = '', tarih: str = '', baslik: str = '', link: str = '',
+                 donem: str = '', durum: Optional[str] = '', cekme_tarihi: str = '',
+                 extra: Optional[Dict[str, str]] = None, durum_ref: Optional[str] = None):
+        self.sira = sira
+        self.esas_no = esas_no
+        self.tarih = tarih
+        self.baslik = baslik
+        self.link = link
+        self.donem = donem
+        # Durum metni 300-1000 karakterdir ve kayıtların büyük kısmını oluşturur
+        self._durum = durum
+        self.durum_ref = durum_ref
+        self.cekme_tarihi = cekme_tarihi
+        # Şemaya uymayan kolonlar (field_3 gibi)
+        self.extra = extra
+
+    @property
+    def durum(self) -> str:
+        """Durum metni; depoya alındıysa her erişimde depodan açılır"""
+        if self._durum is None and self.durum_ref:
+            return blob_store.default_store().get(self.durum_ref)
+        return self._durum or ''
+
+    @durum.setter
+    def durum(self, value: str):
+        self._durum = value
+        self.durum_ref = None
+
+    def offload(self, store: Optional['blob_store.BlobStore'] = None):
+        """Durum metnini metin deposuna yazar (aynı metin bir kez saklanır) ve bellekten bırakır"""
+        if not self._durum:
+            return
+        self.durum_ref = (store or blob_store.default_store()).put(self._durum)
+        self._durum = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'SorguRecord':
+        """Sorgu JSON'u veya indeks kaydından kayıt oluşturur; kısa değerler intern edilir"""
+        record = cls(cekme_tarihi=data.get('cekme_tarihi', ''))
+        for key, value in data.items():
+            if key in cls.FIELDS:
+                setattr(record, key, intern_value(value))
+            elif key == 'durum_ref':
+                record.durum_ref, record._durum = value, None
+            elif key != 'cekme_tarihi':
+                if record.extra is None:
+                    record.extra = {}
+                record.extra[key] = value
+        return record
+
+    def to_dict(self, refs: bool = False) -> Dict[str, str]:
+        """
+        Boş alanları atlayarak JSON'a yazılacak sözlüğü döndürür
+
+        Args:
+            refs: Durum metni yerine depo referansını (durum_ref) yaz; indeks dosyası için
+        """
+        data = {}
+        for key in self.FIELDS:
+            if key == 'durum' and refs and self.durum_ref:
+                data['durum_ref'] = self.durum_ref
+            elif getattr(self, key):
+                data[key] = getattr(self, key)
+        if self.extra:
+            data.update(self.extra)
+        if self.cekme_tarihi:
+            data['cekme_tarihi'] = self.cekme_tarihi
+        return data
+
+    @property
+    def son_durum(self) -> str:
+        """Durum metnindeki "Son Durumu : X" değeri (örn: KOMİSYONDA)"""
+        match = SON_DURUM_PATTERN.search(self.durum)
+        return intern_value(match.group(1)) if match else ''
+
+
+class Proposal:
+    """Bir kanun teklifi; metin istenirse metin deposuna alınır ve erişildiğinde açılır"""
+
+    __slots__ = ('baslik', 'link', 'esas_no', 'donem_yasama_yili', '_metin', 'metin_ref')
+
+    def __init__(self, baslik: str = '', link: str = '', metin: Optional[str] = None,
+                 esas_no: str = '', donem_yasama_yili: str = '', metin_ref: Optional[str] = None):
+        self.baslik = baslik
+        self.link = link
+        self._metin = metin
+        self.esas_no = intern_value(esas_no)
+        self.donem_yasama_yili = intern_value(donem_yasama_yili)
+        self.metin_ref = metin_ref
+
+    @property
+    def metin(self) -> Optional[str]:
+        """Teklif metni; depoya alındıysa her erişimde depodan açılır"""
+        if self._metin is None and self.metin_ref:
+            return blob_store.default_store().get(self.metin_ref)
+        return self._metin
+
+    @metin.setter
+    def metin(self, value: Optional[str]):
+        self._metin = value
+        self.metin_ref = None
+
+    def offload(self, store: Optional['blob_store.BlobStore'] = None):
+        """Metni metin deposuna yazar (aynı metin bir kez saklanır) ve bellekten bırakır"""
+        if not self._metin:
+            return
+        self.metin_ref = (store or blob_store.default_store()).put(self._metin)
+        self._metin = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'Proposal':
+        """proposals.json veya indeks kaydından teklif oluşturur"""
+        return cls(
+            baslik=data.get('baslik', ''),
+            link=data.get('link', ''),
+            metin=data.get('metin'),
+            esas_no=data.get('esasNo', ''),
+            donem_yasama_yili=data.get('donemYasamaYili', ''),
+            metin_ref=data.get('metinRef'),
+        )
+
+    def to_dict(self, refs: bool = False) -> Dict[str, str]:
+        """
+        proposals.json formatındaki sözlüğü döndürür
+
+        Args:
+            refs: Metin yerine depo referansını (metinRef) yaz; indeks dosyası için
+        """
+        data = {'baslik': self.baslik, 'link': self.link}
+        if refs and self.metin_ref:
+            data['metinRef'] = self.metin_ref
+        else:
+            metin = self.metin
+            if metin is None:
+                return data
+            data['metin'] = metin
+        data['esasNo'] = self.esas_no
+        data['donemYasamaYili'] = self.donem_yasama_yili
+        return data
+
+
+Record = Union[SorguRecord, Proposal, Dict]
+
+
+def _encode(data: Dict) -> bytes:
+    """Tek bir kaydı indent=2 ile JSON'a çevirir"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def dump_records(records: Iterable[Record], filename: str) -> int:
+    """
+    Kayıtları json.dump(indent=2) ile aynı formatta, tek tek encode ederek yazar
+
+    Returns:
+        Yazılan kayıt sayısı
+    """
+    count = 0
+    with open(filename, 'wb') as f:
+        f.write(b'[')
+        for record in records:
+            data = record if isinstance(record, dict) else record.to_dict()
+            # Kayıt listenin içinde olduğu için her satır 2 boşluk içeri alınır
+            chunk = b'\n'.join(b'  ' + line for line in _encode(data).split(b'\n'))
+            f.write((b',\n' if count else b'\n') + chunk)
+            count += 1
+        f.write(b'\n]' if count else b']')
+    return count
+
+
+def index_path(filename: str) -> str:
+    """Kayıt dosyasının metinler yerine depo referanslarını tutan indeks kopyası"""
+    return os.path.splitext(filename)[0] + '.index.json'
+
+
+def dump_index(records: Iterable[Union[SorguRecord, Proposal]], filename: str) -> int:
+    """
+    Kayıtların metinlerini depoya alır ve metin yerine referanslarıyla yazar
+
+    Ana dosya yazıldıktan sonra çağrılır: metinler o sırada hâlâ bellekteyse
+    sadece bir kez sıkıştırılır, ana dosya için tekrar açılmaz.
+    """
+    def iter_refs():
+        for record in records:
+            record.offload()
+            yield record.to_dict(refs=True)
+
+    return dump_records(iter_refs(), filename)
+
+
+def load_records(filename: str, cls=SorguRecord) -> List[Record]:
+    """JSON dosyasındaki kayıtları verilen modele çevirerek yükler"""
+    with open(filename, 'rb') as f:
+        data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    return [cls.from_dict(item) for item in data]
+
+
+def iter_records(filename: str, cls=SorguRecord, chunk_size: int = 1 << 16) -> Iterator[Record]:
+    """
+    JSON dizisindeki kayıtları dosyanın tamamını okumadan tek tek üretir
+
+    Bellekte en fazla bir okuma bloğu ve bir kayıt tutulur; cls=None ise
+    sözlükler olduğu gibi döner.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f'JSON dizisi bekleniyordu: {filename}')
+        buffer = buffer[1:]
+        eof = False
+        while True:
+            buffer = buffer.lstrip().lstrip(',').lstrip()
+            if buffer.startswith(']'):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except ValueError:
+                # Kayıt bloğun sonunda bölünmüş; bir blok daha oku
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            yield cls.from_dict(item) if cls is not None else item
+            buffer = buffer[end:]
+
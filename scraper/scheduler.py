@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Scraper Zamanlayıcı (Daemon Modu)
+Cron ile her seferinde aynı ilk kayıtları çekmek yerine sürekli çalışır ve
+teklifleri durumlarına göre önceliklendirerek tekrar yoklar: işlemdeki ve yeni
+teklifler sık, sonuçlanmış teklifler (KANUNLAŞTI, GERİ ALINDI) seyrek veya hiç.
+Tüm yoklamalar saatlik ortak bir istek bütçesiyle sınırlandırılır.
+
+Kullanım:
+    python scheduler.py --mode sorgu     # Sorgu sayfası, durum bazlı parçalar
+    python scheduler.py --mode teklif    # Teklif listesi + tek tek detaylar
+"""
+
+import os
+import re
+import json
+import time
+import heapq
+import logging
+import argparse
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Callable, Iterable, Tuple
+
+from normalize import tr_upper
+from records import SON_DURUM_PATTERN, Proposal, load_records
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Sabitler
+DATA_DIR = "data"
+STATE_FILE = f"{DATA_DIR}/scheduler_state.json"
+STATS_FILE = f"{DATA_DIR}/scheduler_stats.json"
+REQUESTS_PER_HOUR = int(os.getenv('REQUESTS_PER_HOUR', '60'))
+DAEMON_MAX_RESULTS = int(os.getenv('DAEMON_MAX_RESULTS', '100'))
+STATS_EVERY = 10  # Kaç yoklamada bir istatistik yazılacağı
+
+HOUR = 3600
+# Öncelik sınıflarına göre yoklama aralıkları (saniye); None = bir daha yoklama
+POLL_INTERVALS = {
+    'liste': int(os.getenv('LIST_INTERVAL_MINUTES', '30')) * 60,
+    'aktif': 1 * HOUR,
+    'yeni': 3 * HOUR,
+    'diger': 24 * HOUR,
+    'sonuclandi': int(os.getenv('FINAL_INTERVAL_HOURS', '0')) * HOUR or None,
+    # Sonuçlanmış durumların sorgu parçaları: yeni sonuçlananlar 'sorgu:tumu' ile de yakalanır
+    'sonuclandi_parca': int(os.getenv('FINAL_SHARD_INTERVAL_DAYS', '7')) * 24 * HOUR,
+}
+ACTIVE_DURUMLAR = ['İŞLEMDE', 'KOMİSYONDA', 'GÜNDEMDE']
+FINAL_DURUMLAR = ['KANUNLAŞTI', 'GERİ ALINDI', 'REDDEDİLDİ', 'HÜKÜMSÜZ']
+RECENT_DAYS = 30
+# Detay metnindeki tarih: önce "... Tarihi: 10.08.2026" gibi etiketli, yoksa ilk tarih
+LABELED_DATE_PATTERN = re.compile(r'Tarih[i]?\s*:?\s*(\d{2})[./](\d{2})[./](\d{4})', re.IGNORECASE)
+DATE_PATTERN = re.compile(r'\b(\d{2})[./](\d{2})[./](\d{4})\b')
+
+
+def detect_durum(text: str) -> str:
+    """Metindeki son durumu (örn: KOMİSYONDA) bulur"""
+    if not text:
+        return ''
+    match = SON_DURUM_PATTERN.search(text)
+    if match:
+        return match.group(1)
+    upper = tr_upper(text)
+    for durum in ACTIVE_DURUMLAR + FINAL_DURUMLAR:
+        if durum in upper:
+            return durum
+    return ''
+
+
+def detect_tarih(text: str) -> str:
+    """Metindeki teklif tarihini gg/aa/yyyy olarak bulur"""
+    if not text:
+        return ''
+    match = LABELED_DATE_PATTERN.search(text) or DATE_PATTERN.search(text)
+    return '/'.join(match.groups()) if match else ''
+
+
+def priority_class(durum: str = '', tarih: str = '') -> str:
+    """Teklifin durum ve tarihine göre öncelik sınıfını belirler"""
+    if durum in FINAL_DURUMLAR:
+        return 'sonuclandi'
+    if durum in ACTIVE_DURUMLAR:
+        return 'aktif'
+    try:
+        if datetime.now() - datetime.strptime(tarih, '%d/%m/%Y') <= timedelta(days=RECENT_DAYS):
+            return 'yeni'
+    except ValueError:
+        pass
+    return 'diger'
+
+
+@dataclass
+class Target:
+    """Zamanlayıcıdaki bir yoklama hedefi (teklif veya liste/sorgu parçası)"""
+    key: str
+    sinif: str
+    durum: str = ''
+    tarih: str = ''
+    payload: Dict = field(default_factory=dict)
+    due: float = 0.0
+    last_polled: float = 0.0
+    polls: int = 0
+
+
+class RateBudget:
+    """Saatlik istek bütçesi (token bucket)"""
+
+    def __init__(self, requests_per_hour: int = REQUESTS_PER_HOUR):
+        self.rate = requests_per_hour / HOUR
+        self.capacity = max(1, requests_per_hour // 10)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, cost: int = 1):
+        """Bütçede yer açılana kadar bekler"""
+        self._refill()
+        while self.tokens < cost:
+            time.sleep((cost - self.tokens) / self.rate)
+            self._refill()
+        self.tokens -= cost
+
+
+# Yoklama fonksiyonu: hedefi yoklar, güncellenen/yeni bulunan hedefleri
+# (key, sinif veya None, durum, tarih, payload) olarak döndürür
+PollResult = Tuple[str, Optional[str], str, str, Dict]
+PollFn = Callable[[Target], Iterable[PollResult]]
+
+
+class Scheduler:
+    """Öncelik kuyruğu ile hedefleri zamanı geldikçe yoklayan daemon"""
+
+    def __init__(self, poll_fn: PollFn, budget: Optional[RateBudget] = None, state_file: str = STATE_FILE):
+        self.poll_fn = poll_fn
+        self.budget = budget or RateBudget()
+        self.state_file = state_file
+        self.targets: Dict[str, Target] = {}
+        self.queue: List[Tuple[float, str]] = []
+        self.total_polls = 0
+
+    def schedule(self, key: str, sinif: Optional[str] = None, durum: str = '', tarih: str = '',
+                 payload: Optional[Dict] = None, due: Optional[float] = None):
+        """
+        Hedefi ekler veya günceller ve bir sonraki yoklama zamanını belirler
+
+        Sırada bekleyen bir hedefin yoklaması ileri alınabilir ama ertelenmez; liste her yoklamada
+        henüz çekilmemiş teklifleri tekrar bildirse de bunlar ilk sıralarını korur.
+        """
+        target = self.targets.get(key)
+        if target is None:
+            target = self.targets[key] = Target(key=key, sinif='')
+            # Yeni hedefler hemen yoklanır
+            due = time.time() if due is None else due
+        previous = (target.sinif, target.durum)
+        target.durum = durum or target.durum
+        target.tarih = tarih or target.tarih
+        target.payload = payload or target.payload
+        target.sinif = sinif or priority_class(target.durum, target.tarih)
+
+        if due is None:
+            # Hiç yoklanmamış ve sınıfı/durumu değişmemiş hedefin sırası korunur
+            if target.due and not target.last_polled and (target.sinif, target.durum) == previous:
+                return
+            interval = POLL_INTERVALS[target.sinif]
+            if interval is None:
+                target.due = 0.0
+                return
+            due = (target.last_polled or time.time()) + interval
+        if target.due:
+            due = min(due, target.due)
+            if due == target.due:
+                return
+        target.due = due
+        heapq.heappush(self.queue, (due, key))
+
+    def _pop_due(self) -> Optional[Target]:
+        """Sırası gelen hedefi döndürür; eski (güncelliğini yitirmiş) kuyruk girdilerini atlar"""
+        while self.queue:
+            due, key = self.queue[0]
+            target = self.targets.get(key)
+            if target is None or target.due != due:
+                heapq.heappop(self.queue)
+                continue
+            if due > time.time():
+                return None
+            heapq.heappop(self.queue)
+            # Yoklanan hedef kuyrukta değil; poll_once yeniden planlar
+            target.due = 0.0
+            return target
+        return None
+
+    def poll_once(self) -> bool:
+        """Sırası gelen bir hedefi yoklar; yoklanacak hedef yoksa False döndürür"""
+        target = self._pop_due()
+        if target is None:
+            return False
+
+        # İlk sayfanın bütçesi; çok sayfalı yoklamalar sonraki sayfalar için ayrıca harcar
+        self.budget.acquire()
+        logger.info(f"🔁 Yoklanıyor: {target.key} ({target.sinif}, {target.durum or 'durum yok'})")
+        target.last_polled = time.time()
+        target.polls += 1
+        self.total_polls += 1
+
+        try:
+            results = list(self.poll_fn(target))
+        except Exception as e:
+            logger.warning(f"⚠️ Yoklama hatası ({target.key}): {e}")
+            results = []
+
+        # Hedef kendini güncellemediyse aynı sınıfla tekrar planla
+        if not any(key == target.key for key, *_ in results):
+            self.schedule(target.key, target.sinif)
+        for key, sinif, durum, tarih, payload in results:
+            self.schedule(key, sinif, durum, tarih, payload)
+
+        self.save_state()
+        if self.total_polls % STATS_EVERY == 0:
+            self.log_stats()
+        return True
+
+    def run(self, max_polls: Optional[int] = None):
+        """Daemon döngüsü: sırası gelen hedefleri yoklar, yoksa bir sonrakine kadar uyur"""
+        logger.info(f"🕒 Zamanlayıcı başlatıldı ({len(self.targets)} hedef, "
+                    f"saatte {self.budget.rate * HOUR:.0f} istek)")
+        while max_polls is None or self.total_polls < max_polls:
+            if self.poll_once():
+                continue
+            if not self.queue:
+                logger.info("✅ Yoklanacak hedef kalmadı")
+                break
+            time.sleep(max(0.0, min(self.queue[0][0] - time.time(), 60)))
+        self.log_stats()
+
+    def stats(self) -> Dict:
+        """Kuyruk derinliği ve sınıf bazında güncellik (staleness) istatistikleri"""
+        now = time.time()
+        classes = {}
+        for target in self.targets.values():
+            entry = classes.setdefault(target.sinif, {'hedef': 0, 'sirada': 0, 'gecikmis': 0, 'staleness': []})
+            entry['hedef'] += 1
+            if target.due:
+                entry['sirada'] += 1
+                if target.due < now:
+                    entry['gecikmis'] += 1
+            if target.last_polled:
+                entry['staleness'].append(now - target.last_polled)
+
+        for entry in classes.values():
+            staleness = entry.pop('staleness')
+            entry['max_staleness_sn'] = round(max(staleness), 1) if staleness else None
+            entry['ort_staleness_sn'] = round(sum(staleness) / len(staleness), 1) if staleness else None
+
+        return {
+            'zaman': datetime.now().isoformat(),
+            'kuyruk_derinligi': sum(1 for t in self.targets.values() if t.due),
+            'toplam_yoklama': self.total_polls,
+            'butce_kalan': round(self.budget.tokens, 2),
+            'siniflar': classes,
+        }
+
+    def log_stats(self):
+        """İstatistikleri loglar ve STATS_FILE'a yazar"""
+        stats = self.stats()
+        logger.info(f"📊 Kuyruk: {stats['kuyruk_derinligi']} hedef, {stats['toplam_yoklama']} yoklama")
+        for sinif, entry in stats['siniflar'].items():
+            logger.info(f"  • {sinif}: {entry['hedef']} hedef, {entry['gecikmis']} gecikmiş, "
+                        f"en eski {entry['max_staleness_sn']} sn")
+        try:
+            with open(STATS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(stats, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning(f"⚠️ İstatistikler kaydedilemedi: {e}")
+
+    def save_state(self):
+        """Hedefleri yeniden başlatmada kaldığı yerden devam etmek için kaydeder"""
+        try:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump([asdict(t) for t in self.targets.values()], f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"⚠️ Zamanlayıcı durumu kaydedilemedi: {e}")
+
+    def load_state(self):
+        """Kaydedilmiş hedefleri yükler"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        for item in saved:
+            target = Target(**item)
+            self.targets[target.key] = target
+            if target.due:
+                heapq.heappush(self.queue, (target.due, target.key))
+        logger.info(f"📂 {len(self.targets)} hedef kaydedilmiş durumdan yüklendi")
+
+
+def sorgu_poller(budget: RateBudget) -> PollFn:
+    """
+    Sorgu sayfası için yoklama fonksiyonu: her hedef bir durum parçasıdır
+    (örn: sadece KOMİSYONDA). Sonuçlar esas_no'ya göre birleştirilip kaydedilir.
+    Sayfalamada her sonraki sayfa bütçeden ayrıca düşülür.
+
+    Her yoklama parçanın ilk DAEMON_MAX_RESULTS kaydını çeker; sorgu en yeni
+    teklifle başladığı için 'sorgu:tumu' yeni teklifleri yakalar ama daha eski
+    sayfalara inmez. Eski tekliflerin durum değişiklikleri durum parçalarıyla
+    (ve yine ilk DAEMON_MAX_RESULTS kayıtla) izlenir; tam tarama için
+    kanun_teklifleri_scraper.py veya iş kuyruğu kullanılmalıdır.
+    """
+    import kanun_teklifleri_scraper as kts
+    import graph_export
+
+    store = {}
+    try:
+        # İndeks sadece durum referanslarını içerir; yoksa tam çıktı okunup metinler depoya alınır
+        filename = kts.INDEX_FILE if os.path.exists(kts.INDEX_FILE) else kts.OUTPUT_FILE
+        for record in load_records(filename):
+            record.offload()
+            store[record.esas_no or record.link] = record
+    except (OSError, ValueError):
+        pass
+
+    def poll(target: Target) -> Iterable[PollResult]:
+        for record in kts.run_query(durum=target.payload.get('durum', ''), max_results=DAEMON_MAX_RESULTS,
+                                    before_page=budget.acquire):
+            store[record.esas_no or record.link] = record
+        kts.save_to_json(list(store.values()))
+        # Graph Commons CSV'lerine sadece yeni esas no'lar eklenir
+        graph_export.export(kts.OUTPUT_FILE, append=True)
+        return []
+
+    return poll
+
+
+def teklif_poller() -> PollFn:
+    """
+    Teklif listesi/detayları için yoklama fonksiyonu: liste hedefi yeni
+    teklifleri bulur, her teklif hedefi detay sayfasını tekrar çeker.
+    """
+    import tbmm_scraper as ts
+
+    store = {}
+    try:
+        # İndeks sadece metin referanslarını içerir; yoksa tam çıktı okunup metinler depoya alınır
+        filename = ts.INDEX_FILE if os.path.exists(ts.INDEX_FILE) else ts.OUTPUT_FILE
+        for proposal in load_records(filename, Proposal):
+            proposal.offload()
+            store[proposal.link] = proposal
+    except (OSError, ValueError):
+        pass
+
+    def poll(target: Target) -> Iterable[PollResult]:
+        if target.key == 'liste':
+            return [(p.link, None, '', '', {'baslik': p.baslik})
+                    for p in ts.scrape_proposal_list() if p.link not in store]
+
+        proposal = ts.scrape_proposal_detail(Proposal(baslik=target.payload.get('baslik', ''), link=target.key))
+        if not proposal.metin:
+            return []
+        durum, tarih = detect_durum(proposal.metin), detect_tarih(proposal.metin)
+        # Metin save_to_json'da indeks yazılırken depoya alınır
+        store[target.key] = proposal
+        ts.save_to_json(list(store.values()))
+        return [(target.key, None, durum, tarih, target.payload)]
+
+    return poll
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mode', choices=['sorgu', 'teklif'], default='sorgu')
+    parser.add_argument('--requests-per-hour', type=int, default=REQUESTS_PER_HOUR)
+    parser.add_argument('--max-polls', type=int, default=None, help='Test için yoklama sınırı')
+    args = parser.parse_args()
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+    budget = RateBudget(args.requests_per_hour)
+    if args.mode == 'sorgu':
+        poll_fn = sorgu_poller(budget)
+        from kanun_teklifleri_scraper import close_driver
+    else:
+        poll_fn = teklif_poller()
+        from tbmm_scraper import close_driver
+
+    scheduler = Scheduler(poll_fn, budget)
+    scheduler.load_state()
+
+    # Sabit hedefler: liste/sorgu parçaları
+    if args.mode == 'sorgu':
+        scheduler.schedule('sorgu:tumu', 'liste', payload={'durum': ''})
+        for durum in ACTIVE_DURUMLAR[:2]:
+            scheduler.schedule(f'sorgu:{durum}', 'aktif', durum=durum, payload={'durum': durum})
+        for durum in FINAL_DURUMLAR[:2]:
+            scheduler.schedule(f'sorgu:{durum}', 'sonuclandi_parca', durum=durum, payload={'durum': durum})
+    else:
+        scheduler.schedule('liste', 'liste')
+
+    try:
+        # Tarayıcı yoklamalar arasında açık kalır (sıcak oturum)
+        scheduler.run(max_polls=args.max_polls)
+    except KeyboardInterrupt:
+        logger.warning("\n⚠️ İşlem kullanıcı tarafından durduruldu")
+    finally:
+        scheduler.save_state()
+        close_driver()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Selector Çözümleme Cache'i
+Her sayfa tipi ve eleman için hangi aday selector'ın eşleştiğini hatırlar ve
+diske kaydeder. Sonraki aramalarda kazanan selector önce denenir; tarayıcıda
+tüm adaylar tek bir execute_script çağrısıyla çözümlenir, böylece her başarısız
+find_element için ayrı bir WebDriver round-trip'i yapılmaz.
+
+Her sayfada eşleşen son çare adaylar (CATCH_ALL, örn: genel 'table') kazansa
+da öne alınmaz; alınsaydı her seferinde ilk sırada eşleşir ve özel adaylar bir
+daha denenmezdi.
+
+Sadece tarayıcıdaki aramalar için kullanılır; BeautifulSoup ile yapılan
+aramalarda sıralamanın kazandıracağı bir round-trip yoktur ve aday
+listeleri öncelik sırasında kalmalıdır.
+"""
+
+import os
+import json
+import logging
+from typing import List, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sabitler
+DATA_DIR = "data"
+CACHE_FILE = f"{DATA_DIR}/selector_cache.json"
+
+# Adayları sırayla dener: [index, element] veya null döndürür
+RESOLVE_JS = """
+var candidates = arguments[0], skipDisabled = arguments[1];
+for (var i = 0; i < candidates.length; i++) {
+    var by = candidates[i][0], value = candidates[i][1], el = null;
+    try {
+        if (by === 'id') el = document.getElementById(value);
+        else if (by === 'name') el = document.getElementsByName(value)[0] || null;
+        else if (by === 'xpath') el = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        else if (by === 'css selector') el = document.querySelector(value);
+    } catch (e) {}
+    if (!el) continue;
+    if (skipDisabled && (el.getAttribute('class') || '').toLowerCase().indexOf('disabled') !== -1) continue;
+    return [i, el];
+}
+return null;
+"""
+
+# Her sayfada eşleşen son çare adaylar (_key biçiminde); cache'te kazanan olarak tutulmaz
+CATCH_ALL = frozenset({
+    'table',
+    "xpath=//input[@type='submit']",
+})
+
+Candidate = Tuple[str, str]
+
+_cache = None
+_stats = {'lookups': 0, 'hits': 0, 'misses': 0}
+
+
+def _load() -> Dict[str, Dict[str, str]]:
+    """Cache'i ilk kullanımda diskten yükler"""
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _key(candidate) -> str:
+    return candidate if isinstance(candidate, str) else f"{candidate[0]}={candidate[1]}"
+
+
+def is_catch_all(candidate) -> bool:
+    """Aday her sayfada eşleşen bir son çare mi"""
+    return _key(candidate) in CATCH_ALL
+
+
+def save_cache():
+    """Öğrenilen selector'ları diske kaydeder"""
+    if not _cache:
+        return
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(_cache, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logger.warning(f"⚠️ Selector cache kaydedilemedi: {e}")
+
+
+def ordered(page_type: str, slot: str, candidates: List) -> List:
+    """Adayları, daha önce kazanan aday başta olacak şekilde sıralar"""
+    winner = _load().get(page_type, {}).get(slot)
+    if winner is None or winner in CATCH_ALL:
+        return list(candidates)
+    first = [c for c in candidates if _key(c) == winner]
+    return first + [c for c in candidates if _key(c) != winner]
+
+
+def remember(page_type: str, slot: str, candidate):
+    """Eşleşen adayı kaydeder; değiştiyse cache diske yazılır. Son çare adaylar kaydedilmez."""
+    _stats['lookups'] += 1
+    slots = _load().setdefault(page_type, {})
+    key = _key(candidate)
+    if key in CATCH_ALL:
+        # Kayıtlı kazanan bu sayfada eşleşmedi; bir dahaki sefere adaylar öncelik sırasıyla denenir
+        _stats['misses'] += 1
+        if slots.pop(slot, None) is not None:
+            save_cache()
+        return
+    if slots.get(slot) == key:
+        _stats['hits'] += 1
+        return
+    _stats['misses'] += 1
+    slots[slot] = key
+    save_cache()
+
+
+def resolve_element(driver, page_type: str, slot: str, candidates: List[Candidate],
+                    skip_disabled: bool = False):
+    """
+    Adaylardan ilk eşleşen elemanı tek bir execute_script çağrısıyla bulur
+
+    Args:
+        candidates: (By, değer) listesi, örn: [(By.ID, 'txtArama'), (By.NAME, 'q')]
+        skip_disabled: class'ında "disabled" geçen elemanları atla
+
+    Returns:
+        WebElement veya None
+    """
+    candidates = ordered(page_type, slot, candidates)
+    found = driver.execute_script(RESOLVE_JS, [list(c) for c in candidates], skip_disabled)
+    if not found:
+        _stats['lookups'] += 1
+        _stats['misses'] += 1
+        return None
+
+    index, element = found
+    remember(page_type, slot, candidates[int(index)])
+    return element
+
+
+def log_stats():
+    """Selector cache istatistiklerini çalıştırma raporuna yazar"""
+    if not _stats['lookups']:
+        return
+    rate = _stats['hits'] / _stats['lookups'] * 100
+    logger.info(f"  • Selector cache: %{rate:.1f} isabet ({_stats['hits']}/{_stats['lookups']} arama)")
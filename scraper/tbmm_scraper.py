@@ -8,19 +8,18 @@ Bu script TBMM web sitesinden kanun tekliflerini çeker ve JSON formatında kayd
 
 import os
 import re
-import json
 import time
 import logging
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+import argparse
+from typing import List, Optional
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+# selenium, bs4 ve requests sadece kullanan fonksiyonlarda import edilir;
+# böylece tarayıcı gerektirmeyen işler (cli.py) hızlı başlar
+from normalize import canonical_url, intern_value, log_cache_stats
+from records import Proposal, dump_records, dump_index
+import blob_store
+import profiler
+from browser_watchdog import BrowserWatchdog, configure_timeouts
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -35,9 +34,15 @@ BASE_URL = "https://www.tbmm.gov.tr"
 LIST_URL = f"{BASE_URL}/Yasama/KanunTeklifi"
 DATA_DIR = "data"
 OUTPUT_FILE = f"{DATA_DIR}/proposals.json"
+# Metinler yerine metin deposu referanslarını tutan, hızlı yüklenen kopya
+INDEX_FILE = f"{DATA_DIR}/proposals.index.json"
 REQUEST_DELAY = 2  # Saniye cinsinden bekleme süresi
 MAX_RETRIES = 3
 TIMEOUT = 30
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+
+# Sayfaları Selenium yerine düz HTTP ile çek (Chrome kurulu olmayan ortamlar için)
+NO_BROWSER = os.getenv('NO_BROWSER', 'false').lower() == 'true'
 
 # Global WebDriver instance
 driver = None
@@ -49,6 +54,7 @@ def create_data_directory():
     logger.info(f"✅ Veri dizini hazır: {DATA_DIR}")
 
 
+@profiler.stage('driver')
 def init_driver():
     """Selenium WebDriver'ı başlatır"""
     global driver
@@ -56,6 +62,9 @@ def init_driver():
     if driver is not None:
         return driver
     
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
     logger.info("🚀 Selenium WebDriver başlatılıyor...")
     
     chrome_options = Options()
@@ -65,7 +74,7 @@ def init_driver():
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
     
     # Bot tespitini zorlaştır
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -84,6 +93,8 @@ def init_driver():
         
         # WebDriver özelliğini gizle
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # Takılan sayfalar sonsuza kadar beklemesin
+        configure_timeouts(driver)
         
         logger.info("✅ WebDriver başarıyla başlatıldı")
         return driver
@@ -98,19 +109,63 @@ def close_driver():
     if driver is not None:
         try:
             driver.quit()
-            driver = None
             logger.info("✅ WebDriver kapatıldı")
         except:
             pass
+        finally:
+            # Çökmüş bir oturum quit'te hata verse de bir sonraki init_driver yeni driver açmalı
+            driver = None
+
+
+# Uzun çalıştırmalarda driver'ı izler ve gerektiğinde yeniler
+watchdog = BrowserWatchdog(init_driver, close_driver, BASE_URL)
+
+
+def is_bot_challenge(html: str) -> bool:
+    """Sayfa bot koruması (challenge) sayfası mı"""
+    return 'challenge' in html.lower() or 'bobcmn' in html
+
+
+@profiler.stage('fetch')
+def fetch_page_http(url: str, retries: int = MAX_RETRIES) -> Optional[str]:
+    """Belirtilen URL'den HTML içeriğini tarayıcı olmadan (requests ile) çeker"""
+    import requests
+
+    for attempt in range(1, retries + 1):
+        try:
+            logger.info(f"🌐 Sayfa HTTP ile çekiliyor: {url} (Deneme {attempt}/{retries})")
+            response = requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=TIMEOUT)
+            response.raise_for_status()
+            html = response.text
+            # Bot koruması JavaScript gerektirir; HTTP ile geçilemez
+            if is_bot_challenge(html):
+                logger.error(f"❌ Bot koruması aktif, sayfa tarayıcı olmadan çekilemiyor: {url}")
+                return None
+            logger.info(f"📄 Sayfa çekildi: {len(html)} karakter")
+            return html
+        except requests.RequestException as e:
+            logger.warning(f"⚠️ Hata (Deneme {attempt}/{retries}): {e}")
+            if attempt < retries:
+                time.sleep(REQUEST_DELAY * 2)
+    logger.error(f"❌ Sayfa çekilemedi: {url}")
+    return None
 
 
+@profiler.stage('fetch')
 def fetch_page(url: str, retries: int = MAX_RETRIES) -> Optional[str]:
-    """Belirtilen URL'den HTML içeriğini çeker (Selenium ile)"""
+    """Belirtilen URL'den HTML içeriğini çeker (Selenium ile, NO_BROWSER ise HTTP ile)"""
+    if NO_BROWSER:
+        return fetch_page_http(url, retries)
+
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
     for attempt in range(1, retries + 1):
         try:
             logger.info(f"🌐 Sayfa çekiliyor: {url} (Deneme {attempt}/{retries})")
             
-            driver = init_driver()
+            driver = watchdog.ensure()
             driver.get(url)
             
             # JavaScript'in yüklenmesi için UZUN bekle
@@ -139,7 +194,7 @@ def fetch_page(url: str, retries: int = MAX_RETRIES) -> Optional[str]:
                 logger.info(f"📄 Tekrar denendi: {len(html)} karakter")
             
             # Challenge veya bobcmn (bot koruma scripti) varsa
-            if 'challenge' in html.lower() or 'bobcmn' in html:
+            if is_bot_challenge(html):
                 logger.warning("⚠️ Bot koruması tespit edildi! Ekstra bekleme...")
                 logger.info("⏳ 20 saniye daha bekleniyor...")
                 time.sleep(20)
@@ -156,10 +211,12 @@ def fetch_page(url: str, retries: int = MAX_RETRIES) -> Optional[str]:
                 pass
             
             logger.info(f"✅ Sayfa işleme hazır ({len(html)} karakter)")
+            watchdog.page_served()
             return html
             
         except Exception as e:
             logger.warning(f"⚠️ Hata (Deneme {attempt}/{retries}): {e}")
+            watchdog.failure(e)
             if attempt < retries:
                 logger.info(f"🔄 {REQUEST_DELAY * 2} saniye sonra tekrar denenecek...")
                 time.sleep(REQUEST_DELAY * 2)
@@ -183,16 +240,23 @@ def extract_donem_yasama(text: str) -> str:
     pattern = r'(\d+)\.\s*Dönem\s+(\d+)\.\s*Yasama\s+Yılı'
     match = re.search(pattern, text, re.IGNORECASE)
     if match:
-        return f"{match.group(1)}/{match.group(2)}"
+        return intern_value(f"{match.group(1)}/{match.group(2)}")
     return ''
 
 
-def scrape_proposal_list() -> List[Dict[str, str]]:
+@profiler.stage('liste')
+def scrape_proposal_list() -> List[Proposal]:
     """Ana liste sayfasından teklif linklerini çeker"""
     html = fetch_page(LIST_URL)
     if not html:
         return []
-    
+    return parse_proposal_list(html)
+
+
+def parse_proposal_list(html: str) -> List[Proposal]:
+    """Liste sayfası HTML'inden teklif linklerini çıkarır"""
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, 'lxml')
     proposals_list = []
     
@@ -235,7 +299,7 @@ def scrape_proposal_list() -> List[Dict[str, str]]:
         if href.startswith('javascript:') or href.startswith('#'):
             continue
         
-        full_url = urljoin(BASE_URL, href)
+        full_url = canonical_url(href)
         title = link.get_text(strip=True)
         
         # Başlık yoksa veya çok kısaysa atla
@@ -244,10 +308,7 @@ def scrape_proposal_list() -> List[Dict[str, str]]:
         
         # Aynı URL'yi bir kez ekle
         if full_url not in seen_urls:
-            proposals_list.append({
-                'baslik': title,
-                'link': full_url
-            })
+            proposals_list.append(Proposal(baslik=title, link=full_url))
             seen_urls.add(full_url)
             logger.debug(f"  ✓ Eklendi: {title[:50]}...")
     
@@ -264,16 +325,30 @@ def scrape_proposal_list() -> List[Dict[str, str]]:
     return proposals_list
 
 
-def scrape_proposal_detail(proposal: Dict[str, str]) -> Dict[str, str]:
+@profiler.stage('detay')
+def scrape_proposal_detail(proposal: Proposal) -> Proposal:
     """Bir teklifin detay sayfasını çeker ve içeriği parse eder"""
-    url = proposal['link']
-    logger.info(f"📄 Detay çekiliyor: {proposal['baslik'][:50]}...")
+    url = proposal.link
+    logger.info(f"📄 Detay çekiliyor: {proposal.baslik[:50]}...")
     
     html = fetch_page(url)
     if not html:
         logger.warning(f"⚠️ Detay sayfası çekilemedi, atlanıyor: {url}")
         return proposal
     
+    parse_proposal_detail(proposal, html)
+    
+    # Rate limiting için bekle
+    time.sleep(REQUEST_DELAY)
+    
+    return proposal
+
+
+def parse_proposal_detail(proposal: Proposal, html: str) -> Proposal:
+    """Detay sayfası HTML'inden metin, Esas No ve Dönem bilgisini teklife yazar"""
+    from bs4 import BeautifulSoup
+
+    url = proposal.link
     soup = BeautifulSoup(html, 'lxml')
     
     # İçerik alanını bul - Birden fazla selector dene
@@ -290,6 +365,7 @@ def scrape_proposal_detail(proposal: Dict[str, str]) -> Dict[str, str]:
         '#content',          # Genel content id'si
     ]
     
+    # Liste öncelik sırasındadır: genel selector'lar (main, article) sadece özeller bulunamazsa denenir
     for selector in selectors:
         content_div = soup.select_one(selector)
         if content_div:
@@ -318,35 +394,38 @@ def scrape_proposal_detail(proposal: Dict[str, str]) -> Dict[str, str]:
         esas_no = extract_esas_no(full_text)
         donem_yasama = extract_donem_yasama(full_text)
         
-        proposal['metin'] = full_text
-        proposal['esasNo'] = esas_no if esas_no else 'UNKNOWN'
-        proposal['donemYasamaYili'] = donem_yasama if donem_yasama else 'UNKNOWN'
+        proposal.metin = full_text
+        proposal.esas_no = esas_no if esas_no else 'UNKNOWN'
+        proposal.donem_yasama_yili = donem_yasama if donem_yasama else 'UNKNOWN'
         
         logger.info(f"✅ İçerik çekildi ({len(full_text)} karakter, Esas: {esas_no}, Dönem: {donem_yasama})")
     else:
         logger.error(f"❌ Hiçbir içerik alanı bulunamadı: {url}")
-        proposal['metin'] = ''
-        proposal['esasNo'] = ''
-        proposal['donemYasamaYili'] = ''
-    
-    # Rate limiting için bekle
-    time.sleep(REQUEST_DELAY)
+        proposal.metin = ''
+        proposal.esas_no = ''
+        proposal.donem_yasama_yili = ''
     
     return proposal
 
 
-def save_to_json(proposals: List[Dict[str, str]]):
-    """Teklifleri JSON dosyasına kaydeder"""
+@profiler.stage('kaydet')
+def save_to_json(proposals: List[Proposal]):
+    """
+    Teklifleri JSON dosyasına, metinlerin depo referanslarını indeks dosyasına kaydeder
+
+    Bellekteki metinler proposals.json'a doğrudan yazılır, ardından indeks yazılırken depoya alınır;
+    böylece her metin bir kez sıkıştırılır ve kayıt için tekrar açılmaz.
+    """
     try:
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(proposals, f, ensure_ascii=False, indent=2)
-        logger.info(f"💾 Veriler kaydedildi: {OUTPUT_FILE} ({len(proposals)} teklif)")
+        count = dump_records(proposals, OUTPUT_FILE)
+        logger.info(f"💾 Veriler kaydedildi: {OUTPUT_FILE} ({count} teklif)")
+        dump_index(proposals, INDEX_FILE)
     except Exception as e:
         logger.error(f"❌ JSON kaydetme hatası: {e}")
         raise
 
 
-def main():
+def main(max_proposals: Optional[int] = None):
     """Ana scraper fonksiyonu"""
     logger.info("🚀 TBMM Scraper başlatıldı")
     
@@ -365,8 +444,9 @@ def main():
         
         # 3. Her teklifin detayını çek (ilk 20 teklif ile sınırlı - test için)
         # Üretimde bu limiti kaldırabilir veya artırabilirsiniz
-        MAX_PROPOSALS = int(os.getenv('MAX_PROPOSALS', '20'))
-        proposals_to_scrape = proposals[:MAX_PROPOSALS]
+        if max_proposals is None:
+            max_proposals = int(os.getenv('MAX_PROPOSALS', '20'))
+        proposals_to_scrape = proposals[:max_proposals]
         
         logger.info(f"🔍 {len(proposals_to_scrape)} teklifin detayı çekilecek")
         
@@ -376,13 +456,17 @@ def main():
             detailed = scrape_proposal_detail(proposal)
             
             # Sadece geçerli içeriğe sahip teklifleri kaydet
-            if detailed.get('metin'):
+            if detailed.metin:
+                # Metin kayıtta depoya alınır (save_to_json)
                 detailed_proposals.append(detailed)
         
         # 4. JSON'a kaydet
         save_to_json(detailed_proposals)
         
         logger.info(f"✅ Scraping tamamlandı! Toplam: {len(detailed_proposals)} teklif")
+        log_cache_stats()
+        blob_store.default_store().log_stats()
+        watchdog.log_stats()
         
     except KeyboardInterrupt:
         logger.warning("\n⚠️ İşlem kullanıcı tarafından durduruldu")
@@ -395,5 +479,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--profile', action='store_true',
+                        help=f'Örnekleyici profiler ile çalıştır, çıktılar {profiler.PROFILE_DIR}/ altına yazılır')
+    args = parser.parse_args()
+    with profiler.profile('tbmm_scraper', enabled=args.profile):
+        main()
 
@@ -0,0 +1,53 @@
+import sqlite3
+
+import pytest
+
+import blob_store
+from blob_store import BlobStore, CodecUnavailable
+
+TEXT = 'TÜRKİYE BÜYÜK MİLLET MECLİSİ BAŞKANLIĞINA\nAşağıdaki Kanun Teklifimiz ekte sunulmuştur.\n' * 20
+
+
+def test_zlib_round_trip_and_dedup(tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_store, 'zstandard', None)
+    store = BlobStore(str(tmp_path / 'blobs.db'))
+    ref = store.put(TEXT)
+    assert store.put(TEXT) == ref
+    assert store.get(ref) == TEXT
+    assert store.stats['dedup'] == 1
+    totals = store.totals()
+    assert totals['blobs'] == 1 and totals['stored_bytes'] < totals['raw_bytes']
+
+
+def test_zlib_dictionary_survives_retraining(tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_store, 'zstandard', None)
+    path = str(tmp_path / 'blobs.db')
+    store = BlobStore(path)
+    store.set_dictionary(blob_store.train_dictionary([TEXT, TEXT + 'ek']))
+    old_ref = store.put(TEXT)
+    store.set_dictionary(b'baska bir sozluk ' * 10)
+    new_ref = store.put(TEXT + ' yeni')
+
+    reopened = BlobStore(path)
+    assert reopened.get(old_ref) == TEXT
+    assert reopened.get(new_ref) == TEXT + ' yeni'
+
+
+def test_zstd_round_trip(tmp_path):
+    pytest.importorskip('zstandard')
+    store = BlobStore(str(tmp_path / 'blobs.db'))
+    ref = store.put(TEXT)
+    assert store.conn.execute('SELECT codec FROM blobs').fetchone()[0] == blob_store.CODEC_ZSTD
+    assert store.get(ref) == TEXT
+
+
+@pytest.mark.parametrize('codec', [blob_store.CODEC_ZSTD, 'lz4'])
+def test_unavailable_codec_fails_clearly(tmp_path, monkeypatch, codec):
+    monkeypatch.setattr(blob_store, 'zstandard', None)
+    path = str(tmp_path / 'blobs.db')
+    store = BlobStore(path)
+    with sqlite3.connect(path) as conn:
+        conn.execute('INSERT INTO blobs (ref, codec, dict_id, size, data) VALUES (?, ?, ?, ?, ?)',
+                     ('abc', codec, blob_store.NO_DICT, 3, b'\x28\xb5\x2f\xfd'))
+    with pytest.raises(CodecUnavailable):
+        store.get('abc')
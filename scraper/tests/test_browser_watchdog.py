@@ -0,0 +1,84 @@
+import browser_watchdog
+from browser_watchdog import BrowserWatchdog
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+
+    def execute_script(self, script):
+        self.calls.append('ping')
+
+    def get_cookies(self):
+        self.calls.append('cookies')
+        return [{'name': 'ASP.NET_SessionId', 'value': str(len(self.calls))}]
+
+    def get(self, url):
+        self.calls.append('get')
+
+    def add_cookie(self, cookie):
+        self.calls.append('add_cookie')
+
+
+def _watchdog(drivers):
+    current = []
+
+    def init_driver():
+        if not current:
+            current.append(drivers.pop(0))
+        return current[0]
+
+    return BrowserWatchdog(init_driver, current.clear, 'https://www.tbmm.gov.tr')
+
+
+def test_healthy_pages_make_no_extra_round_trips():
+    driver = FakeDriver()
+    watchdog = _watchdog([driver])
+    for _ in range(browser_watchdog.RSS_CHECK_EVERY - 1):
+        assert watchdog.ensure() is driver
+        watchdog.page_served()
+    assert driver.calls == []
+
+    # RSS ölçümüyle birlikte cookie'ler alınır
+    watchdog.page_served()
+    watchdog.ensure()
+    assert driver.calls == ['cookies']
+
+
+def test_ping_after_failure_and_at_interval(monkeypatch):
+    driver = FakeDriver()
+    watchdog = _watchdog([driver])
+    watchdog.failure(RuntimeError('timeout'))
+    watchdog.ensure()
+    assert driver.calls == ['ping']
+
+    watchdog.page_served()
+    watchdog.ensure()
+    assert driver.calls == ['ping']
+
+    monkeypatch.setattr(browser_watchdog, 'PING_INTERVAL', 0)
+    watchdog.ensure()
+    assert driver.calls == ['ping', 'ping']
+
+
+def test_page_limit_recycle_restores_fresh_cookies(monkeypatch):
+    monkeypatch.setattr(browser_watchdog, 'MAX_PAGES_PER_DRIVER', 3)
+    old, new = FakeDriver(), FakeDriver()
+    watchdog = _watchdog([old, new])
+    for _ in range(3):
+        watchdog.ensure()
+        watchdog.page_served()
+
+    assert watchdog.ensure() is new
+    assert old.calls == ['cookies']
+    assert new.calls == ['get', 'add_cookie']
+    assert watchdog.pages == 0
+
+
+def test_dead_session_recycles_without_touching_old_driver():
+    old, new = FakeDriver(), FakeDriver()
+    watchdog = _watchdog([old, new])
+    watchdog.ensure()
+    watchdog.failure(RuntimeError('invalid session id'))
+    assert watchdog.ensure() is new
+    assert old.calls == []
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+SCRAPER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('selenium', 'bs4', 'lxml', 'requests')
+FIXTURE = os.path.join(SCRAPER_DIR, 'tests', 'fixtures', 'nested_table.html')
+
+
+def _loaded_heavy_modules(argv, cwd):
+    """cli.main'i yeni bir süreçte çalıştırır ve yüklenen ağır modülleri döndürür"""
+    code = ('import sys, cli\n'
+            'try:\n'
+            f'    cli.main({argv!r})\n'
+            'except SystemExit:\n'
+            '    pass\n'
+            f'print("LOADED:" + ",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n')
+    env = dict(os.environ, PYTHONPATH=SCRAPER_DIR)
+    result = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    loaded = result.stdout.rsplit('LOADED:', 1)[1].strip()
+    return set(filter(None, loaded.split(',')))
+
+
+def test_help_loads_no_heavy_modules(tmp_path):
+    assert _loaded_heavy_modules(['--help'], tmp_path) == set()
+    assert _loaded_heavy_modules(['sorgu', '--help'], tmp_path) == set()
+
+
+def test_export_loads_no_heavy_modules(tmp_path):
+    source = tmp_path / 'sorgu.json'
+    source.write_text('[]', encoding='utf-8')
+    argv = ['export', '--file', str(source), '--dest', str(tmp_path / 'graph')]
+    assert _loaded_heavy_modules(argv, tmp_path) == set()
+
+
+def test_reparse_loads_parser_but_not_browser(tmp_path):
+    loaded = _loaded_heavy_modules(['reparse', FIXTURE, '--output', str(tmp_path / 'out.json')], tmp_path)
+    assert 'selenium' not in loaded and 'requests' not in loaded
+    assert 'bs4' in loaded
+    assert (tmp_path / 'out.json').exists()
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+import kanun_teklifleri_scraper as kts
+import network_capture
+
+FILTERS = kts.query_filters(durum='KOMİSYONDA')
+
+
+def _row(esas_no, durum):
+    return {'sira': '28/4', 'esasNo': esas_no, 'tarih': '10/08/2026',
+            'metin': f'Teklif {esas_no}Son Durumu : {durum}Metni'}
+
+
+@pytest.fixture
+def endpoint(tmp_path, monkeypatch):
+    path = tmp_path / 'sorgu_endpoint.json'
+    monkeypatch.setattr(network_capture, 'load_endpoint', lambda: json.loads(path.read_text()))
+    monkeypatch.setattr(network_capture, 'build_session', lambda driver, endpoint: None)
+    monkeypatch.setattr(kts, 'REQUEST_DELAY', 0)
+    monkeypatch.setattr(kts, 'driver', None)
+
+    def serve(pages, filters=FILTERS):
+        path.write_text(json.dumps({'url': 'https://www.tbmm.gov.tr/x', 'filters': filters}))
+        monkeypatch.setattr(network_capture, 'fetch_endpoint_page',
+                            lambda session, endpoint, page_num, state: (
+                                json.dumps({'d': pages[page_num - 1] if page_num <= len(pages) else []}),
+                                'application/json'))
+    return serve
+
+
+def test_replay_returns_rows_matching_filters(endpoint):
+    endpoint([[_row('2/1', 'KOMİSYONDA'), _row('2/2', 'KOMİSYONDA')], [_row('2/3', 'KOMİSYONDA')]])
+    results = kts.replay_saved_endpoint(max_results=10, filters=FILTERS)
+    assert [r.esas_no for r in results] == ['2/1', '2/2', '2/3']
+
+
+def test_replay_rejects_rows_not_matching_filters(endpoint):
+    # Oturum düşünce endpoint filtresiz varsayılan listeyi döndürür
+    endpoint([[_row('2/1', 'KOMİSYONDA'), _row('2/2', 'KANUNLAŞTI')]])
+    assert kts.replay_saved_endpoint(max_results=10, filters=FILTERS) is None
+
+
+def test_replay_rejects_endpoint_captured_with_other_filters(endpoint):
+    endpoint([[_row('2/1', 'KOMİSYONDA')]], filters=kts.query_filters())
+    assert kts.replay_saved_endpoint(max_results=10, filters=FILTERS) is None
+
+
+def test_replay_rejects_empty_first_page(endpoint):
+    endpoint([])
+    assert kts.replay_saved_endpoint(max_results=10, filters=FILTERS) is None
@@ -0,0 +1,58 @@
+import csv
+import json
+
+import graph_export
+from records import SorguRecord
+
+DURUM = ('Rize  Milletvekili Harun MERTOĞLU ve 120 MilletvekiliYabancı Dijital Konaklama Platformları Kanunu '
+         'TeklifiTeklif ile; turizm payı düzenlenmektedir.Son Durumu : {}MetniDiğer Bilgiler')
+
+
+def write_records(path, son_durum):
+    records = [
+        {'sira': '28/4', 'esas_no': '2/3803', 'tarih': '10/08/2026',
+         'link': 'https://www.tbmm.gov.tr/Yasama/KanunTeklifi/314159', 'durum': DURUM.format(son_durum)},
+        {'sira': '28/4', 'esas_no': '2/3802', 'tarih': '05/08/2026',
+         'link': 'https://cdn.tbmm.gov.tr/KKBSPublicFile/D28/Y4/T2/WebOnergeMetni/ca04.pdf',
+         'durum': DURUM.format('KOMİSYONDA')},
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, ensure_ascii=False)
+
+
+def read_kt_nodes(dest):
+    with open(dest / 'kt-nodes.csv', encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    return {row['esas no']: row for row in rows}
+
+
+def test_sira_no_from_link():
+    assert graph_export.sira_no('https://www.tbmm.gov.tr/Yasama/KanunTeklifi/314159') == '314159'
+    assert graph_export.sira_no('https://www.tbmm.gov.tr/develop/owa/tasari_teklif_sd.onerge_bilgileri'
+                                '?kanunlar_sira_no=92194') == '92194'
+    assert graph_export.sira_no('https://cdn.tbmm.gov.tr/KKBSPublicFile/D28/x.pdf') == ''
+
+
+def test_append_updates_changed_rows(tmp_path):
+    source, dest = tmp_path / 'sorgu.json', tmp_path / 'graph'
+    write_records(source, 'KOMİSYONDA')
+    graph_export.export(str(source), str(dest))
+    rows = read_kt_nodes(dest)
+    assert rows['2/3803']['sira no'] == '314159'
+    assert rows['2/3802']['sira no'] == ''
+    with open(dest / 'kt-rels.csv', encoding='utf-8') as f:
+        rels = f.read()
+
+    write_records(source, 'KANUNLAŞTI')
+    stats = graph_export.export(str(source), str(dest), append=True)
+    assert (stats['teklif'], stats['guncellenen'], stats['atlanan']) == (0, 1, 1)
+    rows = read_kt_nodes(dest)
+    assert len(rows) == 2
+    assert rows['2/3803']['son durum'] == SorguRecord(durum=DURUM.format('KANUNLAŞTI')).son_durum
+    assert rows['2/3802']['son durum'] == 'KOMİSYONDA'
+    # İlişkiler tekrar yazılmaz
+    with open(dest / 'kt-rels.csv', encoding='utf-8') as f:
+        assert f.read() == rels
+
+    stats = graph_export.export(str(source), str(dest), append=True)
+    assert (stats['teklif'], stats['guncellenen'], stats['atlanan']) == (0, 0, 2)
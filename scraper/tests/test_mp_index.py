@@ -0,0 +1,25 @@
+from mp_index import MPIndex
+
+
+def _index():
+    return MPIndex([
+        {'name': 'Filiz KILIÇ', 'city': 'Nevşehir', 'party': 'MHP', 'id': '101'},
+        {'name': 'Filiz KILIÇ', 'city': 'İzmir', 'party': 'CHP', 'id': '102'},
+    ])
+
+
+def test_exact_name_with_city_disambiguates():
+    assert _index().resolve('Filiz KILIÇ', 'İzmir')['id'] == '102'
+
+
+def test_folded_name_with_non_ascii_city_disambiguates():
+    index = _index()
+    assert index.resolve('Filiz KILIC', 'Nevşehir')['id'] == '101'
+    assert index.resolve('Filiz KILIC', 'İzmir')['id'] == '102'
+    assert index.stats['folded'] == 2
+
+
+def test_same_name_without_city_is_unresolved():
+    index = _index()
+    assert index.resolve('Filiz KILIC') is None
+    assert index.stats['unresolved'] == 1
@@ -0,0 +1,35 @@
+import json
+
+import network_capture
+
+
+def _request(url, method='POST', body=None, content_type='application/x-www-form-urlencoded'):
+    return {'url': url, 'method': method, 'headers': {'Content-Type': content_type, 'Cookie': 'x=1'},
+            'post_data': body, 'mime_type': 'text/html'}
+
+
+def test_discovers_aspnet_postback_page_param():
+    url = 'https://www.tbmm.gov.tr/yasama/kanun-teklifleri'
+    submit = [_request(url, body='__VIEWSTATE=a&__EVENTARGUMENT=&txtArama=')]
+    next_page = [_request(url, body='__VIEWSTATE=b&__EVENTARGUMENT=Page%242&txtArama=')]
+    endpoint = network_capture.discover_endpoint(submit, next_page)
+    assert endpoint['kind'] == 'form'
+    assert endpoint['page_param'] == {'key': '__EVENTARGUMENT', 'template': 'Page${page}', 'value': 2,
+                                      'step': 1, 'is_int': False}
+    assert 'Cookie' not in endpoint['headers']
+
+
+def test_discovers_json_page_param_by_diff():
+    url = 'https://www.tbmm.gov.tr/api/teklifler'
+    submit = [_request(url, body=json.dumps({'start': 0, 'length': 25}), content_type='application/json')]
+    next_page = [_request(url, body=json.dumps({'start': 25, 'length': 25}), content_type='application/json')]
+    endpoint = network_capture.discover_endpoint(submit, next_page)
+    assert endpoint['kind'] == 'json'
+    assert endpoint['page_param'] == {'key': 'start', 'template': '{page}', 'value': 25, 'step': 25,
+                                      'is_int': True}
+
+
+def test_extract_hidden_fields_from_page_and_update_panel():
+    html = ('<input type="hidden" name="__VIEWSTATE" value="abc" />'
+            '|12|hiddenField|__EVENTVALIDATION|xyz|')
+    assert network_capture.extract_hidden_fields(html) == {'__VIEWSTATE': 'abc', '__EVENTVALIDATION': 'xyz'}
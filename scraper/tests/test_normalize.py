@@ -0,0 +1,36 @@
+import normalize
+from normalize import canonical_url, intern_value, tr_upper, tr_lower, parse_proposers, normalize_name
+
+
+def test_turkish_case_mapping():
+    assert tr_upper('istanbul ılgaz') == 'İSTANBUL ILGAZ'
+    assert tr_lower('İSTANBUL ILGAZ') == 'istanbul ılgaz'
+    long_text = 'i' * (normalize.MAX_CACHED_LENGTH + 1)
+    assert tr_upper(long_text) == 'İ' * len(long_text)
+
+
+def test_canonical_url_and_interning():
+    assert canonical_url(' /Yasama/KanunTeklifi/1 ') == 'https://www.tbmm.gov.tr/Yasama/KanunTeklifi/1'
+    assert canonical_url('https://cdn.tbmm.gov.tr/a.pdf') == 'https://cdn.tbmm.gov.tr/a.pdf'
+    a, b = ''.join(['KOMİS', 'YONDA']), ''.join(['KOMİSY', 'ONDA'])
+    assert intern_value(a) is intern_value(b)
+    long_text = 'x' * (normalize.MAX_CACHED_LENGTH + 1)
+    assert intern_value(long_text) is long_text
+
+
+def test_parse_proposers_with_role_and_others():
+    text = ('İYİ Parti Grup Başkanvekili İstanbul  Milletvekili Ayşe Nur YILMAZ, Rize  Milletvekili '
+            'Harun MERTOĞLU ve 120 MilletvekiliYabancı ... Kanun Teklifi')
+    assert parse_proposers(text) == [
+        {'ad': 'Ayşe Nur YILMAZ', 'il': 'İstanbul', 'parti': 'İYİ Parti', 'gorev': 'Grup Başkanvekili'},
+        {'ad': 'Harun MERTOĞLU', 'il': 'Rize', 'parti': '', 'gorev': ''},
+    ]
+
+
+def test_normalize_name_and_cache_stats():
+    normalize_name.cache_clear()
+    assert normalize_name('Harun  Mertoğlu') == normalize_name('HARUN MERTOĞLU') == 'HARUN MERTOĞLU'
+    info = normalize_name.cache_info()
+    assert (info.hits, info.misses) == (0, 2)
+    normalize_name('HARUN MERTOĞLU')
+    assert normalize_name.cache_info().hits == 1
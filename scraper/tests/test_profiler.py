@@ -0,0 +1,30 @@
+import os
+
+import profiler
+
+
+class Code:
+    def __init__(self, path):
+        self.co_filename = path
+
+
+def _codes(*paths):
+    return [Code(os.sep.join(p.split('/'))) for p in paths]
+
+
+def test_wait_kind_prefers_selenium_over_urllib3():
+    wait_kind = profiler.SamplingProfiler._wait_kind
+    site = '/usr/lib/python3/site-packages'
+    assert wait_kind(_codes('/app/cli.py', f'{site}/selenium/webdriver/remote/webdriver.py',
+                            f'{site}/urllib3/connectionpool.py')) == profiler.BROWSER_WAIT
+    assert wait_kind(_codes('/app/cli.py', f'{site}/requests/sessions.py',
+                            f'{site}/urllib3/connectionpool.py')) == profiler.HTTP_WAIT
+    assert wait_kind(_codes('/app/cli.py', '/usr/lib/python3/time.py')) == profiler.OTHER_WAIT
+
+
+def test_stage_is_a_no_op_without_profiler():
+    @profiler.stage('parse')
+    def work():
+        return profiler._stages[-1]
+
+    assert work() == 'main'
@@ -0,0 +1,61 @@
+import json
+import os
+
+import pytest
+
+import blob_store
+from records import SorguRecord, Proposal, dump_records, dump_index, index_path, load_records
+
+DURUM = ('Rize  Milletvekili Harun MERTOĞLU ve 120 MilletvekiliYabancı Dijital Konaklama Platformları Kanunu '
+         'TeklifiTeklif ile; turizm payı düzenlenmektedir.Son Durumu : KOMİSYONDAMetniDiğer Bilgiler')
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = blob_store.BlobStore(str(tmp_path / 'blobs.db'))
+    monkeypatch.setattr(blob_store, '_store', store)
+    return store
+
+
+def test_durum_is_offloaded_and_read_lazily(store):
+    record = SorguRecord.from_dict({'esas_no': '2/3803', 'durum': DURUM})
+    record.offload()
+    assert record._durum is None
+    assert record.durum == DURUM
+    assert record.son_durum == 'KOMİSYONDA'
+    assert record.to_dict() == {'esas_no': '2/3803', 'durum': DURUM}
+
+    indexed = record.to_dict(refs=True)
+    assert indexed == {'esas_no': '2/3803', 'durum_ref': record.durum_ref}
+    assert SorguRecord.from_dict(indexed).durum == DURUM
+
+
+def test_save_writes_inline_text_and_refs_without_decompressing(store, tmp_path):
+    filename = str(tmp_path / 'sorgu.json')
+    records = [SorguRecord.from_dict({'esas_no': f'2/{n}', 'durum': DURUM}) for n in range(3)]
+    dump_records(records, filename)
+    dump_index(records, index_path(filename))
+
+    with open(filename, encoding='utf-8') as f:
+        assert [r['durum'] for r in json.load(f)] == [DURUM] * 3
+    with open(index_path(filename), encoding='utf-8') as f:
+        assert 'durum' not in f.read().replace('durum_ref', '')
+    # Aynı metin bir kez saklanır ve kayıt için hiç açılmaz
+    assert (store.stats['put'], store.stats['dedup'], store.stats['get']) == (3, 2, 0)
+    assert [r.durum for r in load_records(index_path(filename))] == [DURUM] * 3
+
+
+def test_proposal_index_uses_metin_ref(store, tmp_path):
+    proposals = [Proposal(baslik='b', link='l', metin='Teklif metni ' * 50, esas_no='2/1')]
+    dump_records(proposals, str(tmp_path / 'proposals.json'))
+    dump_index(proposals, str(tmp_path / 'proposals.index.json'))
+    [loaded] = load_records(str(tmp_path / 'proposals.index.json'), Proposal)
+    assert loaded.metin_ref and loaded.metin == 'Teklif metni ' * 50
+    assert store.stats['get'] == 1
+
+
+def test_blob_db_is_anchored_to_module_dir():
+    if 'BLOB_DB' in os.environ:
+        pytest.skip('BLOB_DB ortam değişkeniyle verilmiş')
+    scraper_dir = os.path.dirname(os.path.abspath(blob_store.__file__))
+    assert blob_store.BLOB_DB == os.path.join(scraper_dir, 'data', 'blobs.db')
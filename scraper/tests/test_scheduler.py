@@ -0,0 +1,57 @@
+import time
+
+import scheduler
+from scheduler import Scheduler, RateBudget, POLL_INTERVALS
+
+
+def _scheduler(tmp_path, poll_fn=lambda target: []):
+    return Scheduler(poll_fn, RateBudget(3600), state_file=str(tmp_path / 'state.json'))
+
+
+def test_rediscovered_unpolled_target_keeps_its_due(tmp_path):
+    sched = _scheduler(tmp_path)
+    sched.schedule('b1', None, '', '', {'baslik': 'b1'})
+    due = sched.targets['b1'].due
+    assert due <= time.time()
+
+    # Liste her yoklamada henüz çekilmemiş teklifi tekrar bildirir
+    sched.schedule('b1', None, '', '', {'baslik': 'b1'})
+    target = sched.targets['b1']
+    assert (target.due, target.polls) == (due, 0)
+    assert sched._pop_due() is target
+
+
+def test_class_change_only_moves_due_earlier(tmp_path):
+    sched = _scheduler(tmp_path)
+    sched.schedule('b1', 'diger', due=time.time() + POLL_INTERVALS['diger'])
+    sched.schedule('b1', None, 'KOMİSYONDA')
+    target = sched.targets['b1']
+    assert target.sinif == 'aktif'
+    assert target.due <= time.time() + POLL_INTERVALS['aktif']
+
+    # Daha seyrek bir sınıfa geçmek sırayı ertelemez
+    due = target.due
+    sched.schedule('b1', 'diger')
+    assert target.due == due
+
+
+def test_polled_target_is_rescheduled_by_class(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler, 'STATS_FILE', str(tmp_path / 'stats.json'))
+    sched = _scheduler(tmp_path, lambda target: [(target.key, None, 'KOMİSYONDA', '', {})])
+    sched.schedule('b1')
+    assert sched.poll_once()
+
+    target = sched.targets['b1']
+    assert (target.sinif, target.polls) == ('aktif', 1)
+    assert target.due == target.last_polled + POLL_INTERVALS['aktif']
+    assert not sched.poll_once()
+
+
+def test_final_target_is_dropped_from_queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler, 'STATS_FILE', str(tmp_path / 'stats.json'))
+    monkeypatch.setitem(POLL_INTERVALS, 'sonuclandi', None)
+    sched = _scheduler(tmp_path, lambda target: [(target.key, None, 'KANUNLAŞTI', '', {})])
+    sched.schedule('b1')
+    assert sched.poll_once()
+    assert sched.targets['b1'].due == 0.0
+    assert sched._pop_due() is None
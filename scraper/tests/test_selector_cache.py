@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+import selector_cache
+
+CANDIDATES = ['table.sonucTablo', 'table.listeTablo', 'table']
+SUBMIT = [('id', 'btnSorgula'), ('xpath', "//input[@type='submit']")]
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / 'selector_cache.json'
+    monkeypatch.setattr(selector_cache, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(selector_cache, 'CACHE_FILE', str(path))
+    monkeypatch.setattr(selector_cache, '_cache', None)
+    monkeypatch.setattr(selector_cache, '_stats', {'lookups': 0, 'hits': 0, 'misses': 0})
+    return path
+
+
+def test_winner_is_promoted_and_saved(cache_file):
+    selector_cache.remember('sorgu_sonuc', 'table', 'table.listeTablo')
+    assert selector_cache.ordered('sorgu_sonuc', 'table', CANDIDATES) == [
+        'table.listeTablo', 'table.sonucTablo', 'table']
+    assert json.loads(cache_file.read_text()) == {'sorgu_sonuc': {'table': 'table.listeTablo'}}
+
+    selector_cache.remember('sorgu_sonuc', 'table', 'table.listeTablo')
+    assert selector_cache._stats == {'lookups': 2, 'hits': 1, 'misses': 1}
+
+
+def test_catch_all_is_never_promoted(cache_file):
+    selector_cache.remember('sorgu_sonuc', 'table', 'table.listeTablo')
+    # Genel 'table' kazanınca eski kazanan unutulur ama 'table' öne geçmez
+    selector_cache.remember('sorgu_sonuc', 'table', 'table')
+    assert selector_cache.ordered('sorgu_sonuc', 'table', CANDIDATES) == CANDIDATES
+    assert json.loads(cache_file.read_text()) == {'sorgu_sonuc': {}}
+
+    selector_cache.remember('sorgu_form', 'submit_button', SUBMIT[1])
+    assert selector_cache.ordered('sorgu_form', 'submit_button', SUBMIT) == SUBMIT
+
+
+def test_catch_all_in_old_cache_file_is_ignored(cache_file):
+    cache_file.write_text(json.dumps({'sorgu_sonuc': {'table': 'table'}}))
+    assert selector_cache.ordered('sorgu_sonuc', 'table', CANDIDATES) == CANDIDATES
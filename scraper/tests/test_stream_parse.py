@@ -0,0 +1,47 @@
+import os
+
+from bs4 import BeautifulSoup
+
+import kanun_teklifleri_scraper as kts
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'nested_table.html')
+
+
+def _html():
+    with open(FIXTURE, encoding='utf-8') as f:
+        return f.read()
+
+
+def _records(rows):
+    return [r.to_dict() | {'cekme_tarihi': ''} for r in kts.iter_parsed_rows(rows)]
+
+
+def _soup_records(html):
+    table = BeautifulSoup(html, 'lxml').find('table')
+    return _records(kts.soup_row_cells(row) for row in kts.soup_table_rows(table))
+
+
+def test_nested_table_rows_are_not_records():
+    records = _soup_records(_html())
+    assert [r['esas_no'] for r in records] == ['2/101', '2/102']
+    # İç tablonun metni dış hücrenin metnine dahildir
+    assert 'Ali VELİ' in records[0]['durum']
+
+
+def test_stream_matches_soup_with_nested_table():
+    html = _html()
+    expected = _soup_records(html)
+    for size in (1, 7, 64, len(html)):
+        chunks = [html[i:i + size] for i in range(0, len(html), size)]
+        assert _records(kts.iter_table_rows(chunks)) == expected
+
+
+def test_stream_skips_script_and_style_text_like_soup():
+    html = ('<table><tr><th>Sıra</th><th>Esas No</th><th>Tarih</th><th>Teklif</th></tr>'
+            '<tr><td>28/4</td><td>2/101</td><td>10/08/2026</td><td>Rize Milletvekili'
+            '<script>var x = "KANUNLAŞTI";</script><style>.c { color: red }</style><!-- not -->'
+            '<a href="/Yasama/KanunTeklifi/1">Metni<script>track()</script></a> Son Durumu : KOMİSYONDA</td></tr>'
+            '</table>')
+    expected = _soup_records(html)
+    assert 'x =' not in expected[0]['durum'] and 'color' not in expected[0]['durum']
+    assert _records(kts.iter_table_rows([html])) == expected
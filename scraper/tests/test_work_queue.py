@@ -0,0 +1,68 @@
+import time
+import sqlite3
+
+from work_queue import WorkQueue
+
+
+def test_keep_alive_prevents_second_lease(tmp_path):
+    path = str(tmp_path / 'queue.db')
+    queue = WorkQueue(path, visibility_timeout=1)
+    queue.enqueue('pdf', 'a', {'url': 'a'})
+    unit = queue.lease('w1')
+
+    other = []
+    with queue.keep_alive(unit['id'], 'w1'):
+        # İş lease süresinden uzun sürer; ikinci worker aynı birimi almamalı
+        for _ in range(6):
+            time.sleep(0.5)
+            other.append(WorkQueue(path, visibility_timeout=1).lease('w2'))
+
+    assert other == [None] * 6
+    assert queue.complete(unit['id'], 'w1')
+    assert queue.stats() == {'done': 1, 'results': 0}
+
+
+def test_expired_lease_without_keep_alive_is_reclaimed(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'), visibility_timeout=1)
+    queue.enqueue('pdf', 'a', {'url': 'a'})
+    queue.lease('w1')
+    time.sleep(1.1)
+    assert queue.lease('w2') is not None
+
+
+def test_release_budget_returns_tokens(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'))
+    # Kapasite 36/10 = 3.6 token
+    assert queue.acquire_budget(36, cost=3) == 0
+    assert queue.acquire_budget(36) > 0
+    queue.release_budget(1)
+    assert queue.acquire_budget(36) == 0
+
+
+def test_results_of_different_kinds_do_not_collide(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'))
+    queue.enqueue('sorgu', 'tumu', {})
+    queue.enqueue('detay', '2/3803', {})
+    sorgu, detay = queue.lease('w1', ['sorgu']), queue.lease('w1', ['detay'])
+    queue.complete(sorgu['id'], 'w1', [('2/3803', 'sorgu', {'esas_no': '2/3803', 'durum': 'KOMİSYONDA'})])
+    queue.complete(detay['id'], 'w1', [('2/3803', 'detay', {'esas_no': '2/3803', 'metin': '...'})])
+
+    assert list(queue.iter_results('sorgu')) == [{'esas_no': '2/3803', 'durum': 'KOMİSYONDA'}]
+    assert list(queue.iter_results('detay')) == [{'esas_no': '2/3803', 'metin': '...'}]
+
+
+def test_old_results_table_is_migrated(tmp_path):
+    path = str(tmp_path / 'queue.db')
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE results (key TEXT PRIMARY KEY, kind TEXT NOT NULL, data TEXT NOT NULL, '
+                 'updated REAL NOT NULL)')
+    conn.execute("INSERT INTO results VALUES ('2/3803', 'sorgu', '{\"esas_no\": \"2/3803\"}', 0)")
+    conn.commit()
+    conn.close()
+
+    queue = WorkQueue(path)
+    assert list(queue.iter_results('sorgu')) == [{'esas_no': '2/3803'}]
+    queue.enqueue('detay', '2/3803', {})
+    unit = queue.lease('w1')
+    queue.complete(unit['id'], 'w1', [('2/3803', 'detay', {'esas_no': '2/3803'})])
+    assert queue.stats()['results'] == 2
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TBMM Dağıtık İş Kuyruğu
+Birden fazla makinede çalışan worker'ların ortak bir SQLite veritabanından
+(paylaşılan disk üzerinde) lease ile iş birimi alıp işlediği koordinatör/worker
+modu. İş birimleri: sorgu parçaları, teklif listesi, detay sayfaları ve PDF'ler.
+
+- Her iş birimi bir worker'a süreli (visibility timeout) olarak kiralanır;
+  iş sürdükçe lease arka plandaki bir thread'den uzatılır
+- Süresi dolan lease'ler geri alınır, deneme sayısı aşılınca iş "failed" olur
+- Sonuçlar tür ve esas_no'ya (yoksa link'e) göre idempotent birleştirilir;
+  aynı teklifin sorgu ve detay sonuçları ayrı tutulur
+- Tüm worker'lar veritabanındaki tek bir saatlik istek bütçesini paylaşır;
+  çok sayfalı işler her sayfa için ayrıca bütçe harcar
+
+Koordinasyon tamamen SQLite dosya kilitlerine dayanır. Paylaşılan disk bu
+kilitleri güvenilir şekilde sağlamalıdır (yerel disk veya kilitlemesi doğru
+çalışan bir dosya sistemi); NFS/SMB gibi ağ dosya sistemlerinde kilitler
+güvenilir olmadığından iki worker aynı işi alabilir ve veritabanı bozulabilir.
+Ağ dosya sistemi üzerindeki bir kuyruk açılırken uyarı loglanır.
+
+Kullanım:
+    python work_queue.py coordinator --db /paylasilan/kuyruk.db --mode sorgu
+    python work_queue.py worker --db /paylasilan/kuyruk.db
+    python work_queue.py stats --db /paylasilan/kuyruk.db
+    python work_queue.py export --db /paylasilan/kuyruk.db --kind sorgu --output data/kanun_teklifleri_sorgu.json
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import sqlite3
+import logging
+import argparse
+import threading
+from contextlib import contextmanager
+from typing import Callable, List, Dict, Optional, Iterable, Tuple
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='[%(asctime)s] %(levelname)s: %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Sabitler
+DATA_DIR = "data"
+DB_FILE = os.getenv('QUEUE_DB', f"{DATA_DIR}/work_queue.db")
+VISIBILITY_TIMEOUT = int(os.getenv('VISIBILITY_TIMEOUT', '600'))
+MAX_ATTEMPTS = int(os.getenv('MAX_ATTEMPTS', '3'))
+REQUESTS_PER_HOUR = int(os.getenv('REQUESTS_PER_HOUR', '120'))
+IDLE_SLEEP = 10
+PDF_DIR = f"{DATA_DIR}/pdf"
+# SQLite kilitlemesinin güvenilir olmadığı dosya sistemleri
+NETWORK_FILESYSTEMS = ('nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'sshfs', 'fuse.sshfs', '9p')
+
+RESULTS_TABLE = """
+CREATE TABLE IF NOT EXISTS results (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+)"""
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS units (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS units_state ON units (state, lease_expires);
+{RESULTS_TABLE};
+CREATE TABLE IF NOT EXISTS budget (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+
+def filesystem_type(path: str) -> Optional[str]:
+    """Yolun bulunduğu dosya sisteminin türü (/proc/mounts okunamazsa None)"""
+    path = os.path.realpath(path)
+    best, fstype = '', None
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1].replace('\\040', ' ')
+                if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) \
+                        and len(mount_point) > len(best):
+                    best, fstype = mount_point, fields[2]
+    except OSError:
+        return None
+    return fstype
+
+
+class WorkQueue:
+    """SQLite üzerinde lease tabanlı iş kuyruğu"""
+
+    def __init__(self, path: str = DB_FILE, visibility_timeout: int = VISIBILITY_TIMEOUT,
+                 max_attempts: int = MAX_ATTEMPTS):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        # isolation_level=None: transaction'ları BEGIN IMMEDIATE ile kendimiz yönetiriz
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self._migrate_results()
+        self.conn.executescript(SCHEMA)
+
+        fstype = filesystem_type(os.path.dirname(os.path.abspath(path)))
+        if fstype in NETWORK_FILESYSTEMS:
+            logger.warning(f"⚠️ Kuyruk veritabanı ağ dosya sisteminde ({fstype}): {path} - SQLite kilitleri "
+                           f"burada güvenilir değil, iki worker aynı işi alabilir")
+
+    def _migrate_results(self):
+        """Eski şemadaki (sadece key birincil anahtarlı) results tablosunu (kind, key) anahtarına taşır"""
+        pk = [row['name'] for row in self.conn.execute('PRAGMA table_info(results)') if row['pk']]
+        if pk != ['key']:
+            return
+        with self._transaction() as conn:
+            conn.execute('ALTER TABLE results RENAME TO results_old')
+            conn.execute(RESULTS_TABLE)
+            conn.execute('INSERT INTO results (kind, key, data, updated) '
+                         'SELECT kind, key, data, updated FROM results_old')
+            conn.execute('DROP TABLE results_old')
+        logger.info("🔧 results tablosu (tür, anahtar) birincil anahtarına taşındı")
+
+    @contextmanager
+    def _transaction(self):
+        """Yazma kilidini baştan alan transaction (worker'lar arası yarışı önler)"""
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield self.conn
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+
+    def enqueue(self, kind: str, key: str, payload: Dict) -> bool:
+        """İş birimi ekler; aynı birim zaten varsa eklemez"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO units (id, kind, payload, updated) VALUES (?, ?, ?, ?)',
+                (f'{kind}:{key}', kind, json.dumps(payload, ensure_ascii=False), time.time())
+            )
+        return cursor.rowcount > 0
+
+    def lease(self, worker_id: str, kinds: Optional[List[str]] = None) -> Optional[sqlite3.Row]:
+        """Sıradaki iş birimini worker'a kiralar; süresi dolmuş lease'leri geri alır"""
+        now = time.time()
+        with self._transaction() as conn:
+            # Çöken worker'ların lease'lerini geri al
+            conn.execute(
+                "UPDATE units SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_owner = NULL, error = 'lease süresi doldu', updated = ? "
+                "WHERE state = 'leased' AND lease_expires < ?",
+                (self.max_attempts, now, now)
+            )
+
+            query = "SELECT * FROM units WHERE state = 'pending'"
+            params: List = []
+            if kinds:
+                query += f" AND kind IN ({','.join('?' * len(kinds))})"
+                params.extend(kinds)
+            row = conn.execute(query + ' ORDER BY attempts, updated LIMIT 1', params).fetchone()
+            if row is None:
+                return None
+
+            conn.execute(
+                "UPDATE units SET state = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated = ? WHERE id = ?",
+                (worker_id, now + self.visibility_timeout, now, row['id'])
+            )
+        return row
+
+    def heartbeat(self, unit_id: str, worker_id: str) -> bool:
+        """Uzun süren işlerde lease süresini uzatır; lease kaybedildiyse False döner"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE units SET lease_expires = ? WHERE id = ? AND lease_owner = ? AND state = 'leased'",
+                (time.time() + self.visibility_timeout, unit_id, worker_id)
+            )
+        return cursor.rowcount > 0
+
+    @contextmanager
+    def keep_alive(self, unit_id: str, worker_id: str):
+        """Blok sürdükçe lease'i arka plandaki bir thread'den düzenli olarak uzatır"""
+        stop = threading.Event()
+
+        def run():
+            # sqlite3 bağlantıları thread'ler arasında paylaşılamaz
+            queue = WorkQueue(self.path, self.visibility_timeout, self.max_attempts)
+            try:
+                while not stop.wait(self.visibility_timeout / 3):
+                    if not queue.heartbeat(unit_id, worker_id):
+                        logger.warning(f"⚠️ Lease uzatılamadı: {unit_id}")
+                        return
+            finally:
+                queue.conn.close()
+
+        thread = threading.Thread(target=run, name=f'heartbeat-{unit_id}', daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def complete(self, unit_id: str, worker_id: str, results: Iterable[Tuple[str, str, Dict]] = (),
+                 follow_ups: Iterable[Tuple[str, str, Dict]] = ()) -> bool:
+        """
+        İş birimini tamamlar, sonuçları ve yeni iş birimlerini aynı transaction'da yazar
+
+        Args:
+            results: (anahtar, tür, kayıt) - anahtar esas_no veya link; aynı tür ve anahtar üzerine yazılır
+            follow_ups: (tür, anahtar, payload) - örn: listeden çıkan detay sayfaları
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE units SET state = 'done', lease_owner = NULL, error = NULL, updated = ? "
+                "WHERE id = ? AND lease_owner = ? AND state = 'leased'",
+                (now, unit_id, worker_id)
+            )
+            if cursor.rowcount == 0:
+                # Lease başka bir worker'a geçmiş; sonuçlar yine de idempotent olduğu için yazılabilir
+                logger.warning(f"⚠️ Lease kaybedilmiş: {unit_id}")
+            conn.executemany(
+                'INSERT INTO results (key, kind, data, updated) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(kind, key) DO UPDATE SET data = excluded.data, updated = excluded.updated',
+                [(key, kind, json.dumps(data, ensure_ascii=False), now) for key, kind, data in results]
+            )
+            conn.executemany(
+                'INSERT OR IGNORE INTO units (id, kind, payload, updated) VALUES (?, ?, ?, ?)',
+                [(f'{kind}:{key}', kind, json.dumps(payload, ensure_ascii=False), now)
+                 for kind, key, payload in follow_ups]
+            )
+        return cursor.rowcount > 0
+
+    def fail(self, unit_id: str, worker_id: str, error: str):
+        """İş birimini başarısız sayar; deneme hakkı varsa tekrar kuyruğa döner"""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE units SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_owner = NULL, error = ?, updated = ? WHERE id = ? AND lease_owner = ?",
+                (self.max_attempts, error[:500], time.time(), unit_id, worker_id)
+            )
+
+    def acquire_budget(self, requests_per_hour: int = REQUESTS_PER_HOUR, cost: float = 1.0) -> float:
+        """
+        Paylaşılan saatlik istek bütçesinden pay almaya çalışır
+
+        Returns:
+            0 ise izin verildi, değilse beklenmesi gereken süre (saniye)
+        """
+        rate = requests_per_hour / 3600
+        capacity = max(1.0, requests_per_hour / 10)
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT tokens, updated FROM budget WHERE name = 'global'").fetchone()
+            tokens = capacity if row is None else min(capacity, row['tokens'] + (now - row['updated']) * rate)
+            wait = 0.0 if tokens >= cost else (cost - tokens) / rate
+            if not wait:
+                tokens -= cost
+            conn.execute(
+                "INSERT INTO budget (name, tokens, updated) VALUES ('global', ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (tokens, now)
+            )
+        return wait
+
+    def wait_for_budget(self, requests_per_hour: int = REQUESTS_PER_HOUR, cost: float = 1.0):
+        """Bütçede yer açılana kadar bekler"""
+        while True:
+            wait = self.acquire_budget(requests_per_hour, cost)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def release_budget(self, cost: float = 1.0):
+        """Alınıp kullanılmayan bütçeyi geri verir (kapasite sınırı sonraki acquire'da uygulanır)"""
+        with self._transaction() as conn:
+            conn.execute("UPDATE budget SET tokens = tokens + ? WHERE name = 'global'", (cost,))
+
+    def stats(self) -> Dict[str, int]:
+        """Durumlara göre iş birimi sayıları ve sonuç sayısı"""
+        counts = {row['state']: row['n'] for row in
+                  self.conn.execute('SELECT state, COUNT(*) AS n FROM units GROUP BY state')}
+        counts['results'] = self.conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        return counts
+
+    def iter_results(self, kind: Optional[str] = None) -> Iterable[Dict]:
+        """Birleştirilmiş sonuçları anahtar sırasıyla üretir"""
+        query, params = 'SELECT data FROM results', ()
+        if kind:
+            query, params = query + ' WHERE kind = ?', (kind,)
+        for row in self.conn.execute(query + ' ORDER BY key', params):
+            yield json.loads(row['data'])
+
+
+def _record_key(record: Dict) -> str:
+    return record.get('esas_no') or record.get('esasNo') or record['link']
+
+
+def handle_unit(kind: str, payload: Dict, before_page: Optional[Callable[[], None]] = None) -> Tuple[List, List]:
+    """
+    Bir iş birimini işler
+
+    Args:
+        before_page: Çok sayfalı işlerde ilk sayfadan sonraki her sayfa çekilmeden önce
+            çağrılır (örn: sayfa başına bütçe harcamak için)
+
+    Returns:
+        (sonuçlar, yeni iş birimleri)
+    """
+    if kind == 'sorgu':
+        import kanun_teklifleri_scraper as kts
+        records = [r.to_dict() for r in kts.run_query(arama_kelime=payload.get('arama_kelime', ''),
+                                                      donem=payload.get('donem', 'Son Dönem'),
+                                                      durum=payload.get('durum', ''),
+                                                      max_results=payload.get('max_results', 20),
+                                                      before_page=before_page)]
+        # Sorgu sonuçlarındaki PDF metinleri ayrı iş birimleri olarak indirilir
+        pdfs = [('pdf', r['link'], {'url': r['link']}) for r in records if r.get('link', '').endswith('.pdf')]
+        return [(_record_key(r), kind, r) for r in records], pdfs if payload.get('pdf') else []
+
+    if kind == 'liste':
+        import tbmm_scraper as ts
+        proposals = ts.scrape_proposal_list()
+        return [], [('detay', p.link, {'baslik': p.baslik, 'link': p.link}) for p in proposals]
+
+    if kind == 'detay':
+        import tbmm_scraper as ts
+        from records import Proposal
+        proposal = ts.scrape_proposal_detail(Proposal(baslik=payload['baslik'], link=payload['link']))
+        if not proposal.metin:
+            raise RuntimeError('detay sayfasında içerik yok')
+        data = proposal.to_dict()
+        key = data['esasNo'] if data.get('esasNo') not in ('', 'UNKNOWN') else data['link']
+        return [(key, kind, data)], []
+
+    if kind == 'pdf':
+        import hashlib
+        import requests
+        response = requests.get(payload['url'], timeout=60)
+        response.raise_for_status()
+        os.makedirs(PDF_DIR, exist_ok=True)
+        path = os.path.join(PDF_DIR, hashlib.sha1(payload['url'].encode('utf-8')).hexdigest() + '.pdf')
+        with open(path, 'wb') as f:
+            f.write(response.content)
+        return [(payload['url'], kind, {'link': payload['url'], 'dosya': path})], []
+
+    raise ValueError(f'Bilinmeyen iş birimi türü: {kind}')
+
+
+def run_worker(queue: WorkQueue, worker_id: str, kinds: Optional[List[str]] = None,
+               requests_per_hour: int = REQUESTS_PER_HOUR, exit_when_empty: bool = False):
+    """Kuyruktan iş alıp işleyen worker döngüsü"""
+    logger.info(f"👷 Worker başlatıldı: {worker_id}")
+    try:
+        while True:
+            # Bütçe lease'ten önce alınır; bütçe beklenirken lease tutulmaz
+            queue.wait_for_budget(requests_per_hour)
+            unit = queue.lease(worker_id, kinds)
+            if unit is None:
+                queue.release_budget()
+                if exit_when_empty:
+                    logger.info("✅ Kuyrukta iş kalmadı")
+                    break
+                time.sleep(IDLE_SLEEP)
+                continue
+
+            logger.info(f"📦 İşleniyor: {unit['id']} (deneme {unit['attempts'] + 1})")
+            try:
+                # İlk sayfanın bütçesi yukarıda alındı, sonraki her sayfa ayrıca harcar
+                with queue.keep_alive(unit['id'], worker_id):
+                    results, follow_ups = handle_unit(unit['kind'], json.loads(unit['payload']),
+                                                      lambda: queue.wait_for_budget(requests_per_hour))
+                queue.complete(unit['id'], worker_id, results, follow_ups)
+                logger.info(f"✅ Tamamlandı: {unit['id']} ({len(results)} sonuç, {len(follow_ups)} yeni iş)")
+            except Exception as e:
+                logger.warning(f"⚠️ İş başarısız: {unit['id']}: {e}")
+                queue.fail(unit['id'], worker_id, str(e))
+    finally:
+        for module in ('kanun_teklifleri_scraper', 'tbmm_scraper'):
+            if module in sys.modules:
+                sys.modules[module].close_driver()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=['coordinator', 'worker', 'stats', 'export'])
+    parser.add_argument('--db', default=DB_FILE)
+    parser.add_argument('--mode', choices=['sorgu', 'teklif'], default='sorgu', help='coordinator: eklenecek işler')
+    parser.add_argument('--durum', action='append', help='coordinator: sorgu parçaları (tekrarlanabilir)')
+    parser.add_argument('--max-results', type=int, default=20)
+    parser.add_argument('--pdf', action='store_true', help='coordinator: PDF metinlerini de indir')
+    parser.add_argument('--kind', action='append', help='worker/export: sadece bu türler')
+    parser.add_argument('--worker-id', default=f"{socket.gethostname()}-{os.getpid()}")
+    parser.add_argument('--requests-per-hour', type=int, default=REQUESTS_PER_HOUR)
+    parser.add_argument('--exit-when-empty', action='store_true')
+    parser.add_argument('--output', default=f"{DATA_DIR}/kanun_teklifleri_sorgu.json")
+    args = parser.parse_args()
+
+    queue = WorkQueue(args.db)
+
+    if args.command == 'coordinator':
+        if args.mode == 'sorgu':
+            for durum in args.durum or ['']:
+                queue.enqueue('sorgu', durum or 'tumu',
+                              {'durum': durum, 'max_results': args.max_results, 'pdf': args.pdf})
+        else:
+            queue.enqueue('liste', 'tumu', {})
+        logger.info(f"📋 Kuyruk: {queue.stats()}")
+    elif args.command == 'worker':
+        run_worker(queue, args.worker_id, args.kind, args.requests_per_hour, args.exit_when_empty)
+    elif args.command == 'stats':
+        logger.info(f"📋 Kuyruk: {queue.stats()}")
+    elif args.command == 'export':
+        from records import dump_records
+        kind = args.kind[0] if args.kind else 'sorgu'
+        count = dump_records(queue.iter_results(kind), args.output)
+        logger.info(f"💾 Veriler kaydedildi: {args.output} ({count} kayıt)")
+
+
+if __name__ == "__main__":
+    main()